@@ -22,13 +22,14 @@ def list_dossiers(
     status: str = Query("completed", description="Queue status to filter (use 'all' for every entry)."),
     limit: int = Query(20, ge=1, le=200, description="Maximum number of dossier rows to return."),
     include_manifest: bool = Query(False, description="Include the full dossier manifest payload when true."),
+    include_payload: bool = Query(True, description="Include each queued plan's payload; false returns metadata only."),
 ) -> Dict[str, Any]:
     """Return dossier queue entries along with manifest + signature metadata."""
 
     normalized_status = status.strip().lower()
     status_filter = None if not normalized_status or normalized_status == "all" else normalized_status
     store = build_dossier_queue_store()
-    entries = store.list_plans(status=status_filter, limit=limit)
+    entries = store.list_plans(status=status_filter, limit=limit, include_payload=include_payload)
     records: List[Dict[str, Any]] = []
     for entry in entries:
         plan_id = entry.get("plan_id")
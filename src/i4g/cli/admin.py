@@ -345,15 +345,6 @@ def bulk_update_saved_search_tags(args: argparse.Namespace) -> None:
 
 
 def build_dossiers(args: argparse.Namespace) -> None:
-    provider = build_bundle_candidate_provider()
-    candidates = provider.list_candidates(limit=args.limit)
-    if not candidates:
-        console.print(
-            f"[yellow]No accepted cases found for bundling (limit={args.limit}). "
-            "Review queue state before rerunning."
-        )
-        return
-
     min_loss_value = (
         Decimal(str(args.min_loss)) if args.min_loss is not None else Decimal(str(SETTINGS.report.min_loss_usd))
     )
@@ -365,6 +356,15 @@ def build_dossiers(args: argparse.Namespace) -> None:
         require_cross_border=args.cross_border_only or SETTINGS.report.require_cross_border,
     )
 
+    provider = build_bundle_candidate_provider()
+    candidates = provider.list_candidates(limit=args.limit, criteria=criteria)
+    if not candidates:
+        console.print(
+            f"[yellow]No accepted cases found for bundling (limit={args.limit}). "
+            "Review queue state before rerunning."
+        )
+        return
+
     builder = build_bundle_builder()
     if args.dry_run:
         plans = builder.generate_plans(candidates=candidates, criteria=criteria)
@@ -0,0 +1,61 @@
+"""JSON encoding helpers shared by reports, stores, scripts, and the dashboard.
+
+``dumps``/``loads`` use ``orjson`` when the optional ``speedups`` extra is installed and fall back to the stdlib
+otherwise. The fallback is configured to match orjson's layout (raw UTF-8, orjson's separators), but the two encoders
+still format some floats differently (``1e-05`` vs ``0.00001``). Anything that is hashed or signed must therefore go
+through ``dumps_stable``, which always uses the stdlib so the bytes do not depend on which extras are installed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    payload: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    non_str_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Return ``payload`` as UTF-8 JSON bytes, compact unless ``indent`` requests two-space indentation."""
+
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if non_str_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(payload, default=default, option=option)
+    text = json.dumps(
+        payload,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+    )
+    return text.encode("utf-8")
+
+
+def dumps_stable(payload: Any) -> bytes:
+    """Return ``payload`` as indented stdlib JSON bytes for signed or hashed artifacts."""
+
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    """Decode a JSON document from bytes or text."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
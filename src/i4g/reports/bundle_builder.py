@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Iterable, List, Literal, Optional, Sequence
+from functools import lru_cache
+from typing import Iterable, List, Literal, Optional, Sequence, Tuple
 
 from i4g.store.dossier_queue_store import DossierQueueStore
 
 JurisdictionMode = Literal["single", "multi", "global"]
 
 
-@dataclass(frozen=True)
+def _isoformat(value: datetime) -> str:
+    """Return ``value.isoformat()``, memoized for the repeated timestamps in daily batches."""
+
+    # Aware datetimes for the same instant compare equal across time zones, so the
+    # UTC offset is part of the cache key to keep each rendering distinct.
+    return _cached_isoformat(value, value.utcoffset())
+
+
+@lru_cache(maxsize=4096)
+def _cached_isoformat(value: datetime, _offset: Optional[timedelta]) -> str:
+    return value.isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class DossierCandidate:
     """Represents a single accepted case that may be bundled into a dossier."""
 
@@ -21,7 +36,12 @@ class DossierCandidate:
     accepted_at: datetime
     jurisdiction: str
     cross_border: bool = False
-    primary_entities: Sequence[str] = field(default_factory=list)
+    primary_entities: Sequence[str] = field(default_factory=tuple)
+
+    def __post_init__(self) -> None:
+        # Entity strings repeat heavily across a bundle; interning lets the Counter
+        # and adjacency lookups in analysis/tools short-circuit on identity.
+        object.__setattr__(self, "primary_entities", tuple(sys.intern(str(entity)) for entity in self.primary_entities))
 
     def is_recent(self, *, recency_days: int, reference_time: datetime) -> bool:
         """Return True when the candidate was accepted within the rolling window."""
@@ -40,8 +60,12 @@ class BundleCriteria:
     jurisdiction_mode: JurisdictionMode = "single"
     require_cross_border: bool = False
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.min_loss_usd, Decimal):
+            object.__setattr__(self, "min_loss_usd", Decimal(str(self.min_loss_usd)))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DossierPlan:
     """Serializable dossier blueprint queued for downstream agent execution."""
 
@@ -49,18 +73,22 @@ class DossierPlan:
     jurisdiction_key: str
     created_at: datetime
     total_loss_usd: Decimal
-    cases: List[DossierCandidate]
+    cases: Tuple[DossierCandidate, ...]
     bundle_reason: str
     cross_border: bool
     shared_drive_parent_id: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.cases, tuple):
+            object.__setattr__(self, "cases", tuple(self.cases))
+
     def to_dict(self) -> dict:
         """Return a JSON-serializable representation of the plan."""
 
         return {
             "plan_id": self.plan_id,
             "jurisdiction_key": self.jurisdiction_key,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _isoformat(self.created_at),
             "total_loss_usd": str(self.total_loss_usd),
             "bundle_reason": self.bundle_reason,
             "cross_border": self.cross_border,
@@ -69,7 +97,7 @@ class DossierPlan:
                 {
                     "case_id": case.case_id,
                     "loss_amount_usd": str(case.loss_amount_usd),
-                    "accepted_at": case.accepted_at.isoformat(),
+                    "accepted_at": _isoformat(case.accepted_at),
                     "jurisdiction": case.jurisdiction,
                     "cross_border": case.cross_border,
                     "primary_entities": list(case.primary_entities),
@@ -82,7 +110,7 @@ class DossierPlan:
     def from_dict(cls, payload: dict) -> "DossierPlan":
         """Instantiate a plan from the serialized payload."""
 
-        cases = [
+        cases = tuple(
             DossierCandidate(
                 case_id=item["case_id"],
                 loss_amount_usd=Decimal(item["loss_amount_usd"]),
@@ -92,7 +120,7 @@ class DossierPlan:
                 primary_entities=tuple(item.get("primary_entities") or []),
             )
             for item in payload.get("cases", [])
-        ]
+        )
         return cls(
             plan_id=payload["plan_id"],
             jurisdiction_key=payload["jurisdiction_key"],
@@ -133,11 +161,7 @@ class BundleBuilder:
         """
 
         plans = self.generate_plans(candidates=candidates, criteria=criteria)
-        enqueued: List[str] = []
-        for plan in plans:
-            self._queue_store.enqueue_plan(plan)
-            enqueued.append(plan.plan_id)
-        return enqueued
+        return self._queue_store.enqueue_plans(plans)
 
     def generate_plans(
         self,
@@ -170,15 +194,18 @@ class BundleBuilder:
         criteria: BundleCriteria,
         reference_time: datetime,
     ) -> List[DossierCandidate]:
-        """Apply loss, recency, and cross-border filters."""
+        """Apply recency, loss, and cross-border filters, cheapest comparison first."""
 
+        cutoff = reference_time - timedelta(days=criteria.recency_days)
+        min_loss = criteria.min_loss_usd
+        require_cross_border = criteria.require_cross_border
         result: List[DossierCandidate] = []
         for candidate in candidates:
-            if candidate.loss_amount_usd < criteria.min_loss_usd:
+            if candidate.accepted_at < cutoff:
                 continue
-            if not candidate.is_recent(recency_days=criteria.recency_days, reference_time=reference_time):
+            if candidate.loss_amount_usd < min_loss:
                 continue
-            if criteria.require_cross_border and not candidate.cross_border:
+            if require_cross_border and not candidate.cross_border:
                 continue
             result.append(candidate)
         return result
@@ -233,7 +260,7 @@ class BundleBuilder:
             jurisdiction_key=bucket_key,
             created_at=reference_time,
             total_loss_usd=total_loss,
-            cases=list(candidates),
+            cases=tuple(candidates),
             bundle_reason=reason,
             cross_border=cross_border,
             shared_drive_parent_id=self._shared_drive_parent_id,
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Iterable, List, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from i4g.reports.bundle_builder import DossierCandidate
+from i4g.reports.bundle_builder import BundleCriteria, DossierCandidate
 from i4g.reports.bundle_metrics import compute_bundle_metrics
 from i4g.store.review_store import ReviewStore
 from i4g.store.structured import StructuredStore
@@ -19,38 +19,63 @@ class BundleCandidateProvider:
         self,
         review_store: ReviewStore | None = None,
         structured_store: StructuredStore | None = None,
+        *,
+        structured_store_factory: Callable[[], StructuredStore] | None = None,
     ) -> None:
         self._review_store = review_store or ReviewStore()
-        self._structured_store = structured_store or StructuredStore()
+        # The structured store is only needed to hydrate rows, so its connection is
+        # opened on first use rather than for every provider.
+        self._structured_store = structured_store
+        self._structured_store_factory = structured_store_factory or StructuredStore
 
-    def list_candidates(self, *, limit: int = 200) -> List[DossierCandidate]:
-        """Return accepted review entries mapped to dossier candidates."""
-
-        metrics_rows = self._list_metrics_rows(limit=limit)
-        if metrics_rows:
+    def list_candidates(
+        self,
+        *,
+        limit: int = 200,
+        criteria: Optional[BundleCriteria] = None,
+        jurisdiction: Optional[str] = None,
+        reference_time: Optional[datetime] = None,
+    ) -> List[DossierCandidate]:
+        """Return accepted review entries mapped to dossier candidates.
+
+        When ``criteria`` is supplied, the loss floor and recency window are pushed
+        down to the review store so rows that can never be bundled are not fetched.
+        An empty metrics result is final; the queue fallback only runs when the
+        metrics view is unavailable, and applies the same filters in Python.
+        """
+
+        filters = _candidate_filters(criteria, jurisdiction=jurisdiction, reference_time=reference_time)
+        metrics_rows = self._list_metrics_rows(limit=limit, filters=filters)
+        if metrics_rows is not None:
             return self._map_metric_rows(metrics_rows)
 
         rows = self._review_store.get_queue(status="accepted", limit=limit)
-        return self._map_queue_rows(rows)
+        return [candidate for candidate in self._map_queue_rows(rows) if _matches_filters(candidate, filters)]
+
+    def _list_metrics_rows(self, *, limit: int, filters: Dict[str, Any]) -> Optional[List[dict]]:
+        """Return metrics view rows, or ``None`` when the store has no usable view."""
 
-    def _list_metrics_rows(self, *, limit: int) -> List[dict]:
         view_fn = getattr(self._review_store, "list_dossier_candidates", None)
         if not callable(view_fn):
-            return []
+            return None
         try:
-            return list(view_fn(status="accepted", limit=limit))
-        except TypeError:
-            return []
+            return list(view_fn(status="accepted", limit=limit, **filters))
         except Exception:
-            return []
+            return None
+
+    def _records_for(self, keyed_rows: Sequence[Tuple[str, dict]]) -> Dict[str, Any]:
+        if not keyed_rows:
+            return {}
+        if self._structured_store is None:
+            self._structured_store = self._structured_store_factory()
+        return self._structured_store.get_by_ids([case_id for case_id, _ in keyed_rows])
 
     def _map_metric_rows(self, rows: Iterable[dict]) -> List[DossierCandidate]:
+        keyed_rows = _keyed_rows(rows)
+        records = self._records_for(keyed_rows)
         candidates: List[DossierCandidate] = []
-        for row in rows:
-            case_id = str(row.get("case_id") or "").strip()
-            if not case_id:
-                continue
-            record = self._structured_store.get_by_id(case_id)
+        for case_id, row in keyed_rows:
+            record = records.get(case_id)
             entities = getattr(record, "entities", None) or {}
             accepted_at = _parse_datetime(row.get("accepted_at"))
             candidates.append(
@@ -66,12 +91,11 @@ class BundleCandidateProvider:
         return candidates
 
     def _map_queue_rows(self, rows: Iterable[dict]) -> List[DossierCandidate]:
+        keyed_rows = _keyed_rows(rows)
+        records = self._records_for(keyed_rows)
         candidates: List[DossierCandidate] = []
-        for row in rows:
-            case_id = str(row.get("case_id") or "").strip()
-            if not case_id:
-                continue
-            record = self._structured_store.get_by_id(case_id)
+        for case_id, row in keyed_rows:
+            record = records.get(case_id)
             entities = getattr(record, "entities", None) or {}
             accepted_at = _parse_datetime(row.get("last_updated") or row.get("queued_at"))
             metadata = getattr(record, "metadata", None) or {}
@@ -89,6 +113,42 @@ class BundleCandidateProvider:
         return candidates
 
 
+def _candidate_filters(
+    criteria: Optional[BundleCriteria],
+    *,
+    jurisdiction: Optional[str],
+    reference_time: Optional[datetime],
+) -> Dict[str, Any]:
+    filters: Dict[str, Any] = {}
+    if criteria is not None:
+        now = reference_time or datetime.now(timezone.utc)
+        filters["min_loss_usd"] = criteria.min_loss_usd
+        filters["since"] = now - timedelta(days=criteria.recency_days)
+    if jurisdiction:
+        filters["jurisdiction"] = jurisdiction
+    return filters
+
+
+def _matches_filters(candidate: DossierCandidate, filters: Dict[str, Any]) -> bool:
+    min_loss = filters.get("min_loss_usd")
+    if min_loss is not None and candidate.loss_amount_usd < Decimal(str(min_loss)):
+        return False
+    since = filters.get("since")
+    if since is not None and candidate.accepted_at < since:
+        return False
+    jurisdiction = filters.get("jurisdiction")
+    return not jurisdiction or candidate.jurisdiction == jurisdiction
+
+
+def _keyed_rows(rows: Iterable[dict]) -> List[Tuple[str, dict]]:
+    keyed: List[Tuple[str, dict]] = []
+    for row in rows:
+        case_id = str(row.get("case_id") or "").strip()
+        if case_id:
+            keyed.append((case_id, row))
+    return keyed
+
+
 def _parse_datetime(value: object | None) -> datetime:
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
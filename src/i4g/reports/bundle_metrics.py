@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from typing import Any, Mapping, Optional
 
 _LOSS_BAND_EMPTY = "unknown"
+# Lower bounds (inclusive) of each band after the first; keep in sync with the
+# loss_band CASE in the ReviewStore dossier_candidate_metrics view.
+_LOSS_BAND_EDGES = (Decimal("50000"), Decimal("100000"), Decimal("250000"))
+_LOSS_BAND_LABELS = ("below-50k", "50k-100k", "100k-250k", "250k-plus")
 
 
 @dataclass(frozen=True)
@@ -103,17 +108,9 @@ def _derive_geo_bucket(jurisdiction: str, victim_country: Optional[str]) -> str:
 
 
 def _loss_band(loss_amount: Decimal) -> str:
-    if loss_amount is None:
+    if loss_amount is None or loss_amount == 0:
         return _LOSS_BAND_EMPTY
-    if loss_amount >= Decimal("250000"):
-        return "250k-plus"
-    if loss_amount >= Decimal("100000"):
-        return "100k-250k"
-    if loss_amount >= Decimal("50000"):
-        return "50k-100k"
-    if loss_amount == Decimal("0"):
-        return _LOSS_BAND_EMPTY
-    return "below-50k"
+    return _LOSS_BAND_LABELS[bisect_right(_LOSS_BAND_EDGES, loss_amount)]
 
 
 __all__ = ["BundleMetrics", "compute_bundle_metrics"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
@@ -44,33 +45,34 @@ class DossierAnalysis:
 def analyze_plan(plan: DossierPlan, *, top_entities: int = 10) -> DossierAnalysis:
     """Compute aggregate statistics for ``plan`` to enrich dossier manifests."""
 
+    cases = plan.cases
     loss_by_jurisdiction: Dict[str, Decimal] = {}
     cross_border_cases: List[str] = []
     entity_counter: Counter[str] = Counter()
-    accepted_values: List[datetime] = []
+    earliest: datetime | None = None
+    latest: datetime | None = None
 
-    for candidate in plan.cases:
+    for candidate in cases:
         jurisdiction = (candidate.jurisdiction or "unknown").strip() or "unknown"
-        loss_by_jurisdiction[jurisdiction] = (
-            loss_by_jurisdiction.get(jurisdiction, Decimal("0")) + candidate.loss_amount_usd
-        )
+        loss = candidate.loss_amount_usd
+        current = loss_by_jurisdiction.get(jurisdiction)
+        loss_by_jurisdiction[jurisdiction] = loss if current is None else current + loss
         if candidate.cross_border:
             cross_border_cases.append(candidate.case_id)
-        accepted_values.append(candidate.accepted_at)
-        for entity in candidate.primary_entities:
-            normalized = str(entity).strip()
-            if normalized:
-                entity_counter[normalized] += 1
-
-    earliest = min(accepted_values) if accepted_values else None
-    latest = max(accepted_values) if accepted_values else None
-    frequency_pairs = sorted(
-        entity_counter.items(),
-        key=lambda item: (-item[1], item[0]),
-    )[:top_entities]
+        accepted_at = candidate.accepted_at
+        if earliest is None or accepted_at < earliest:
+            earliest = accepted_at
+        if latest is None or accepted_at > latest:
+            latest = accepted_at
+        entity_counter.update(
+            normalized for normalized in (str(entity).strip() for entity in candidate.primary_entities) if normalized
+        )
+
+    # Partial sort: only the top ``top_entities`` pairs are ever reported.
+    frequency_pairs = heapq.nsmallest(top_entities, entity_counter.items(), key=lambda item: (-item[1], item[0]))
 
     return DossierAnalysis(
-        case_count=len(plan.cases),
+        case_count=len(cases),
         total_loss_usd=plan.total_loss_usd,
         loss_by_jurisdiction=loss_by_jurisdiction,
         cross_border_cases=tuple(cross_border_cases),
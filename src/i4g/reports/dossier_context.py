@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, List, Sequence
 
 from i4g.reports.bundle_builder import DossierPlan
 from i4g.store.review_store import ReviewStore
 from i4g.store.schema import ScamRecord
 from i4g.store.structured import StructuredStore
 
+_NO_WARNINGS: tuple[str, ...] = ()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CaseContext:
     """Serializable per-case context payload used by dossier generation."""
 
@@ -31,7 +33,7 @@ class CaseContext:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DossierContextResult:
     """Aggregated context payload returned by :class:`DossierContextLoader`."""
 
@@ -67,11 +69,12 @@ class DossierContextLoader:
             return DossierContextResult(cases=tuple(), warnings=tuple())
 
         review_map = self._review_store.get_cases(case_ids)
+        structured_map = self._structured_store.get_by_ids(case_ids)
         cases: List[CaseContext] = []
         aggregated_warnings: List[str] = []
 
         for case_id in case_ids:
-            structured = self._structured_store.get_by_id(case_id)
+            structured = structured_map.get(case_id)
             review = review_map.get(case_id)
             warnings = _case_warnings(structured=structured, review=review, case_id=case_id)
             aggregated_warnings.extend(warnings)
@@ -80,11 +83,11 @@ class DossierContextLoader:
                     case_id=case_id,
                     structured_record=structured.to_dict() if structured else None,
                     review=review,
-                    warnings=tuple(warnings),
+                    warnings=tuple(warnings) if warnings else _NO_WARNINGS,
                 )
             )
 
-        return DossierContextResult(cases=tuple(cases), warnings=tuple(_deduplicate(aggregated_warnings)))
+        return DossierContextResult(cases=tuple(cases), warnings=tuple(dict.fromkeys(aggregated_warnings)))
 
 
 def _unique_case_ids(plan: DossierPlan) -> List[str]:
@@ -108,17 +111,6 @@ def _case_warnings(*, structured: ScamRecord | None, review: Dict[str, Any] | No
     return warnings
 
 
-def _deduplicate(values: Iterable[str]) -> List[str]:
-    seen: set[str] = set()
-    ordered: List[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        ordered.append(value)
-    return ordered
-
-
 __all__ = [
     "CaseContext",
     "DossierContextResult",
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from i4g.reports import _json
 from i4g.reports.bundle_builder import BundleBuilder, BundleCriteria, DossierCandidate
 from i4g.reports.bundle_candidates import BundleCandidateProvider
 from i4g.services.factories import (
@@ -91,7 +91,8 @@ def load_pilot_case_specs(path: str | Path | None = None) -> Sequence[PilotCaseS
     resolved = Path(path) if path else DEFAULT_PILOT_CASES_PATH
     if not resolved.exists():
         raise FileNotFoundError(f"Pilot case config not found at {resolved}")
-    payload = json.loads(resolved.read_text())
+    raw = resolved.read_bytes()
+    payload = _json.loads(raw)
     if isinstance(payload, dict):
         payload = [payload]
     if not isinstance(payload, list):
@@ -166,7 +167,6 @@ def schedule_pilot_plans(
     if not specs:
         return PilotScheduleSummary(plan_ids=tuple(), missing_cases=tuple(), case_ids=tuple(), dry_run=dry_run)
 
-    builder = bundle_builder or build_bundle_builder()
     provider = candidate_provider or build_bundle_candidate_provider()
     target_ids = {spec.case_id for spec in specs}
     candidates = [candidate for candidate in provider.list_candidates(limit=500) if candidate.case_id in target_ids]
@@ -187,6 +187,9 @@ def schedule_pilot_plans(
             plan_ids=tuple(), missing_cases=tuple(missing), case_ids=tuple(target_ids), dry_run=dry_run
         )
 
+    # Opening the default builder also opens the dossier queue database, so it is
+    # deferred until there is something to bundle.
+    builder = bundle_builder or build_bundle_builder()
     if dry_run:
         plans = builder.generate_plans(candidates=candidates, criteria=criteria)
         return PilotScheduleSummary(
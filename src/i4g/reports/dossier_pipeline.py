@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, List, Sequence
 
+from i4g.reports import _json
 from i4g.reports.bundle_builder import DossierPlan
 from i4g.reports.dossier_agent_payload import build_agent_payload
 from i4g.reports.dossier_analysis import analyze_plan
 from i4g.reports.dossier_context import DossierContextLoader, DossierContextResult
 from i4g.reports.dossier_signatures import generate_signature_manifest
-from i4g.reports.dossier_templates import TemplateRegistry, TemplateRenderResult
+from i4g.reports.dossier_templates import TemplateRegistry, TemplateRenderResult, default_template_registry
 from i4g.reports.dossier_tools import DossierToolResults, DossierToolSuite
 from i4g.reports.dossier_visuals import DossierVisualAssets, DossierVisualBuilder
 from i4g.services.factories import build_dossier_context_loader
@@ -49,7 +50,7 @@ class DossierGenerator:
         self._context_loader = context_loader or build_dossier_context_loader()
         self._visuals_builder = visuals_builder or DossierVisualBuilder(base_dir=base_dir)
         self._tool_suite = tool_suite or DossierToolSuite()
-        self._template_registry = template_registry or TemplateRegistry()
+        self._template_registry = template_registry or default_template_registry()
         self._hash_algorithm = settings.report.hash_algorithm
         self._now = now_provider or (lambda: datetime.now(timezone.utc))
 
@@ -60,8 +61,6 @@ class DossierGenerator:
         timestamp = self._now()
         payload["generated_at"] = timestamp.isoformat()
         payload["case_count"] = len(plan.cases)
-        analysis = analyze_plan(plan)
-        payload["analysis"] = analysis.to_dict()
         warnings: List[str] = []
         assets: DossierVisualAssets | None = None
         asset_view: dict | None = None
@@ -69,15 +68,34 @@ class DossierGenerator:
         tool_results: DossierToolResults | None = None
         template_render: TemplateRenderResult | None = None
 
-        if self._context_loader:
-            context = self._context_loader.load(plan)
-            payload["context"] = context.to_dict()
-            warnings.extend(context.warnings)
-        else:
-            payload["context"] = None
+        # Visual rendering is dominated by image/GeoJSON writes and does not depend on
+        # the context or analysis, so overlap it with the store reads below.
+        visuals_future: Future[DossierVisualAssets] | None = None
+        executor: ThreadPoolExecutor | None = None
+        if self._visuals_builder and self._context_loader:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dossier-visuals")
+            visuals_future = executor.submit(self._visuals_builder.render, plan)
 
-        if self._visuals_builder:
-            assets = self._visuals_builder.render(plan)
+        try:
+            analysis = analyze_plan(plan)
+            payload["analysis"] = analysis.to_dict()
+
+            if self._context_loader:
+                context = self._context_loader.load(plan)
+                payload["context"] = context.to_dict()
+                warnings.extend(context.warnings)
+            else:
+                payload["context"] = None
+
+            if visuals_future is not None:
+                assets = visuals_future.result()
+            elif self._visuals_builder:
+                assets = self._visuals_builder.render(plan)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if assets is not None:
             asset_view = assets.to_dict(relative_to=self._artifact_dir)
             payload["assets"] = asset_view
             warnings.extend(assets.warnings)
@@ -127,7 +145,7 @@ class DossierGenerator:
 
         payload["agent_payload"] = build_agent_payload(plan=plan, context=context, analysis=analysis).to_dict()
 
-        destination.write_text(json.dumps(payload, indent=2))
+        destination.write_bytes(_json.dumps_stable(payload))
 
         signature_entries = [("manifest", destination)]
         if markdown_path and markdown_path.exists():
@@ -146,7 +164,7 @@ class DossierGenerator:
             generated_at=timestamp,
             relative_to=self._artifact_dir,
         )
-        signature_path.write_text(json.dumps(signature_manifest.to_dict(), indent=2))
+        signature_path.write_bytes(_json.dumps_stable(signature_manifest.to_dict()))
         warnings.extend(signature_manifest.warnings)
 
         artifacts = [destination, signature_path]
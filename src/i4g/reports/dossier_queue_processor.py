@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Callable, List
 
 from i4g.reports.bundle_builder import DossierPlan
 from i4g.reports.dossier_pipeline import DossierGenerationResult, DossierGenerator
@@ -41,69 +41,90 @@ class DossierQueueProcessor:
         batch_size: int = 5,
         dry_run: bool = False,
         reporter: TaskStatusReporter | None = None,
+        on_plan: Callable[[dict], None] | None = None,
     ) -> QueueProcessSummary:
-        """Process up to ``batch_size`` queue entries and return the execution summary."""
+        """Process up to ``batch_size`` queue entries and return the execution summary.
+
+        When ``on_plan`` is given, each per-plan summary is handed to it as soon as the
+        plan finishes instead of being collected in :attr:`QueueProcessSummary.plans`,
+        so large batches do not accumulate per-plan state.
+        """
 
         processed = 0
         completed = 0
         failed = 0
         plan_summaries: List[dict] = []
-
-        for _ in range(batch_size):
-            leased = self._queue_store.lease_next()
-            if not leased:
-                break
-            processed += 1
-            plan_payload = leased.get("payload") or {}
-            plan = DossierPlan.from_dict(plan_payload)
-            plan_id = plan.plan_id
-            if reporter:
-                reporter.update(
-                    status="leased",
-                    message=f"Processing dossier plan {plan_id}",
-                    plan_id=plan_id,
-                    processed=processed,
-                    completed=completed,
-                    failed=failed,
-                )
-
-            if dry_run:
-                self._queue_store.reset(plan_id)
-                plan_summaries.append({"plan_id": plan_id, "status": "dry-run"})
+        emit_plan = on_plan or plan_summaries.append
+
+        if dry_run:
+            # Dry runs only touch queue bookkeeping, so claiming and restoring the batch share one commit.
+            with self._queue_store.bulk_session():
+                leased_entries = self._queue_store.lease_batch(batch_size)
+                for leased in leased_entries:
+                    self._queue_store.reset(leased["plan_id"])
+        else:
+            # Claim the whole batch in one write; completion marks stay per plan so finished work is durable even
+            # if a later plan in the batch brings the worker down.
+            leased_entries = self._queue_store.lease_batch(batch_size)
+
+        try:
+            for leased in leased_entries:
+                processed += 1
+                plan_payload = leased.get("payload") or {}
+                plan = DossierPlan.from_dict(plan_payload)
+                plan_id = plan.plan_id
                 if reporter:
                     reporter.update(
-                        status="dry_run",
-                        message=f"Inspected dossier plan {plan_id}",
+                        status="leased",
+                        message=f"Processing dossier plan {plan_id}",
                         plan_id=plan_id,
+                        processed=processed,
+                        completed=completed,
+                        failed=failed,
                     )
-                continue
 
-            try:
-                result = self._generator.generate_from_plan(plan)
-                self._queue_store.mark_complete(plan_id, warnings=result.warnings)
-                plan_summaries.append(self._result_summary(result, status="completed"))
-                completed += 1
-                if reporter:
-                    reporter.update(
-                        status="completed",
-                        message=f"Generated dossier for plan {plan_id}",
-                        plan_id=plan_id,
-                        artifacts=[str(path) for path in result.artifacts],
-                        warnings=list(result.warnings),
-                        case_count=len(plan.cases),
-                        total_loss_usd=str(plan.total_loss_usd),
-                    )
-            except Exception as exc:  # pragma: no cover - defensive logging
-                self._queue_store.mark_failed(plan_id, error=str(exc))
-                plan_summaries.append({"plan_id": plan_id, "status": "failed", "error": str(exc)})
-                failed += 1
-                if reporter:
-                    reporter.update(
-                        status="failed",
-                        message=f"Dossier plan {plan_id} failed",
-                        plan_id=plan_id,
-                        error=str(exc),
-                    )
+                if dry_run:
+                    emit_plan({"plan_id": plan_id, "status": "dry-run"})
+                    if reporter:
+                        reporter.update(
+                            status="dry_run",
+                            message=f"Inspected dossier plan {plan_id}",
+                            plan_id=plan_id,
+                        )
+                    continue
+
+                try:
+                    result = self._generator.generate_from_plan(plan)
+                    self._queue_store.mark_complete(plan_id, warnings=result.warnings)
+                    emit_plan(self._result_summary(result, status="completed"))
+                    completed += 1
+                    if reporter:
+                        reporter.update(
+                            status="completed",
+                            message=f"Generated dossier for plan {plan_id}",
+                            plan_id=plan_id,
+                            artifacts=[str(path) for path in result.artifacts],
+                            warnings=list(result.warnings),
+                            case_count=len(plan.cases),
+                            total_loss_usd=str(plan.total_loss_usd),
+                        )
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    self._queue_store.mark_failed(plan_id, error=str(exc))
+                    emit_plan({"plan_id": plan_id, "status": "failed", "error": str(exc)})
+                    failed += 1
+                    if reporter:
+                        reporter.update(
+                            status="failed",
+                            message=f"Dossier plan {plan_id} failed",
+                            plan_id=plan_id,
+                            error=str(exc),
+                        )
+        finally:
+            if not dry_run and processed < len(leased_entries):
+                # Hand unstarted leases back so an aborted batch does not strand them.
+                with self._queue_store.bulk_session():
+                    for leased in leased_entries[processed:]:
+                        self._queue_store.reset(leased["plan_id"])
 
         summary = QueueProcessSummary(
             processed=processed,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
@@ -62,12 +63,7 @@ class TemplateRegistry:
         parts: Sequence[TemplatePart] | None = None,
     ) -> None:
         self._template_dir = template_dir or (PROJECT_ROOT / "templates" / "reports" / "dossiers")
-        self._environment = Environment(
-            loader=FileSystemLoader(str(self._template_dir)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self._environment = _template_environment(str(self._template_dir))
         self._parts = tuple(parts or DEFAULT_TEMPLATE_PARTS)
 
     def render(
@@ -123,10 +119,41 @@ class TemplateRegistry:
         )
 
 
+@lru_cache(maxsize=16)
+def _template_environment(template_dir: str) -> Environment:
+    """Return the shared Jinja environment for ``template_dir``.
+
+    Registries pointed at the same directory reuse one environment, so each template
+    compiles once per process. Dossier templates ship with the release, so mtime checks
+    (``auto_reload``) and LRU eviction of compiled templates are disabled.
+    """
+
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+@lru_cache(maxsize=1)
+def default_template_registry() -> TemplateRegistry:
+    """Return a process-wide registry for the bundled templates.
+
+    Jinja caches compiled templates per environment and renders are thread-safe,
+    so generators that do not override the template set can share one instance.
+    """
+
+    return TemplateRegistry()
+
+
 __all__ = [
     "TemplatePart",
     "TemplateRegistry",
     "TemplateRenderResult",
+    "default_template_registry",
 ]
 
 
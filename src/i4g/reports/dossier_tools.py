@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from pathlib import Path
 from statistics import mean
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
@@ -55,16 +58,13 @@ class GeoReasonerTool(BaseTool):
 
     def _run(self, plan: DossierToolInput) -> str:
         cases = _normalise_cases(plan.plan)
-        jurisdiction_counts: MutableMapping[str, int] = {}
-        cross_border_cases: List[str] = []
-        for case in cases:
-            jurisdiction = str(case.get("jurisdiction") or "unknown").upper()
-            jurisdiction_counts[jurisdiction] = jurisdiction_counts.get(jurisdiction, 0) + 1
-            if case.get("cross_border"):
-                cross_border_cases.append(str(case.get("case_id")))
+        jurisdiction_counts: Counter[str] = Counter(
+            str(case.get("jurisdiction") or "unknown").upper() for case in cases
+        )
+        cross_border_cases = [str(case.get("case_id")) for case in cases if case.get("cross_border")]
         ordered_regions = sorted(jurisdiction_counts.items(), key=lambda item: (-item[1], item[0]))[:5]
         payload = {
-            "jurisdiction_counts": jurisdiction_counts,
+            "jurisdiction_counts": dict(jurisdiction_counts),
             "primary_regions": [region for region, _ in ordered_regions],
             "cross_border_cases": cross_border_cases,
             "warnings": [],
@@ -133,20 +133,20 @@ class EntityGraphTool(BaseTool):
 
     def _run(self, plan: DossierToolInput) -> str:
         cases = _normalise_cases(plan.plan)
-        adjacency: MutableMapping[str, List[str]] = {}
+        adjacency: defaultdict[str, set[str]] = defaultdict(set)
         for case in cases:
             case_id = str(case.get("case_id") or "")
             for entity in case.get("primary_entities", []) or []:
                 normalized = str(entity).strip()
                 if not normalized:
                     continue
-                adjacency.setdefault(normalized, []).append(case_id)
+                adjacency[normalized].add(case_id)
         clusters = sorted(
-            ((entity, len(set(case_ids))) for entity, case_ids in adjacency.items()),
+            ((entity, len(case_ids)) for entity, case_ids in adjacency.items()),
             key=lambda item: (-item[1], item[0]),
         )[:5]
         payload = {
-            "entities": {entity: sorted(set(case_ids)) for entity, case_ids in adjacency.items()},
+            "entities": {entity: sorted(case_ids) for entity, case_ids in adjacency.items()},
             "entity_count": len(adjacency),
             "top_clusters": [{"entity": entity, "count": count} for entity, count in clusters],
         }
@@ -235,7 +235,16 @@ class DossierToolResults:
 class DossierToolSuite:
     """Orchestrates every LangChain tool used during dossier generation."""
 
-    def __init__(self, tools: Sequence[BaseTool] | None = None) -> None:
+    def __init__(self, tools: Sequence[BaseTool] | None = None, *, max_workers: int = 1) -> None:
+        """Configure the suite.
+
+        Args:
+            tools: Tools to run; defaults to the built-in dossier tools.
+            max_workers: Threads used to run tools side by side. The built-in tools are pure-Python and gain nothing
+                under the GIL, so this only pays off for injected tools that block on I/O (LLM or HTTP calls).
+        """
+
+        self._max_workers = max(1, max_workers)
         self._tools = (
             list(tools)
             if tools
@@ -269,9 +278,17 @@ class DossierToolSuite:
         outputs: Dict[str, Any] = {}
         warnings: List[str] = []
         errors: Dict[str, str] = {}
-        for tool in self._tools:
+        workers = min(self._max_workers, len(self._tools))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dossier-tool") as pool:
+                futures = [pool.submit(tool._run, input_payload) for tool in self._tools]
+            # ``future.result`` re-raises tool errors; collecting in tool order keeps outputs deterministic.
+            runs = [(tool, future.result) for tool, future in zip(self._tools, futures)]
+        else:
+            runs = [(tool, partial(tool._run, input_payload)) for tool in self._tools]
+        for tool, run in runs:
             try:
-                raw = tool._run(input_payload)
+                raw = run()
                 parsed = json.loads(raw) if isinstance(raw, str) else raw
                 outputs[tool.name] = parsed
             except Exception as exc:  # pragma: no cover - defensive guardrail
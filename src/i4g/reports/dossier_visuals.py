@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import BinaryIO, Literal, Mapping, Sequence
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from i4g.reports import _json
 from i4g.reports.bundle_builder import DossierPlan
 from i4g.settings import get_settings
 
@@ -40,8 +43,21 @@ _COORDINATES: Mapping[str, tuple[float, float]] = {
     "JP": (36.20, 138.25),
 }
 
+_MAP_BACKGROUND_RGB = (4, 28, 50)  # #041c32
+_MAP_GRID_RGB = (15, 45, 68)  # #0f2d44
 
-@dataclass(frozen=True)
+ImageFormat = Literal["png", "webp"]
+
+# Canvases are recycled between renders so back-to-back dossier batches do not churn the allocator.
+_IMAGE_POOL: dict[tuple[int, int], list[Image.Image]] = {}
+_IMAGE_POOL_LOCK = threading.Lock()
+_IMAGE_POOL_MAX_PER_SIZE = 4
+
+# Loading the bitmap font is comparatively slow, so every renderer shares one instance.
+_DEFAULT_FONT = ImageFont.load_default()
+
+
+@dataclass(frozen=True, slots=True)
 class TimelineChartResult:
     """Return value emitted by :class:`LossTimelineRenderer`."""
 
@@ -49,7 +65,7 @@ class TimelineChartResult:
     warnings: Sequence[str] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeoMapResult:
     """Container describing generated geo map assets."""
 
@@ -58,7 +74,7 @@ class GeoMapResult:
     warnings: Sequence[str] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DossierVisualAssets:
     """Aggregated outputs returned by :class:`DossierVisualBuilder`."""
 
@@ -94,13 +110,18 @@ class DossierVisualAssets:
 class LossTimelineRenderer:
     """Produces a simple bar chart summarizing per-case losses."""
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(self, output_dir: Path, *, image_format: ImageFormat = "png") -> None:
         self._output_dir = output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
-        self._font = ImageFont.load_default()
+        self._font = _DEFAULT_FONT
+        self._image_format = image_format
 
-    def render(self, plan: DossierPlan) -> TimelineChartResult:
-        """Render a loss timeline chart for the provided plan."""
+    def render(self, plan: DossierPlan, *, sink: BinaryIO | None = None) -> TimelineChartResult:
+        """Render a loss timeline chart for the provided plan.
+
+        When ``sink`` is supplied the encoded image is written there instead of disk; ``image_path`` still reports
+        the path the chart would have been saved to.
+        """
 
         if not plan.cases:
             return TimelineChartResult(
@@ -115,50 +136,53 @@ class LossTimelineRenderer:
         margin = 60
         usable_height = chart_height - (margin * 2)
         usable_width = chart_width - (margin * 2)
-        image = Image.new("RGB", (chart_width, chart_height), "white")
-        draw = ImageDraw.Draw(image)
-
-        # Axes
-        draw.line((margin, margin, margin, chart_height - margin), fill="#1f2933", width=2)
-        draw.line((margin, chart_height - margin, chart_width - margin, chart_height - margin), fill="#1f2933", width=2)
-        draw.text((margin, 15), "Loss per accepted case (USD)", font=self._font, fill="#111")
-
         if max_loss <= 0:
             return TimelineChartResult(
                 image_path=None,
                 warnings=("Loss timeline chart skipped because all cases have zero reported loss",),
             )
 
-        bar_width = usable_width / len(ordered)
-        baseline = chart_height - margin
-        for index, case in enumerate(ordered):
-            loss_value = max(case.loss_amount_usd, Decimal("0"))
-            height_ratio = float(loss_value / max_loss)
-            bar_height = height_ratio * usable_height
-            x0 = margin + index * bar_width + (bar_width * 0.15)
-            x1 = x0 + (bar_width * 0.7)
-            y1 = baseline
-            y0 = baseline - bar_height
-            draw.rectangle((x0, y0, x1, y1), fill="#ff6b35")
-            label = _format_label(case.accepted_at)
-            draw.text((x0 - 5, baseline + 8), label, font=self._font, fill="#4b5563")
-            draw.text((x0, y0 - 14), f"${int(loss_value):,}", font=self._font, fill="#111")
-
-        output_path = self._output_dir / f"{plan.plan_id}_loss_timeline.png"
-        image.save(output_path, format="PNG")
+        image = _acquire_image(_timeline_background(chart_width, chart_height, margin))
+        try:
+            draw = ImageDraw.Draw(image)
+
+            bar_width = usable_width / len(ordered)
+            baseline = chart_height - margin
+            for index, case in enumerate(ordered):
+                loss_value = max(case.loss_amount_usd, Decimal("0"))
+                height_ratio = float(loss_value / max_loss)
+                bar_height = height_ratio * usable_height
+                x0 = margin + index * bar_width + (bar_width * 0.15)
+                x1 = x0 + (bar_width * 0.7)
+                y1 = baseline
+                y0 = baseline - bar_height
+                draw.rectangle((x0, y0, x1, y1), fill="#ff6b35")
+                label = _format_label(case.accepted_at)
+                draw.text((x0 - 5, baseline + 8), label, font=self._font, fill="#4b5563")
+                draw.text((x0, y0 - 14), _format_usd(int(loss_value)), font=self._font, fill="#111")
+
+            output_path = _save_image(
+                image, self._output_dir / f"{plan.plan_id}_loss_timeline", self._image_format, sink=sink
+            )
+        finally:
+            _release_image(image)
         return TimelineChartResult(image_path=output_path)
 
 
 class GeoMapRenderer:
     """Renders approximate geographic scatter plots and GeoJSON payloads."""
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(self, output_dir: Path, *, image_format: ImageFormat = "png") -> None:
         self._output_dir = output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
-        self._font = ImageFont.load_default()
+        self._font = _DEFAULT_FONT
+        self._image_format = image_format
 
-    def render(self, plan: DossierPlan) -> GeoMapResult:
-        """Generate a GeoJSON feature collection and preview map for ``plan``."""
+    def render(self, plan: DossierPlan, *, sink: BinaryIO | None = None) -> GeoMapResult:
+        """Generate a GeoJSON feature collection and preview map for ``plan``.
+
+        ``sink`` receives the encoded map image in place of the file on disk; the GeoJSON is always written.
+        """
 
         if not plan.cases:
             return GeoMapResult(
@@ -168,7 +192,12 @@ class GeoMapRenderer:
             )
 
         features: list[dict] = []
-        mapped_cases: list[tuple[float, float, str, Decimal, bool]] = []
+        # Mapped cases are kept as parallel columns so the scatter plot can project them in one vectorized pass.
+        lons: list[float] = []
+        lats: list[float] = []
+        labels: list[str] = []
+        losses: list[Decimal] = []
+        cross_flags: list[bool] = []
         warnings: list[str] = []
         for candidate in plan.cases:
             coord = self._resolve_coordinates(candidate.jurisdiction)
@@ -188,9 +217,11 @@ class GeoMapRenderer:
                     "geometry": {"type": "Point", "coordinates": [lon, lat]},
                 }
             )
-            mapped_cases.append(
-                (lon, lat, candidate.jurisdiction or "unknown", candidate.loss_amount_usd, candidate.cross_border)
-            )
+            lons.append(lon)
+            lats.append(lat)
+            labels.append(candidate.jurisdiction or "unknown")
+            losses.append(candidate.loss_amount_usd)
+            cross_flags.append(candidate.cross_border)
 
         geojson_path: Path | None = None
         map_path: Path | None = None
@@ -198,8 +229,16 @@ class GeoMapRenderer:
         if features:
             geojson = {"type": "FeatureCollection", "features": features}
             geojson_path = self._output_dir / f"{plan.plan_id}_geo.json"
-            geojson_path.write_text(json.dumps(geojson, indent=2))
-            map_path = self._render_scatter_plot(plan.plan_id, mapped_cases)
+            geojson_path.write_bytes(_json.dumps_stable(geojson))
+            map_path = self._render_scatter_plot(
+                plan.plan_id,
+                lons=lons,
+                lats=lats,
+                labels=labels,
+                losses=losses,
+                cross_flags=cross_flags,
+                sink=sink,
+            )
         else:
             warnings.append("Geo map skipped because no case coordinates were resolved")
 
@@ -208,49 +247,46 @@ class GeoMapRenderer:
     def _render_scatter_plot(
         self,
         plan_id: str,
-        mapped_cases: Iterable[tuple[float, float, str, Decimal, bool]],
+        *,
+        lons: Sequence[float],
+        lats: Sequence[float],
+        labels: Sequence[str],
+        losses: Sequence[Decimal],
+        cross_flags: Sequence[bool],
+        sink: BinaryIO | None = None,
     ) -> Path:
         width = 960
         height = 480
         margin = 40
-        image = Image.new("RGB", (width, height), "#041c32")
-        draw = ImageDraw.Draw(image)
-
-        # Grid lines for visual context
-        for lon in range(-120, 181, 60):
-            x = _project_x(lon, width)
-            draw.line((x, 0, x, height), fill="#0f2d44")
-        for lat in range(-60, 91, 30):
-            y = _project_y(lat, height)
-            draw.line((0, y, width, y), fill="#0f2d44")
-
-        draw.text((margin, 15), "Approximate case locations", font=self._font, fill="#ffffff")
-        legend_y = height - margin
-        draw.text((margin, legend_y - 15), "● Jurisdiction match", font=self._font, fill="#3dd598")
-        draw.text((margin + 220, legend_y - 15), "● Cross-border", font=self._font, fill="#ffd166")
-
-        for lon, lat, jurisdiction, loss, cross_border in mapped_cases:
-            x = _project_x(lon, width)
-            y = _project_y(lat, height)
-            radius = 7
-            color = "#ffd166" if cross_border else "#3dd598"
-            draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color, outline="#02111b")
-            draw.text((x + 8, y - 6), f"{jurisdiction} (${int(loss):,})", font=self._font, fill="#e5e7eb")
-
-        output_path = self._output_dir / f"{plan_id}_geo_map.png"
-        image.save(output_path, format="PNG")
-        return output_path
+        image = _acquire_image(_map_background(width, height))
+        try:
+            draw = ImageDraw.Draw(image)
+
+            draw.text((margin, 15), "Approximate case locations", font=self._font, fill="#ffffff")
+            legend_y = height - margin
+            draw.text((margin, legend_y - 15), "● Jurisdiction match", font=self._font, fill="#3dd598")
+            draw.text((margin + 220, legend_y - 15), "● Cross-border", font=self._font, fill="#ffd166")
+
+            xs = _project_x(np.asarray(lons, dtype=np.float64), width)
+            ys = _project_y(np.asarray(lats, dtype=np.float64), height)
+            for x, y, jurisdiction, loss, cross_border in zip(xs.tolist(), ys.tolist(), labels, losses, cross_flags):
+                radius = 7
+                color = "#ffd166" if cross_border else "#3dd598"
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color, outline="#02111b")
+                draw.text((x + 8, y - 6), f"{jurisdiction} ({_format_usd(int(loss))})", font=self._font, fill="#e5e7eb")
+
+            return _save_image(image, self._output_dir / f"{plan_id}_geo_map", self._image_format, sink=sink)
+        finally:
+            _release_image(image)
 
     def _resolve_coordinates(self, jurisdiction: str | None) -> tuple[float, float] | None:
         if not jurisdiction:
             return None
         key = jurisdiction.upper()
-        if key in _COORDINATES:
-            return _COORDINATES[key]
-        if "-" in key:
-            region = key.split("-", 1)[0]
-            return _COORDINATES.get(region)
-        return _COORDINATES.get(key)
+        coord = _COORDINATES.get(key)
+        if coord is None and "-" in key:
+            coord = _COORDINATES.get(key.partition("-")[0])
+        return coord
 
 
 class DossierVisualBuilder:
@@ -268,8 +304,9 @@ class DossierVisualBuilder:
         assets_dir = reports_dir / "assets"
         charts_dir = assets_dir / "charts"
         geo_dir = assets_dir / "geo"
-        self._timeline_renderer = timeline_renderer or LossTimelineRenderer(charts_dir)
-        self._geo_renderer = geo_renderer or GeoMapRenderer(geo_dir)
+        image_format = settings.report.image_format
+        self._timeline_renderer = timeline_renderer or LossTimelineRenderer(charts_dir, image_format=image_format)
+        self._geo_renderer = geo_renderer or GeoMapRenderer(geo_dir, image_format=image_format)
 
     def render(self, plan: DossierPlan) -> DossierVisualAssets:
         """Generate every configured visual asset for ``plan``."""
@@ -286,17 +323,88 @@ class DossierVisualBuilder:
         )
 
 
+def _save_image(image: Image.Image, stem: Path, image_format: ImageFormat, *, sink: BinaryIO | None = None) -> Path:
+    """Encode ``image`` next to ``stem`` (or into ``sink``) favouring fast encoding over maximum compression."""
+
+    if image_format == "webp":
+        output_path = stem.with_name(f"{stem.name}.webp")
+        image.save(output_path if sink is None else sink, format="WEBP", quality=80)
+    else:
+        output_path = stem.with_name(f"{stem.name}.png")
+        image.save(output_path if sink is None else sink, format="PNG", compress_level=1, optimize=False)
+    return output_path
+
+
+def _acquire_image(template: Image.Image) -> Image.Image:
+    """Return a pooled RGB canvas the size of ``template`` holding a copy of it."""
+
+    size = template.size
+    with _IMAGE_POOL_LOCK:
+        bucket = _IMAGE_POOL.get(size)
+        image = bucket.pop() if bucket else None
+    if image is None:
+        image = Image.new("RGB", size)
+    image.paste(template)
+    return image
+
+
+def _release_image(image: Image.Image) -> None:
+    """Return ``image`` to the pool once it has been encoded."""
+
+    with _IMAGE_POOL_LOCK:
+        bucket = _IMAGE_POOL.setdefault(image.size, [])
+        if len(bucket) < _IMAGE_POOL_MAX_PER_SIZE:
+            bucket.append(image)
+
+
+@lru_cache(maxsize=4)
+def _timeline_background(width: int, height: int, margin: int) -> Image.Image:
+    """Return the (cached, read-only) timeline canvas with axes and title already painted."""
+
+    canvas = Image.new("RGB", (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(canvas)
+    draw.line((margin, margin, margin, height - margin), fill="#1f2933", width=2)
+    draw.line((margin, height - margin, width - margin, height - margin), fill="#1f2933", width=2)
+    draw.text((margin, 15), "Loss per accepted case (USD)", font=_DEFAULT_FONT, fill="#111")
+    return canvas
+
+
+@lru_cache(maxsize=4)
+def _map_background(width: int, height: int) -> Image.Image:
+    """Return the (cached, read-only) map canvas with grid lines for visual context painted via array slicing."""
+
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = _MAP_BACKGROUND_RGB
+    grid_x = _project_x(np.arange(-120, 181, 60, dtype=np.float64), width).astype(np.intp)
+    grid_y = _project_y(np.arange(-60, 91, 30, dtype=np.float64), height).astype(np.intp)
+    canvas[:, grid_x[grid_x < width]] = _MAP_GRID_RGB
+    canvas[grid_y[grid_y < height], :] = _MAP_GRID_RGB
+    return Image.fromarray(canvas)
+
+
 def _format_label(value: datetime) -> str:
     if not value:
         return ""
-    return value.strftime("%m-%d")
+    return _month_day_label(value.month, value.day)
+
+
+@lru_cache(maxsize=366)
+def _month_day_label(month: int, day: int) -> str:
+    return f"{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _format_usd(amount: int) -> str:
+    """Return ``amount`` as a ``$1,234`` label; bundles repeat loss values often enough to be worth caching."""
+
+    return f"${amount:,}"
 
 
-def _project_x(lon: float, width: int) -> float:
+def _project_x(lon: float | np.ndarray, width: int) -> float | np.ndarray:
     return (lon + 180.0) / 360.0 * width
 
 
-def _project_y(lat: float, height: int) -> float:
+def _project_y(lat: float | np.ndarray, height: int) -> float | np.ndarray:
     return (90.0 - lat) / 180.0 * height
 
 
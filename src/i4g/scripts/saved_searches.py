@@ -4,11 +4,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from i4g.reports import _json
 from i4g.settings import get_settings
 
+try:  # pragma: no cover - optional streaming parser
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
+
 SETTINGS = get_settings()
 
 
@@ -51,28 +60,66 @@ def build_argument_parser() -> argparse.ArgumentParser:
 def load_records(path: Path) -> list[dict[str, Any]]:
     """Load saved-search JSON payloads from disk."""
 
-    content = path.read_text(encoding="utf-8")
-    payload = json.loads(content)
+    return list(iter_records(path))
+
+
+def iter_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield saved-search records one at a time, streaming top-level arrays when ``ijson`` is installed."""
+
+    with path.open("rb") as handle:
+        if ijson is not None and _first_token(handle) == b"[":
+            for record in ijson.items(handle, "item", use_float=True):
+                if isinstance(record, dict):
+                    yield record
+            return
+        payload = json.loads(handle.read())
     if isinstance(payload, list):
-        return [record for record in payload if isinstance(record, dict)]
+        yield from (record for record in payload if isinstance(record, dict))
+        return
     if isinstance(payload, dict):
-        return [payload]
+        yield payload
+        return
     raise ValueError("Input file must contain a JSON object or array of objects.")
 
 
+def _first_token(handle: Any) -> bytes:
+    """Return the first non-whitespace byte of ``handle`` and rewind it."""
+
+    token = b""
+    while True:
+        chunk = handle.read(64)
+        if not chunk:
+            break
+        stripped = chunk.lstrip().lstrip(b"\xef\xbb\xbf")
+        if stripped:
+            token = stripped[:1]
+            break
+    handle.seek(0)
+    return token
+
+
 def _normalize_tags(values: Any) -> list[str]:
     if isinstance(values, list):
-        return [str(tag) for tag in values if isinstance(tag, (str, int, float)) and str(tag).strip()]
+        # Stringify each scalar tag once and filter on that text instead of converting twice per tag.
+        return [text for text in (str(tag) for tag in values if isinstance(tag, (str, int, float))) if text.strip()]
     if isinstance(values, str) and values.strip():
         return [values.strip()]
     return []
 
 
 def annotate_records(
-    records: list[dict[str, Any]], *, tag: str, schema_version: str, dedupe: bool
+    records: Iterable[dict[str, Any]], *, tag: str, schema_version: str, dedupe: bool
 ) -> list[dict[str, Any]]:
     """Return annotated saved-search records."""
 
+    return list(iter_annotated_records(records, tag=tag, schema_version=schema_version, dedupe=dedupe))
+
+
+def iter_annotated_records(
+    records: Iterable[dict[str, Any]], *, tag: str, schema_version: str, dedupe: bool
+) -> Iterator[dict[str, Any]]:
+    """Lazily annotate saved-search records so large exports never need to be fully materialized."""
+
     normalized_tag = tag.strip()
     normalized_schema = schema_version.strip()
     for record in records:
@@ -80,15 +127,11 @@ def annotate_records(
         if normalized_tag:
             tags.append(normalized_tag)
             if dedupe:
-                seen = set()
-                unique_tags: list[str] = []
+                # Dicts preserve insertion order, so setdefault keeps the first spelling of each tag in place.
+                unique_tags: dict[str, str] = {}
                 for value in tags:
-                    lowered = value.lower()
-                    if lowered in seen:
-                        continue
-                    seen.add(lowered)
-                    unique_tags.append(value)
-                tags = unique_tags
+                    unique_tags.setdefault(value.lower(), value)
+                tags = list(unique_tags.values())
         record["tags"] = tags
 
         if normalized_schema:
@@ -97,7 +140,7 @@ def annotate_records(
                 params = {}
             params["schema_version"] = normalized_schema
             record["params"] = params
-    return records
+        yield record
 
 
 def annotate_file(
@@ -110,11 +153,50 @@ def annotate_file(
 ) -> tuple[Path, int]:
     """Annotate a saved-search export file in place and return the output path and record count."""
 
-    records = load_records(input_path)
-    annotated = annotate_records(records, tag=tag, schema_version=schema_version, dedupe=dedupe)
+    records = iter_records(input_path)
+    annotated = iter_annotated_records(records, tag=tag, schema_version=schema_version, dedupe=dedupe)
     destination = output_path or input_path
-    destination.write_text(json.dumps(annotated, indent=2) + "\n", encoding="utf-8")
-    return destination, len(annotated)
+    count = _write_json_array(destination, annotated)
+    return destination, count
+
+
+def _write_json_array(destination: Path, records: Iterable[dict[str, Any]]) -> int:
+    """Stream ``records`` to ``destination`` as an indented JSON array and return the record count.
+
+    Output goes to a sibling temp file that replaces ``destination`` once complete, so annotating a file in
+    place never truncates the input while it is still being read.
+    """
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    fd, tmp_name = tempfile.mkstemp(dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for record in records:
+                handle.write(b"[\n  " if count == 0 else b",\n  ")
+                handle.write(_json.dumps(record, indent=True).replace(b"\n", b"\n  "))
+                count += 1
+            handle.write(b"\n]\n" if count else b"[]\n")
+        _match_destination_mode(tmp_name, destination)
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _match_destination_mode(tmp_name: str, destination: Path) -> None:
+    """Give the temp file the mode the destination has, or the umask default for a new file.
+
+    ``mkstemp`` always creates files as 0600, which would otherwise replace the destination's permissions.
+    """
+
+    if destination.exists():
+        shutil.copymode(destination, tmp_name)
+        return
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_name, 0o666 & ~umask)
 
 
 def main() -> None:
@@ -137,6 +219,8 @@ __all__ = [
     "annotate_records",
     "annotate_file",
     "build_argument_parser",
+    "iter_annotated_records",
+    "iter_records",
     "load_records",
     "main",
 ]
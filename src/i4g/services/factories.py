@@ -243,8 +243,11 @@ def build_bundle_candidate_provider(
     """Return a provider that yields dossier candidates from accepted reviews."""
 
     resolved_review = review_store or build_review_store()
-    resolved_structured = structured_store or build_structured_store()
-    return BundleCandidateProvider(review_store=resolved_review, structured_store=resolved_structured)
+    return BundleCandidateProvider(
+        review_store=resolved_review,
+        structured_store=structured_store,
+        structured_store_factory=build_structured_store,
+    )
 
 
 def build_dossier_context_loader(
@@ -174,6 +174,12 @@ class APISettings(BaseSettings):
         default="dev-analyst-token",
         validation_alias=AliasChoices("API_KEY", "API__KEY"),
     )
+    # Per-client request budget for the review API; 0 disables rate limiting. Local environments always disable it.
+    rate_limit_per_minute: int = Field(
+        default=10,
+        ge=0,
+        validation_alias=AliasChoices("API_RATE_LIMIT_PER_MINUTE", "API__RATE_LIMIT_PER_MINUTE"),
+    )
 
 
 class IdentitySettings(BaseSettings):
@@ -701,6 +707,10 @@ class ReportSettings(BaseSettings):
         default="sha256",
         validation_alias=AliasChoices("REPORT_HASH_ALGORITHM", "REPORT__HASH_ALGORITHM"),
     )
+    image_format: Literal["png", "webp"] = Field(
+        default="png",
+        validation_alias=AliasChoices("REPORT_IMAGE_FORMAT", "REPORT__IMAGE_FORMAT"),
+    )
 
 
 class Settings(BaseSettings):
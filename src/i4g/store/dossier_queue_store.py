@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from i4g.reports import _json
 from i4g.settings import get_settings
 
 if TYPE_CHECKING:  # pragma: no cover - import used only for type hints
@@ -15,22 +17,94 @@ if TYPE_CHECKING:  # pragma: no cover - import used only for type hints
 
 SETTINGS = get_settings()
 
+# Connection-level tuning applied once when the cached connection is opened.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=67108864",
+)
+_MEMORY_DB = ":memory:"
+
+
+def _dumps(payload: Any, *, sort_keys: bool = False) -> str:
+    return _json.dumps(payload, sort_keys=sort_keys).decode("utf-8")
+
+
+def _payload_column(include_payload: bool) -> str:
+    return "payload" if include_payload else "NULL AS payload"
+
+
+_UPSERT_PLAN_SQL = """
+    INSERT INTO dossier_queue (plan_id, status, priority, payload, queued_at, updated_at, warnings)
+    VALUES (?, 'pending', ?, ?, ?, ?, NULL)
+    ON CONFLICT(plan_id) DO UPDATE SET
+        status='pending',
+        priority=excluded.priority,
+        payload=excluded.payload,
+        queued_at=excluded.queued_at,
+        updated_at=excluded.updated_at,
+        error=NULL,
+        warnings=NULL
+"""
+
 
 class DossierQueueStore:
     """Persists DossierPlan payloads for downstream agent execution."""
 
     def __init__(self, db_path: str | Path | None = None) -> None:
-        resolved = Path(db_path) if db_path else Path(SETTINGS.storage.sqlite_path)
-        if not resolved.is_absolute():
-            resolved = (Path(SETTINGS.project_root) / resolved).resolve()
-        resolved.parent.mkdir(parents=True, exist_ok=True)
-        self.db_path = resolved
+        if db_path == _MEMORY_DB:
+            # Private in-memory database; it lives as long as the shared connection below.
+            self.db_path: str | Path = _MEMORY_DB
+        else:
+            resolved = Path(db_path) if db_path else Path(SETTINGS.storage.sqlite_path)
+            if not resolved.is_absolute():
+                resolved = (Path(SETTINGS.project_root) / resolved).resolve()
+            resolved.parent.mkdir(parents=True, exist_ok=True)
+            self.db_path = resolved
+        # Re-entrant so ``bulk_session`` can hold the connection across nested method calls.
+        self._lock = threading.RLock()
+        # Autocommit connection shared by every method; writes are serialized through ``_lock``.
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
         self._init_tables()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def bulk_session(self) -> Iterator[None]:
+        """Group every store call made inside the block into one write transaction.
+
+        The connection stays locked to the calling thread until the block exits, so
+        keep the block to queue bookkeeping rather than long-running generation work
+        when other threads share the store. Nested sessions join the outer one.
+        """
+
+        with self._connect() as conn:
+            if conn.in_transaction:
+                yield
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _init_tables(self) -> None:
         with self._connect() as conn:
@@ -48,7 +122,12 @@ class DossierQueueStore:
                 )
                 """
             )
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_dossier_queue_status ON dossier_queue(status)")
+            # Pending scans filter on status and order by queued_at; the composite index covers both and makes
+            # the old status-only index redundant.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dossier_queue_status_queued ON dossier_queue(status, queued_at)"
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_dossier_queue_status")
             try:
                 conn.execute("ALTER TABLE dossier_queue ADD COLUMN warnings TEXT")
             except sqlite3.OperationalError:
@@ -57,25 +136,18 @@ class DossierQueueStore:
     def enqueue_plan(self, plan: "DossierPlan", *, priority: str = "normal") -> str:
         """Insert or replace a dossier plan in the queue."""
 
+        return self.enqueue_plans([plan], priority=priority)[0]
+
+    def enqueue_plans(self, plans: Iterable["DossierPlan"], *, priority: str = "normal") -> List[str]:
+        """Insert or replace several dossier plans in a single transaction."""
+
         now = datetime.now(timezone.utc).isoformat()
-        payload = json.dumps(plan.to_dict(), sort_keys=True)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO dossier_queue (plan_id, status, priority, payload, queued_at, updated_at, warnings)
-                VALUES (?, 'pending', ?, ?, ?, ?, NULL)
-                ON CONFLICT(plan_id) DO UPDATE SET
-                    status='pending',
-                    priority=excluded.priority,
-                    payload=excluded.payload,
-                    queued_at=excluded.queued_at,
-                    updated_at=excluded.updated_at,
-                    error=NULL,
-                    warnings=NULL
-                """,
-                (plan.plan_id, priority, payload, now, now),
-            )
-        return plan.plan_id
+        rows = [(plan.plan_id, priority, _dumps(plan.to_dict(), sort_keys=True), now, now) for plan in plans]
+        if not rows:
+            return []
+        with self.bulk_session(), self._connect() as conn:
+            conn.executemany(_UPSERT_PLAN_SQL, rows)
+        return [row[0] for row in rows]
 
     def list_pending(self, *, limit: int = 25) -> List[Dict[str, Any]]:
         """Return pending queue entries along with their serialized plans."""
@@ -93,8 +165,14 @@ class DossierQueueStore:
             ).fetchall()
         return [self._row_to_dict(row) for row in rows]
 
-    def list_plans(self, *, status: str | None = None, limit: int = 50) -> List[Dict[str, Any]]:
-        """Return queue entries filtered by ``status`` (or all entries when omitted)."""
+    def list_plans(
+        self, *, status: str | None = None, limit: int = 50, include_payload: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Return queue entries filtered by ``status`` (or all entries when omitted).
+
+        Pass ``include_payload=False`` when only queue metadata is needed; the plan JSON is then neither read
+        nor decoded and ``payload`` is ``None``.
+        """
 
         clauses = []
         params: list[Any] = []
@@ -103,7 +181,7 @@ class DossierQueueStore:
             params.append(status)
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         query = f"""
-            SELECT plan_id, status, priority, payload, queued_at, updated_at, error, warnings
+            SELECT plan_id, status, priority, {_payload_column(include_payload)}, queued_at, updated_at, error, warnings
             FROM dossier_queue
             {where}
             ORDER BY updated_at DESC
@@ -112,7 +190,7 @@ class DossierQueueStore:
         params.append(limit)
         with self._connect() as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        return [self._row_to_dict(row, include_payload=include_payload) for row in rows]
 
     def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
         """Return a single queue entry regardless of status."""
@@ -148,31 +226,55 @@ class DossierQueueStore:
     def lease_next(self) -> Optional[Dict[str, Any]]:
         """Atomically lease the next pending entry for processing."""
 
+        # Single statement so the select-and-claim runs atomically without an explicit transaction.
+        # ``fetchall`` drains the cursor so the implicit write transaction ends before the lock is released.
         with self._connect() as conn:
-            conn.execute("BEGIN IMMEDIATE")
-            row = conn.execute(
+            rows = conn.execute(
                 """
-                SELECT plan_id, priority, payload, queued_at, updated_at, warnings
-                FROM dossier_queue
-                WHERE status='pending'
-                ORDER BY queued_at ASC
-                LIMIT 1
+                UPDATE dossier_queue
+                SET status='leased', updated_at=?
+                WHERE plan_id=(
+                    SELECT plan_id
+                    FROM dossier_queue
+                    WHERE status='pending'
+                    ORDER BY queued_at ASC
+                    LIMIT 1
+                )
+                RETURNING plan_id, priority, payload, queued_at, updated_at, warnings
                 """,
-            ).fetchone()
-            if not row:
-                conn.commit()
-                return None
-            plan_id = row["plan_id"] if isinstance(row, sqlite3.Row) else row[0]
-            conn.execute(
+                (datetime.now(timezone.utc).isoformat(),),
+            ).fetchall()
+        if not rows:
+            return None
+        return self._row_to_dict(rows[0])
+
+    def lease_batch(self, limit: int) -> List[Dict[str, Any]]:
+        """Atomically lease up to ``limit`` of the oldest pending entries in one write.
+
+        Entries are returned oldest first, matching repeated :meth:`lease_next` calls.
+        """
+
+        if limit <= 0:
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
                 """
                 UPDATE dossier_queue
                 SET status='leased', updated_at=?
-                WHERE plan_id=?
+                WHERE plan_id IN (
+                    SELECT plan_id
+                    FROM dossier_queue
+                    WHERE status='pending'
+                    ORDER BY queued_at ASC
+                    LIMIT ?
+                )
+                RETURNING plan_id, priority, payload, queued_at, updated_at, warnings, rowid AS queue_rowid
                 """,
-                (datetime.now(timezone.utc).isoformat(), plan_id),
-            )
-            conn.commit()
-        return self._row_to_dict(row)
+                (datetime.now(timezone.utc).isoformat(), limit),
+            ).fetchall()
+        # RETURNING order is unspecified; rowid breaks ties between plans enqueued in the same batch.
+        rows.sort(key=lambda row: (row["queued_at"], row["queue_rowid"]))
+        return [self._row_to_dict(row) for row in rows]
 
     def _update_status(
         self,
@@ -182,7 +284,7 @@ class DossierQueueStore:
         error: Optional[str] = None,
         warnings: Optional[Sequence[str]] = None,
     ) -> None:
-        warnings_payload = json.dumps(list(warnings)) if warnings is not None else None
+        warnings_payload = _dumps(list(warnings)) if warnings is not None else None
         with self._connect() as conn:
             conn.execute(
                 """
@@ -193,7 +295,7 @@ class DossierQueueStore:
                 (status, datetime.now(timezone.utc).isoformat(), error, warnings_payload, plan_id),
             )
 
-    def _row_to_dict(self, row: sqlite3.Row | Tuple[Any, ...]) -> Dict[str, Any]:
+    def _row_to_dict(self, row: sqlite3.Row | Tuple[Any, ...], *, include_payload: bool = True) -> Dict[str, Any]:
         if isinstance(row, sqlite3.Row):
             record = dict(row)
         else:
@@ -216,8 +318,10 @@ class DossierQueueStore:
                     record["queued_at"] = row[3]
                     record["updated_at"] = row[4]
                     record["warnings"] = row[5]
-        payload_raw = record.get("payload")
-        payload = json.loads(payload_raw) if payload_raw else {}
+        payload: Dict[str, Any] | None = None
+        if include_payload:
+            payload_raw = record.get("payload")
+            payload = _json.loads(payload_raw) if payload_raw else {}
         warnings_raw = record.get("warnings")
         result = {
             "plan_id": record.get("plan_id"),
@@ -225,7 +329,7 @@ class DossierQueueStore:
             "payload": payload,
             "queued_at": record.get("queued_at"),
             "updated_at": record.get("updated_at"),
-            "warnings": json.loads(warnings_raw) if warnings_raw else [],
+            "warnings": _json.loads(warnings_raw) if warnings_raw else [],
         }
         if "status" in record:
             result["status"] = record.get("status")
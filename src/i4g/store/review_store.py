@@ -17,6 +17,7 @@ import json
 import sqlite3
 import uuid
 from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set
 
@@ -24,6 +25,10 @@ from i4g.settings import get_settings
 
 SETTINGS = get_settings()
 
+# SQLite builds before 3.32 cap bound parameters at 999 per statement.
+_IN_CLAUSE_CHUNK = 500
+_MEMORY_DB = ":memory:"
+
 
 class ReviewStore:
     """Lightweight SQLite-based review queue and audit logger."""
@@ -33,13 +38,21 @@ class ReviewStore:
         Initialize the ReviewStore, creating tables if they do not exist.
 
         Args:
-            db_path: Path to the SQLite database file.
+            db_path: Path to the SQLite database file, or ``":memory:"`` for a private
+                in-memory database (intended for tests and one-off tooling).
         """
-        resolved = Path(db_path) if db_path else Path(SETTINGS.storage.sqlite_path)
-        if not resolved.is_absolute():
-            resolved = (Path(SETTINGS.project_root) / resolved).resolve()
-        resolved.parent.mkdir(parents=True, exist_ok=True)
-        self.db_path = resolved
+        self._memory_conn: sqlite3.Connection | None = None
+        if db_path == _MEMORY_DB:
+            # Every call shares one connection so the in-memory database outlives each method.
+            self.db_path: str | Path = _MEMORY_DB
+            self._memory_conn = sqlite3.connect(_MEMORY_DB, check_same_thread=False)
+            self._memory_conn.row_factory = sqlite3.Row
+        else:
+            resolved = Path(db_path) if db_path else Path(SETTINGS.storage.sqlite_path)
+            if not resolved.is_absolute():
+                resolved = (Path(SETTINGS.project_root) / resolved).resolve()
+            resolved.parent.mkdir(parents=True, exist_ok=True)
+            self.db_path = resolved
         self._init_tables()
 
     # -------------------------------------------------------------------------
@@ -47,6 +60,8 @@ class ReviewStore:
     # -------------------------------------------------------------------------
     def _connect(self) -> sqlite3.Connection:
         """Return a SQLite connection with row factory set to dict."""
+        if self._memory_conn is not None:
+            return self._memory_conn
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
@@ -85,6 +100,8 @@ class ReviewStore:
             """
         )
 
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_review_queue_case_id ON review_queue (case_id)")
+
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS saved_searches (
@@ -111,7 +128,8 @@ class ReviewStore:
 
         self._create_dossier_view(cur)
         conn.commit()
-        conn.close()
+        if conn is not self._memory_conn:
+            conn.close()
 
     def _create_dossier_view(self, cursor: sqlite3.Cursor) -> None:
         """Create or refresh the dossier candidate metrics view."""
@@ -242,11 +260,15 @@ class ReviewStore:
         if not normalized:
             return {}
 
-        placeholders = ",".join("?" for _ in normalized)
-        query = f"SELECT * FROM review_queue WHERE case_id IN ({placeholders})"
+        cases: Dict[str, Dict[str, Any]] = {}
         with self._connect() as conn:
-            rows = conn.execute(query, tuple(normalized)).fetchall()
-        return {str(row["case_id"]): dict(row) for row in rows}
+            for start in range(0, len(normalized), _IN_CLAUSE_CHUNK):
+                chunk = normalized[start : start + _IN_CLAUSE_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                query = f"SELECT * FROM review_queue WHERE case_id IN ({placeholders})"
+                for row in conn.execute(query, chunk):
+                    cases[str(row["case_id"])] = dict(row)
+        return cases
 
     def update_status(self, review_id: str, status: str, notes: Optional[str] = None) -> None:
         """Update the status (accepted/rejected/etc.) and optional notes."""
@@ -305,33 +327,58 @@ class ReviewStore:
             )
         return normalized_review_id
 
-    def list_dossier_candidates(self, status: str = "accepted", limit: int = 200) -> List[Dict[str, Any]]:
-        """Return aggregated dossier metrics for queue entries."""
+    def list_dossier_candidates(
+        self,
+        status: str = "accepted",
+        limit: int = 200,
+        *,
+        min_loss_usd: Optional[Decimal] = None,
+        since: Optional[datetime] = None,
+        jurisdiction: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return aggregated dossier metrics for queue entries.
+
+        ``min_loss_usd``, ``since``, and ``jurisdiction`` are applied in SQL so rows
+        that cannot qualify for bundling never leave the database. Raises
+        ``sqlite3.OperationalError`` when the metrics view cannot be queried (for
+        example before the structured ``cases`` table exists), so callers can tell
+        an unavailable view apart from an empty result.
+        """
+
+        clauses = ["status = ?"]
+        params: List[Any] = [status]
+        if min_loss_usd is not None:
+            clauses.append("loss_amount_usd >= ?")
+            params.append(float(min_loss_usd))
+        if since is not None:
+            clauses.append("accepted_at >= ?")
+            params.append(since.astimezone(timezone.utc).isoformat())
+        if jurisdiction:
+            clauses.append("jurisdiction = ?")
+            params.append(jurisdiction)
+        params.append(limit)
 
         with self._connect() as conn:
-            try:
-                rows = conn.execute(
-                    """
-                    SELECT
-                        case_id,
-                        status,
-                        accepted_at,
-                        loss_amount_usd,
-                        jurisdiction,
-                        victim_country,
-                        offender_country,
-                        cross_border,
-                        loss_band,
-                        geo_bucket
-                    FROM dossier_candidate_metrics
-                    WHERE status = ?
-                    ORDER BY accepted_at DESC
-                    LIMIT ?
-                    """,
-                    (status, limit),
-                ).fetchall()
-            except sqlite3.OperationalError:
-                return []
+            rows = conn.execute(
+                f"""
+                SELECT
+                    case_id,
+                    status,
+                    accepted_at,
+                    loss_amount_usd,
+                    jurisdiction,
+                    victim_country,
+                    offender_country,
+                    cross_border,
+                    loss_band,
+                    geo_bucket
+                FROM dossier_candidate_metrics
+                WHERE {" AND ".join(clauses)}
+                ORDER BY accepted_at DESC
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
         return [dict(row) for row in rows]
 
     # -------------------------------------------------------------------------
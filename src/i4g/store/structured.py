@@ -16,13 +16,16 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from i4g.settings import get_settings
 from i4g.store.schema import ScamRecord
 
 SETTINGS = get_settings()
 
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older builds.
+_IN_CLAUSE_CHUNK = 500
+
 
 def _ensure_dir_for_db(db_path: str | Path) -> None:
     """Ensure parent directory for the DB file exists."""
@@ -132,6 +135,26 @@ class StructuredStore:
             return None
         return self._row_to_record(row)
 
+    def get_by_ids(self, case_ids: Iterable[str]) -> Dict[str, ScamRecord]:
+        """Retrieve records for several case_ids with batched ``IN`` queries.
+
+        Args:
+            case_ids: Case identifiers to fetch; duplicates are ignored.
+
+        Returns:
+            Mapping of case_id to ScamRecord for the identifiers that exist.
+        """
+        unique_ids = list(dict.fromkeys(case_ids))
+        records: Dict[str, ScamRecord] = {}
+        cur = self._conn.cursor()
+        for start in range(0, len(unique_ids), _IN_CLAUSE_CHUNK):
+            chunk = unique_ids[start : start + _IN_CLAUSE_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            cur.execute(f"SELECT * FROM scam_records WHERE case_id IN ({placeholders})", chunk)
+            for row in cur.fetchall():
+                records[row["case_id"]] = self._row_to_record(row)
+        return records
+
     def _row_to_record(self, row: sqlite3.Row) -> ScamRecord:
         """Convert a sqlite3.Row to ScamRecord."""
         entities = {}
@@ -2,15 +2,79 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import queue
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from i4g.reports import _json
 
 LOGGER = logging.getLogger(__name__)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _build_session() -> requests.Session:
+    """Return a keep-alive session shared by every reporter in the process."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+# HTTP updates are delivered by a single daemon thread so callers never block on the status endpoint.
+_UPDATE_QUEUE: "queue.Queue[tuple[str, Dict[str, Any]]]" = queue.Queue()
+_WORKER: Optional[threading.Thread] = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_drain_updates, name="task-status-reporter", daemon=True)
+            _WORKER.start()
+
+
+def _drain_updates() -> None:
+    while True:
+        url, body = _UPDATE_QUEUE.get()
+        try:
+            _send_update(url, body)
+        finally:
+            _UPDATE_QUEUE.task_done()
+
+
+def _encode_body(body: Dict[str, Any]) -> bytes:
+    return _json.dumps(body)
+
+
+def _send_update(url: str, body: Dict[str, Any]) -> None:
+    try:
+        # Encoded on the worker thread; passing bytes stops requests from re-serializing the body.
+        response = _SESSION.post(url, data=_encode_body(body), headers=_JSON_HEADERS, timeout=5)
+        response.raise_for_status()
+    except Exception as exc:  # pragma: no cover - network/HTTP errors
+        LOGGER.warning("Task status POST failed (%s): %s", url, exc)
+
+
+def flush_updates() -> None:
+    """Block until every queued HTTP status update has been delivered."""
+
+    _UPDATE_QUEUE.join()
+
+
+atexit.register(flush_updates)
 
 
 @dataclass
@@ -61,11 +125,8 @@ class TaskStatusReporter:
 
     def _post_update(self, body: Dict[str, Any]) -> None:
         url = f"{self.endpoint.rstrip('/')}/{self.task_id}/update"
-        try:
-            response = requests.post(url, json=body, timeout=5)
-            response.raise_for_status()
-        except Exception as exc:  # pragma: no cover - network/HTTP errors
-            LOGGER.warning("Task status POST failed (%s): %s", url, exc)
+        _ensure_worker()
+        _UPDATE_QUEUE.put((url, body))
 
     def _update_local_store(self, body: Dict[str, Any]) -> bool:
         try:
@@ -77,4 +138,4 @@ class TaskStatusReporter:
         return True
 
 
-__all__ = ["TaskStatusReporter"]
+__all__ = ["TaskStatusReporter", "flush_updates"]
@@ -14,35 +14,56 @@ It supports:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import re
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, Iterator, List, Optional, TypedDict
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 import i4g.ui.api as ui_api
 
+try:  # pragma: no cover - optional streaming parser
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
+
 # Configuration
 BRAND_DIR = Path(__file__).parent / "assets" / "branding"
 LOGO_FULL = BRAND_DIR / "primary-color.png"
 LOGO_MARK = BRAND_DIR / "logomark.png"
-PAGE_ICON = str(LOGO_MARK) if LOGO_MARK.exists() else "🕵️"
-
-TAG_PAL = [
-    "#E0BBE4",
-    "#957DAD",
-    "#D291BC",
-    "#FEC8D8",
-    "#FFDFD3",
-    "#C5E1A5",
-    "#B2DFDB",
-]
+
+
+@st.cache_resource(show_spinner=False)
+def _logo_paths() -> tuple[Optional[str], Optional[str]]:
+    """Resolve the branding assets once per process instead of stat-ing them on every rerun."""
+
+    return (
+        str(LOGO_FULL) if LOGO_FULL.exists() else None,
+        str(LOGO_MARK) if LOGO_MARK.exists() else None,
+    )
+
+
+LOGO_FULL_PATH, LOGO_MARK_PATH = _logo_paths()
+PAGE_ICON = LOGO_MARK_PATH or "🕵️"
 
 ACCOUNT_CATEGORY_OPTIONS = ["bank", "crypto", "payments", "ip", "browser", "asn"]
 ACCOUNT_FORMAT_OPTIONS = ["pdf", "xlsx", "csv", "json"]
+QUEUE_PAGE_SIZE = 25
 ACCOUNT_LIST_MAX_TOP_K = ui_api.SETTINGS.account_list.max_top_k or 500
+_DEFAULT_LIMIT = ui_api.SETTINGS.search.default_limit
+_SCHEMA_VERSION = (
+    ui_api.SETTINGS.search.saved_search.schema_version or ui_api.SETTINGS.search.saved_search.migration_tag or None
+)
+from i4g.reports import _json
 from i4g.reports.dossier_signatures import ManifestVerificationReport, verify_manifest_payload
+from i4g.ui.saved_search_views import filter_saved_searches_by_tag, saved_search_tag_options, tag_badges
 from i4g.ui.state import ensure_session_defaults
 from i4g.ui.views import render_discovery_engine_panel
 
@@ -56,83 +77,70 @@ class SavedSearchDescriptor(TypedDict, total=False):
     tags: List[str]
 
 
-def _clean_descriptor_text(value: Any) -> Optional[str]:
-    """Return a trimmed string or ``None`` for falsy/unsupported values."""
-
-    if isinstance(value, str):
-        text = value.strip()
-        return text or None
-    return None
+# Descriptor fields and the payload keys they may be read from, in priority order.
+_DESCRIPTOR_FIELD_KEYS = (
+    ("id", ("saved_search_id", "search_id", "id")),
+    ("name", ("saved_search_name", "name")),
+    ("owner", ("saved_search_owner", "owner")),
+)
 
 
 def _normalize_descriptor_tags(values: Any) -> List[str]:
     """Return a deduplicated list of descriptor tags."""
 
-    tags: List[str] = []
-    if isinstance(values, list):
-        for entry in values:
-            if isinstance(entry, str):
-                cleaned = entry.strip()
-                if cleaned:
-                    tags.append(cleaned)
-    elif isinstance(values, str):
-        cleaned = values.strip()
-        if cleaned:
-            tags.append(cleaned)
-    seen: set[str] = set()
-    deduped: List[str] = []
-    for tag in tags:
-        if tag in seen:
-            continue
-        seen.add(tag)
-        deduped.append(tag)
-    return deduped
+    entries = values if isinstance(values, list) else [values]
+    cleaned = (entry.strip() for entry in entries if isinstance(entry, str) and entry.strip())
+    return list(dict.fromkeys(cleaned))
 
 
-def _extract_saved_search_descriptor(source: Optional[Dict[str, Any]]) -> Optional[SavedSearchDescriptor]:
-    """Normalize descriptor fields from heterogeneous saved-search payloads."""
+def _combine_saved_search_descriptors(*sources: Optional[Dict[str, Any]]) -> Optional[SavedSearchDescriptor]:
+    """Merge saved-search descriptor fields from payloads in priority order.
 
-    if not isinstance(source, dict):
-        return None
-    candidates = [source]
-    nested = source.get("saved_search")
-    if isinstance(nested, dict):
-        candidates.append(nested)
+    Each source is checked along with its nested ``saved_search`` dict; the first
+    non-empty value wins for scalar fields while tags accumulate across sources.
+    """
 
     descriptor: SavedSearchDescriptor = {}
     collected_tags: List[str] = []
-    for data in candidates:
-        identifier = _clean_descriptor_text(data.get("saved_search_id") or data.get("search_id") or data.get("id"))
-        if identifier and "id" not in descriptor:
-            descriptor["id"] = identifier
+    for source in sources:
+        if not isinstance(source, dict):
+            continue
+        nested = source.get("saved_search")
+        for data in (source, nested) if isinstance(nested, dict) else (source,):
+            for field, keys in _DESCRIPTOR_FIELD_KEYS:
+                if field in descriptor:
+                    continue
+                for key in keys:
+                    value = data.get(key)
+                    if isinstance(value, str) and value.strip():
+                        descriptor[field] = value.strip()
+                        break
+            raw_tags = data.get("saved_search_tags") or data.get("tags")
+            if raw_tags:
+                collected_tags.extend(_normalize_descriptor_tags(raw_tags))
 
-        name = _clean_descriptor_text(data.get("saved_search_name") or data.get("name"))
-        if name and "name" not in descriptor:
-            descriptor["name"] = name
+    if collected_tags:
+        descriptor["tags"] = list(dict.fromkeys(collected_tags))
+    return descriptor or None
 
-        owner = _clean_descriptor_text(data.get("saved_search_owner") or data.get("owner"))
-        if owner and "owner" not in descriptor:
-            descriptor["owner"] = owner
 
-        collected_tags.extend(_normalize_descriptor_tags(data.get("saved_search_tags") or data.get("tags")))
+def _default_schema_version() -> Optional[str]:
+    return _SCHEMA_VERSION
 
-    if collected_tags:
-        descriptor["tags"] = _normalize_descriptor_tags(collected_tags)
 
-    if descriptor:
-        return descriptor
-    return None
+class _NormalizedSearchParams(dict):
+    """Params already passed through ``_normalize_ui_saved_search_params``.
 
-
-def _default_schema_version() -> Optional[str]:
-    return (
-        ui_api.SETTINGS.search.saved_search.schema_version or ui_api.SETTINGS.search.saved_search.migration_tag or None
-    )
+    The marker lives on the type rather than in a sentinel key so it never leaks
+    into saved-search payloads or previews; plain ``dict`` copies drop it.
+    """
 
 
 def _normalize_ui_saved_search_params(raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    params = dict(raw or {})
-    limit = _clamp_limit(params.get("limit") or params.get("page_size") or ui_api.SETTINGS.search.default_limit)
+    if isinstance(raw, _NormalizedSearchParams):
+        return raw
+    params = _NormalizedSearchParams(raw or {})
+    limit = _clamp_limit(params.get("limit") or params.get("page_size") or _DEFAULT_LIMIT)
     params["limit"] = limit
     params["page_size"] = params.get("page_size") or limit
     params["vector_limit"] = params.get("vector_limit") or limit
@@ -165,10 +173,9 @@ def _normalize_ui_saved_search_params(raw: Optional[Dict[str, Any]]) -> Dict[str
 
     time_range = params.get("time_range")
     if isinstance(time_range, dict) and "start" in time_range and "end" in time_range:
-        params["time_range"] = {
-            "start": time_range["start"],
-            "end": time_range["end"],
-        }
+        # Reuse ranges that already have exactly the start/end shape.
+        if len(time_range) != 2:
+            params["time_range"] = {"start": time_range["start"], "end": time_range["end"]}
     else:
         params["time_range"] = None
 
@@ -180,13 +187,14 @@ def _normalize_ui_saved_search_params(raw: Optional[Dict[str, Any]]) -> Dict[str
     return params
 
 
-def _build_hybrid_request_from_params(
-    params: Dict[str, Any],
+def _build_hybrid_request_fast(
+    normalized: Dict[str, Any],
     *,
     offset: int,
-    descriptor: Optional[Dict[str, Any]] = None,
+    descriptor_fields: Optional[SavedSearchDescriptor] = None,
 ) -> Dict[str, Any]:
-    normalized = _normalize_ui_saved_search_params(params)
+    """Build the hybrid-search request from already-normalized params and descriptor."""
+
     request: Dict[str, Any] = {
         "text": normalized.get("text") or None,
         "classifications": normalized.get("classifications"),
@@ -200,20 +208,30 @@ def _build_hybrid_request_from_params(
         "structured_limit": normalized["structured_limit"],
         "offset": max(offset, 0),
     }
-    descriptor_payload = _combine_saved_search_descriptors(descriptor, normalized)
-    if descriptor_payload:
-        if descriptor_payload.get("id"):
-            request["saved_search_id"] = descriptor_payload["id"]
-        if descriptor_payload.get("name"):
-            request["saved_search_name"] = descriptor_payload["name"]
-        if descriptor_payload.get("owner"):
-            request["saved_search_owner"] = descriptor_payload["owner"]
-        tags = descriptor_payload.get("tags") or []
+    if descriptor_fields:
+        if descriptor_fields.get("id"):
+            request["saved_search_id"] = descriptor_fields["id"]
+        if descriptor_fields.get("name"):
+            request["saved_search_name"] = descriptor_fields["name"]
+        if descriptor_fields.get("owner"):
+            request["saved_search_owner"] = descriptor_fields["owner"]
+        tags = descriptor_fields.get("tags") or []
         if tags:
             request["saved_search_tags"] = tags
     return request
 
 
+def _build_hybrid_request_from_params(
+    params: Dict[str, Any],
+    *,
+    offset: int,
+    descriptor: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    normalized = _normalize_ui_saved_search_params(params)
+    descriptor_fields = _combine_saved_search_descriptors(descriptor, normalized)
+    return _build_hybrid_request_fast(normalized, offset=offset, descriptor_fields=descriptor_fields)
+
+
 def _create_saved_search_params(
     *,
     text: Optional[str],
@@ -256,12 +274,16 @@ def _ensure_list(values: Any) -> List[str]:
 
 
 def _clamp_limit(value: Any) -> int:
-    try:
+    if isinstance(value, int):
+        number = value
+    elif isinstance(value, str) and value.isdecimal():
         number = int(value)
-    except (TypeError, ValueError):
-        number = ui_api.SETTINGS.search.default_limit
-    number = max(1, min(number, 100))
-    return number
+    else:
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            number = _DEFAULT_LIMIT
+    return 100 if number > 100 else 1 if number < 1 else number
 
 
 def _date_to_iso(value: date, *, use_end_of_day: bool = False) -> str:
@@ -274,6 +296,12 @@ def _date_to_iso(value: date, *, use_end_of_day: bool = False) -> str:
 def _iso_to_date(value: str | None) -> date | None:
     if not value:
         return None
+    # Fast path for the YYYY-MM-DD prefix that _date_to_iso emits.
+    if value[4:5] == "-" and value[7:8] == "-":
+        try:
+            return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        except ValueError:
+            pass
     try:
         parsed = datetime.fromisoformat(value)
     except ValueError:
@@ -281,6 +309,11 @@ def _iso_to_date(value: str | None) -> date | None:
     return parsed.date()
 
 
+_VALID_MATCH_MODES = frozenset({"exact", "prefix", "contains"})
+# Plain decimal amounts with optional thousands separators ("2500", "2,500.75", "-.5").
+_LOSS_AMOUNT_RE = re.compile(r"\s*-?(?=\.?\d)(?:\d{1,3}(?:,\d{3})+|\d+)?(?:\.\d*)?\s*")
+
+
 def _canonical_entity_filters(raw_filters: Any) -> List[Dict[str, str]]:
     canonical: List[Dict[str, str]] = []
     for entry in raw_filters or []:
@@ -288,16 +321,15 @@ def _canonical_entity_filters(raw_filters: Any) -> List[Dict[str, str]]:
             continue
         indicator_type = entry.get("type")
         value = (entry.get("value") or "").strip()
-        match_mode = (entry.get("match_mode") or "exact").lower()
         if not indicator_type or not value:
             continue
-        canonical.append(
-            {
-                "type": str(indicator_type),
-                "value": value,
-                "match_mode": match_mode if match_mode in ("exact", "prefix", "contains") else "exact",
-            }
-        )
+        match_mode = entry.get("match_mode")
+        if match_mode not in _VALID_MATCH_MODES:
+            # Only non-canonical values pay for lowercasing.
+            match_mode = match_mode.lower() if isinstance(match_mode, str) else "exact"
+            if match_mode not in _VALID_MATCH_MODES:
+                match_mode = "exact"
+        canonical.append({"type": str(indicator_type), "value": value, "match_mode": match_mode})
     return canonical
 
 
@@ -345,50 +377,88 @@ def run_search(
     params: Dict[str, Any],
     offset: int,
     *,
-    descriptor: Optional[Dict[str, Any]] = None,
+    descriptor: Optional[SavedSearchDescriptor] = None,
 ) -> None:
+    ss = st.session_state
     canonical = _normalize_ui_saved_search_params(params)
-    st.session_state["search_params"] = canonical
+    # Callers pass descriptors already merged by _combine_saved_search_descriptors; only
+    # fall back to reading the params when paginating or running an ad-hoc search.
+    descriptor_fields = descriptor if descriptor is not None else _combine_saved_search_descriptors(canonical)
+    ss["search_params"] = canonical
     try:
-        st.session_state["case_reviews"] = {}
+        ss["case_reviews"] = {}
         payload = ui_api.search_cases_hybrid_api(
-            _build_hybrid_request_from_params(canonical, offset=offset, descriptor=descriptor)
+            _build_hybrid_request_fast(canonical, offset=offset, descriptor_fields=descriptor_fields)
         )
         results = payload.get("results", [])
-        st.session_state["search_results"] = results
-        st.session_state["search_error"] = None
-        st.session_state["search_offset"] = payload.get("offset", offset)
-        st.session_state["search_more_available"] = len(results) == canonical["page_size"]
-        st.session_state["search_meta"] = {
+        ss["search_results"] = results
+        ss["search_error"] = None
+        ss["search_offset"] = payload.get("offset", offset)
+        ss["search_more_available"] = len(results) == canonical["page_size"]
+        ss["search_meta"] = {
             "total": payload.get("total"),
             "vector_hits": payload.get("vector_hits"),
             "structured_hits": payload.get("structured_hits"),
             "search_id": payload.get("search_id"),
         }
 
+        # History and saved searches are independent reads; fetch them concurrently so the
+        # search waits on one round-trip rather than two. Workers share the script context
+        # so the cached readers can see session credentials.
+        with ThreadPoolExecutor(
+            max_workers=2, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+        ) as executor:
+            history_future = executor.submit(ui_api.cached_search_history, limit=ss.get("history_limit", 10))
+            saved_future = executor.submit(ui_api.cached_saved_searches, limit=25)
+
         try:
-            history_payload = ui_api.fetch_search_history(limit=st.session_state.get("history_limit", 10))
-            st.session_state["search_history"] = history_payload.get("events", [])
-            st.session_state["search_history_error"] = None
+            history_payload = history_future.result()
+            ss["search_history"] = history_payload.get("events", [])
+            ss["search_history_error"] = None
         except Exception as exc:
-            st.session_state["search_history_error"] = str(exc)
+            ss["search_history_error"] = str(exc)
 
         try:
-            saved_payload = ui_api.fetch_saved_searches(limit=25)
-            st.session_state["saved_searches"] = saved_payload.get("items", [])
-            st.session_state["saved_search_error"] = None
+            saved_payload = saved_future.result()
+            _store_saved_searches(saved_payload.get("items", []))
+            ss["saved_search_error"] = None
         except Exception as exc:
-            st.session_state["saved_search_error"] = str(exc)
+            ss["saved_search_error"] = str(exc)
     except Exception as exc:
-        st.session_state["search_results"] = None
-        st.session_state["search_error"] = str(exc)
-        st.session_state["search_more_available"] = False
+        ss["search_results"] = None
+        ss["search_error"] = str(exc)
+        ss["search_more_available"] = False
+
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _intake_overview_markdown(intake_id: str, updated_at: Any, job_status: Any, _item: Dict[str, Any]) -> str:
+    """Format the static part of an intake expander once per intake revision.
 
-def _refresh_intakes(limit: Optional[int] = None) -> None:
+    Keyed on the id, update stamp and job status so the per-rerun cost for an
+    unchanged intake is a cache lookup; ``_item`` itself is not hashed.
+    """
+
+    item = _item
+    lines = [
+        f"Submitted {item.get('created_at', 'unknown')} · Updated {item.get('updated_at', 'unknown')}",
+        f"Reporter: {item.get('reporter_name', 'n/a')} · Submitted by: {item.get('submitted_by') or 'unknown'}",
+    ]
+    contact_parts = [
+        part for part in (item.get("contact_email"), item.get("contact_phone"), item.get("contact_handle")) if part
+    ]
+    if contact_parts:
+        lines.append("Contact: " + " | ".join(contact_parts))
+    lines.append(f"Source: {item.get('source') or 'unknown'}")
+    if item.get("summary"):
+        lines.extend(("**Summary**", str(item["summary"])))
+    lines.append(f"Job status: {job_status or 'pending'}")
+    return "\n\n".join(lines)
+
+
+def _refresh_intakes(limit: Optional[int] = None, *, force: bool = False) -> None:
     requested = limit or st.session_state.get("intake_list_limit", 25) or 25
     try:
-        payload = ui_api.list_intakes(limit=requested)
+        payload = ui_api.cached_intakes(limit=requested, force=force)
         st.session_state["intake_items"] = payload.get("items", [])
         st.session_state["intake_error"] = None
     except Exception as exc:
@@ -432,35 +502,39 @@ def _execute_saved_search(
     params: Dict[str, Any],
     descriptor: Optional[Dict[str, Any]] = None,
 ) -> None:
+    ss = st.session_state
     normalized = _normalize_ui_saved_search_params(params)
-    st.session_state["active_saved_search_id"] = saved_id
-    st.session_state["search_text_input"] = normalized.get("text", "") or ""
-    st.session_state["search_class_input"] = normalized.get("classification", "") or ""
-    st.session_state["search_case_input"] = normalized.get("case_id", "") or ""
-    st.session_state["search_vector_limit_slider"] = min(max(normalized.get("vector_limit", 5), 1), 20)
-    st.session_state["search_structured_limit_slider"] = min(max(normalized.get("structured_limit", 5), 1), 20)
-    st.session_state["search_page_size_slider"] = min(max(normalized.get("page_size", 5), 1), 20)
-    st.session_state["search_dataset_filters"] = list(normalized.get("datasets") or [])
-    st.session_state["search_loss_filters"] = list(normalized.get("loss_buckets") or [])
-    st.session_state["search_entity_filters"] = list(normalized.get("entities") or [])
+    offset = normalized.get("offset", 0)
+    updates: Dict[str, Any] = {
+        "active_saved_search_id": saved_id,
+        "search_text_input": normalized.get("text", "") or "",
+        "search_class_input": normalized.get("classification", "") or "",
+        "search_case_input": normalized.get("case_id", "") or "",
+        "search_vector_limit_slider": min(max(normalized.get("vector_limit", 5), 1), 20),
+        "search_structured_limit_slider": min(max(normalized.get("structured_limit", 5), 1), 20),
+        "search_page_size_slider": min(max(normalized.get("page_size", 5), 1), 20),
+        "search_dataset_filters": list(normalized.get("datasets") or []),
+        "search_loss_filters": list(normalized.get("loss_buckets") or []),
+        "search_entity_filters": list(normalized.get("entities") or []),
+        "search_params": normalized,
+        "search_offset": offset,
+    }
     time_range = normalized.get("time_range") or None
     if time_range:
-        st.session_state["search_time_filter_enabled"] = True
-        st.session_state["search_time_start"] = (
-            _iso_to_date(time_range.get("start")) or st.session_state["search_time_start"]
-        )
-        st.session_state["search_time_end"] = _iso_to_date(time_range.get("end")) or st.session_state["search_time_end"]
+        start_date = _iso_to_date(time_range.get("start"))
+        end_date = _iso_to_date(time_range.get("end"))
+        updates["search_time_filter_enabled"] = True
+        updates["search_time_start"] = start_date or ss["search_time_start"]
+        updates["search_time_end"] = end_date or ss["search_time_end"]
     else:
-        st.session_state["search_time_filter_enabled"] = False
-        st.session_state["search_time_preset"] = None
-    st.session_state["search_params"] = normalized
-    offset = normalized.get("offset", 0)
-    st.session_state["search_offset"] = offset
+        updates["search_time_filter_enabled"] = False
+        updates["search_time_preset"] = None
+    ss.update(updates)
     descriptor_payload = dict(descriptor or {})
     if descriptor_payload:
         if not descriptor_payload.get("search_id") and not descriptor_payload.get("saved_search_id"):
             descriptor_payload["search_id"] = saved_id
-    descriptor_details = _extract_saved_search_descriptor(descriptor_payload)
+    descriptor_details = _combine_saved_search_descriptors(descriptor_payload)
     if descriptor_details:
         if descriptor_details.get("id"):
             normalized["saved_search_id"] = descriptor_details["id"]
@@ -474,16 +548,245 @@ def _execute_saved_search(
     st.rerun()
 
 
-def _tag_badge(tag: str) -> str:
-    color = TAG_PAL[hash(tag) % len(TAG_PAL)]
-    return f"<span style='background:{color}; padding:2px 6px; border-radius:6px; margin-right:4px;'>{tag}</span>"
+def _saved_search_grid_row(item: Dict[str, Any], selected_ids: set[str]) -> Dict[str, Any]:
+    return {
+        "select": item.get("search_id") in selected_ids,
+        "favorite": bool(item.get("favorite")),
+        "name": item.get("name") or item.get("search_id") or "",
+        "tags": ", ".join(item.get("tags") or []),
+        "owner": item.get("owner") or "shared",
+        "created_at": item.get("created_at") or "",
+        "search_id": item.get("search_id"),
+    }
+
+
+def _saved_search_grid_changes(
+    items: List[Dict[str, Any]], edited_deltas: Dict[Any, Dict[str, Any]]
+) -> List[tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Pair edited saved searches with their changed favorite/name/tags fields.
+
+    ``edited_deltas`` is the data editor's ``edited_rows`` state, so only rows the
+    user touched are inspected.
+    """
+
+    changes: List[tuple[Dict[str, Any], Dict[str, Any]]] = []
+    for index, delta in edited_deltas.items():
+        item = items[int(index)]
+        original = _saved_search_grid_row(item, set())
+        patch: Dict[str, Any] = {}
+        if "favorite" in delta and bool(delta["favorite"]) != original["favorite"]:
+            patch["favorite"] = bool(delta["favorite"])
+        name = (delta.get("name") or "").strip()
+        if name and name != original["name"]:
+            patch["name"] = name
+        if "tags" in delta and (delta["tags"] or "") != original["tags"]:
+            patch["tags"] = ui_api._parse_tags(delta["tags"] or "")
+        if patch:
+            changes.append((item, patch))
+    return changes
+
+
+def _apply_bulk_tag_update(
+    tags: List[str],
+    *,
+    add: List[str],
+    remove: List[str],
+    replace: Optional[List[str]],
+) -> List[str]:
+    """Mirror ``ReviewStore.bulk_update_tags`` so a bulk edit can be applied locally."""
+
+    if replace is not None:
+        updated = [tag.strip() for tag in replace if tag.strip()]
+    else:
+        removed = {tag.strip().lower() for tag in remove if tag.strip()}
+        updated = [tag for tag in tags if tag.lower() not in removed]
+        updated.extend(tag.strip() for tag in add if tag.strip())
+    deduped: Dict[str, str] = {}
+    for tag in updated:
+        deduped.setdefault(tag.lower(), tag)
+    return list(deduped.values())
+
+
+def _bump_saved_search_grid() -> int:
+    """Start a fresh saved-search grid widget, discarding its pending edits."""
+
+    version = st.session_state.get("saved_search_grid_version", 0) + 1
+    st.session_state["saved_search_grid_version"] = version
+    return version
+
+
+def _history_table(history_events: List[Dict[str, Any]]) -> tuple[str, List[Dict[str, Any]]]:
+    """Return the history markdown table and the per-entry data the Run control needs."""
+
+    history_entries: List[Dict[str, Any]] = []
+    table_lines = ["| # | Search | When | Actor | Saved | Query | Tags |", "|---|---|---|---|---|---|---|"]
+    for position, event in enumerate(history_events, start=1):
+        payload = event.get("payload", {})
+        request_snapshot = payload.get("request") if isinstance(payload.get("request"), dict) else None
+        summary_source = request_snapshot or payload
+        timestamp = event.get("created_at", "unknown time")
+        actor = event.get("actor", "unknown")
+        summary = summary_source.get("text") or summary_source.get("case_id") or "(no query)"
+        search_key = payload.get("search_id", event.get("action_id"))
+        descriptor_payload = _combine_saved_search_descriptors(payload, request_snapshot)
+        descriptor_label = descriptor_payload.get("name") if descriptor_payload else None
+        tags = (descriptor_payload.get("tags") if descriptor_payload else None) or payload.get("tags") or []
+        cells = (
+            str(position),
+            f"`{search_key}`" if search_key else "(no id)",
+            str(timestamp),
+            str(actor),
+            f"**{descriptor_label}**" if descriptor_label else "",
+            f"`{summary}`" if summary else "",
+            tag_badges(tuple(tags)),
+        )
+        table_lines.append("| " + " | ".join(cell.replace("|", "\\|").replace("\n", " ") for cell in cells) + " |")
+        saved_id_for_run = descriptor_payload.get("id") if descriptor_payload else None
+        history_entries.append(
+            {
+                "label": f"#{position} · {descriptor_label or summary or search_key}",
+                "payload": payload,
+                "request": request_snapshot,
+                "search_key": search_key,
+                "summary": summary,
+                "descriptor": descriptor_payload,
+                "descriptor_label": descriptor_label,
+                "saved_id": saved_id_for_run or search_key,
+            }
+        )
+    return "\n".join(table_lines), history_entries
+
+
+def _store_saved_searches(items: List[Dict[str, Any]]) -> None:
+    """Replace the session's saved searches and the ``search_id`` index kept alongside them."""
+
+    st.session_state["saved_searches"] = items
+    st.session_state["saved_searches_by_id"] = {item["search_id"]: item for item in items if item.get("search_id")}
+
+
+def _sort_saved_searches(items: List[Dict[str, Any]]) -> None:
+    """Order saved searches in place the way the API lists them: favorites first, newest first."""
+
+    items.sort(key=lambda item: (bool(item.get("favorite")), item.get("created_at") or ""), reverse=True)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _indicators_frame(request_id: str, _indicators: List[Dict[str, Any]]) -> Any:
+    """Build the indicators DataFrame once per extraction request.
+
+    ``_indicators`` is excluded from the cache key; the request id already
+    identifies the payload, so reruns skip hashing and re-tabulating the list.
+    """
+
+    import pandas as pd  # Streamlit dependency; imported lazily like st.dataframe does.
+
+    return pd.DataFrame(_indicators)
+
+
+def _dumps_params_json(params: Dict[str, Any]) -> str:
+    """Return search parameters as sorted, indented JSON text for previews."""
+
+    return _json.dumps(params, indent=True, sort_keys=True, non_str_keys=True, default=str).decode("utf-8")
+
+
+_SEARCH_CSV_FIELDS = ("case_id", "score", "sources", "vector", "record")
+
+
+def _iter_search_results_csv(results: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield the search-results CSV one encoded line at a time."""
+
+    import csv
+    from io import StringIO
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def _flush() -> bytes:
+        line = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(_SEARCH_CSV_FIELDS)
+    yield _flush()
+    for result in results:
+        writer.writerow(
+            (
+                result.get("case_id"),
+                result.get("score"),
+                ",".join(result.get("sources", [])),
+                _json.dumps(result.get("vector", {})).decode("utf-8"),
+                _json.dumps(result.get("record", {})).decode("utf-8"),
+            )
+        )
+        yield _flush()
+
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _search_results_csv(search_id: str, offset: int, _results: List[Dict[str, Any]]) -> bytes:
+    """Serialize a page of search results once per ``(search_id, offset)``.
+
+    ``_results`` is excluded from the cache key, so unrelated reruns reuse the
+    encoded page instead of re-running ``json.dumps`` on every record.
+    """
+
+    return b"".join(_iter_search_results_csv(_results))
+
+
+def _iter_uploaded_json(upload: Any) -> Iterator[Any]:
+    """Yield entries from an uploaded JSON array, or the single uploaded object.
+
+    Arrays are streamed with ``ijson`` when it is installed so large exports are
+    parsed one entry at a time instead of being decoded into a full list first.
+    """
+
+    first = b""
+    while not first:
+        chunk = upload.read(64)
+        if not chunk:
+            break
+        first = chunk.lstrip().lstrip(b"\xef\xbb\xbf")[:1]
+    upload.seek(0)
+    if first == b"[" and ijson is not None:
+        yield from ijson.items(upload, "item", use_float=True)
+        return
+    data = json.load(upload)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+_JSON_UPLOAD_CACHE_SIZE = 4
+
+
+def _uploaded_json_entries(upload: Any) -> List[Any]:
+    """Return the entries of an uploaded JSON file, parsing each distinct upload once.
+
+    Parsed entries are kept in a small per-session LRU keyed by a digest of the
+    upload bytes, so the same export dropped into both importers (or kept in an
+    uploader across reruns) is decoded a single time.
+    """
+
+    with upload.getbuffer() as view:
+        digest = hashlib.blake2b(view, digest_size=16).hexdigest()
+    cache: OrderedDict[str, List[Any]] = st.session_state.setdefault("_json_upload_cache", OrderedDict())
+    entries = cache.get(digest)
+    if entries is not None:
+        cache.move_to_end(digest)
+        return entries
+    entries = list(_iter_uploaded_json(upload))
+    cache[digest] = entries
+    while len(cache) > _JSON_UPLOAD_CACHE_SIZE:
+        cache.popitem(last=False)
+    return entries
 
 
 def _ensure_search_schema(force: bool = False) -> None:
     if not force and st.session_state.get("search_schema"):
         return
     try:
-        schema = ui_api.fetch_search_schema()
+        schema = ui_api.cached_search_schema(force=force)
         st.session_state["search_schema"] = schema
         st.session_state["search_schema_error"] = None
     except Exception as exc:  # pragma: no cover - interactive UI path
@@ -494,8 +797,8 @@ st.set_page_config(page_title="i4g Analyst Dashboard", page_icon=PAGE_ICON, layo
 
 header_cols = st.columns([1, 6])
 with header_cols[0]:
-    if LOGO_FULL.exists():
-        st.image(str(LOGO_FULL), width="stretch")
+    if LOGO_FULL_PATH:
+        st.image(LOGO_FULL_PATH, width="stretch")
 with header_cols[1]:
     st.title("i4g Analyst Dashboard (API-backed)")
 
@@ -504,8 +807,8 @@ ensure_session_defaults()
 _ensure_search_schema()
 
 st.sidebar.header("Connection")
-if LOGO_MARK.exists():
-    st.sidebar.image(str(LOGO_MARK), width=120)
+if LOGO_MARK_PATH:
+    st.sidebar.image(LOGO_MARK_PATH, width=120)
     st.sidebar.markdown("**Intelligence for Good**")
 st.sidebar.text_input("API Base URL", key="api_base")
 st.sidebar.text_input("API Key", key="api_key")
@@ -556,158 +859,170 @@ with st.sidebar.form("case_search_form"):
     )
     search_submitted = st.form_submit_button("Search")
 
-st.session_state["search_vector_limit_value"] = st.session_state["search_vector_limit_slider"]
-st.session_state["search_structured_limit_value"] = st.session_state["search_structured_limit_slider"]
-st.session_state["search_page_size_value"] = st.session_state["search_page_size_slider"]
-st.session_state["preview_enabled"] = preview_enabled
-
-with st.sidebar.expander("Advanced filters", expanded=False):
-    schema = st.session_state.get("search_schema") or {}
-    schema_error = st.session_state.get("search_schema_error")
-    refresh_requested = st.button("Refresh schema", key="refresh_search_schema")
-    if refresh_requested:
-        _ensure_search_schema(force=True)
-        st.experimental_rerun()
-    if schema_error:
-        st.warning(f"Schema unavailable: {schema_error}")
-
-    dataset_options = schema.get("datasets", [])
-    dataset_defaults = [
-        value for value in st.session_state.get("search_dataset_filters", []) if value in dataset_options
-    ]
-    st.multiselect(
-        "Datasets",
-        options=dataset_options,
-        default=dataset_defaults,
-        help="Restrict search results to specific ingestion datasets.",
-        key="search_dataset_filters",
-    )
+# The slider return values are the current widget state; keep them as locals for the
+# rest of the script instead of reading the mirrored session keys back repeatedly.
+ss = st.session_state
+ss["search_vector_limit_value"] = search_vector_limit
+ss["search_structured_limit_value"] = search_structured_limit
+ss["search_page_size_value"] = search_page_size
+ss["preview_enabled"] = preview_enabled
+
+
+@st.fragment
+def _advanced_filters_fragment() -> None:
+    """Render the advanced filter widgets; interactions rerun only this fragment."""
+
+    with st.expander("Advanced filters", expanded=False):
+        schema = st.session_state.get("search_schema") or {}
+        schema_error = st.session_state.get("search_schema_error")
+        refresh_requested = st.button("Refresh schema", key="refresh_search_schema")
+        if refresh_requested:
+            _ensure_search_schema(force=True)
+            st.rerun(scope="fragment")
+        if schema_error:
+            st.warning(f"Schema unavailable: {schema_error}")
+
+        dataset_options = schema.get("datasets", [])
+        dataset_defaults = [
+            value for value in st.session_state.get("search_dataset_filters", []) if value in dataset_options
+        ]
+        st.multiselect(
+            "Datasets",
+            options=dataset_options,
+            default=dataset_defaults,
+            help="Restrict search results to specific ingestion datasets.",
+            key="search_dataset_filters",
+        )
 
-    loss_options = schema.get("loss_buckets", [])
-    loss_defaults = [value for value in st.session_state.get("search_loss_filters", []) if value in loss_options]
-    st.multiselect(
-        "Loss buckets",
-        options=loss_options,
-        default=loss_defaults,
-        help="Filter by reported loss range when available.",
-        key="search_loss_filters",
-    )
+        loss_options = schema.get("loss_buckets", [])
+        loss_defaults = [value for value in st.session_state.get("search_loss_filters", []) if value in loss_options]
+        st.multiselect(
+            "Loss buckets",
+            options=loss_options,
+            default=loss_defaults,
+            help="Filter by reported loss range when available.",
+            key="search_loss_filters",
+        )
 
-    entity_types = schema.get("indicator_types", [])
-    entity_examples = schema.get("entity_examples") or {}
-    if entity_types:
-        builder_type = st.session_state.get("entity_builder_type") or entity_types[0]
-        if builder_type not in entity_types:
-            builder_type = entity_types[0]
-            st.session_state["entity_builder_type"] = builder_type
-        type_index = entity_types.index(builder_type)
+        entity_types = schema.get("indicator_types", [])
+        entity_examples = schema.get("entity_examples") or {}
+        if entity_types:
+            builder_type = st.session_state.get("entity_builder_type") or entity_types[0]
+            if builder_type not in entity_types:
+                builder_type = entity_types[0]
+                st.session_state["entity_builder_type"] = builder_type
+            type_index = entity_types.index(builder_type)
+            st.selectbox(
+                "Entity type",
+                options=entity_types,
+                index=type_index,
+                key="entity_builder_type",
+            )
+        else:
+            st.info("Entity schema not available; refresh to load indicator types.")
+
+        st.text_input("Entity value", key="entity_builder_value")
+        match_modes = ["exact", "prefix", "contains"]
+        match_mode = st.session_state.get("entity_builder_match_mode") or "exact"
+        if match_mode not in match_modes:
+            match_mode = "exact"
+            st.session_state["entity_builder_match_mode"] = match_mode
         st.selectbox(
-            "Entity type",
-            options=entity_types,
-            index=type_index,
-            key="entity_builder_type",
+            "Match mode",
+            options=match_modes,
+            index=match_modes.index(match_mode),
+            key="entity_builder_match_mode",
         )
-    else:
-        st.info("Entity schema not available; refresh to load indicator types.")
-
-    st.text_input("Entity value", key="entity_builder_value")
-    match_modes = ["exact", "prefix", "contains"]
-    match_mode = st.session_state.get("entity_builder_match_mode") or "exact"
-    if match_mode not in match_modes:
-        match_mode = "exact"
-        st.session_state["entity_builder_match_mode"] = match_mode
-    st.selectbox(
-        "Match mode",
-        options=match_modes,
-        index=match_modes.index(match_mode),
-        key="entity_builder_match_mode",
-    )
-    if st.button("Add entity filter", key="add_entity_filter"):
-        value = (st.session_state.get("entity_builder_value") or "").strip()
-        selected_type = st.session_state.get("entity_builder_type") or (entity_types[0] if entity_types else None)
-        if not selected_type or not value:
-            st.warning("Specify both an entity type and value before adding a filter.")
+        if st.button("Add entity filter", key="add_entity_filter"):
+            value = (st.session_state.get("entity_builder_value") or "").strip()
+            selected_type = st.session_state.get("entity_builder_type") or (entity_types[0] if entity_types else None)
+            if not selected_type or not value:
+                st.warning("Specify both an entity type and value before adding a filter.")
+            else:
+                filters = list(st.session_state.get("search_entity_filters") or [])
+                filters.append(
+                    {
+                        "type": selected_type,
+                        "value": value,
+                        "match_mode": st.session_state.get("entity_builder_match_mode") or "exact",
+                    }
+                )
+                st.session_state["search_entity_filters"] = filters
+                st.session_state["entity_builder_value"] = ""
+                st.rerun(scope="fragment")
+
+        active_entities = st.session_state.get("search_entity_filters") or []
+        if active_entities:
+            st.caption("Active entity filters")
+            for idx, entity in enumerate(active_entities):
+                label = f"{entity.get('type')}: {entity.get('value')} ({entity.get('match_mode', 'exact')})"
+                cols = st.columns([4, 1])
+                cols[0].write(label)
+                if cols[1].button("✕", key=f"remove_entity_{idx}"):
+                    updated = list(active_entities)
+                    updated.pop(idx)
+                    st.session_state["search_entity_filters"] = updated
+                    st.rerun(scope="fragment")
         else:
-            filters = list(st.session_state.get("search_entity_filters") or [])
-            filters.append(
-                {
-                    "type": selected_type,
-                    "value": value,
-                    "match_mode": st.session_state.get("entity_builder_match_mode") or "exact",
-                }
+            st.caption("No entity filters defined.")
+
+        if entity_examples:
+            st.caption("Entity examples")
+            for indicator, samples in entity_examples.items():
+                if not samples:
+                    continue
+                preview = ", ".join(samples[:3])
+                st.markdown(f"- **{indicator}**: {preview}")
+
+        time_enabled = st.checkbox("Filter by time range", key="search_time_filter_enabled")
+        if time_enabled:
+            presets = schema.get("time_presets", [])
+            preset_options = [""] + presets
+            current_preset = st.session_state.get("search_time_preset") or ""
+            if current_preset not in preset_options:
+                current_preset = ""
+                st.session_state["search_time_preset"] = current_preset
+            preset_index = preset_options.index(current_preset)
+            st.selectbox(
+                "Preset window",
+                options=preset_options,
+                index=preset_index,
+                format_func=lambda value: value or "Custom",
+                key="search_time_preset",
+                on_change=_handle_time_preset_change,
             )
-            st.session_state["search_entity_filters"] = filters
+            st.date_input(
+                "Start date",
+                value=st.session_state.get("search_time_start"),
+                key="search_time_start",
+            )
+            st.date_input(
+                "End date",
+                value=st.session_state.get("search_time_end"),
+                key="search_time_end",
+            )
+        else:
+            st.session_state["search_time_preset"] = None
+
+        if st.button("Reset advanced filters", key="reset_advanced_filters"):
+            st.session_state["search_dataset_filters"] = []
+            st.session_state["search_loss_filters"] = []
+            st.session_state["search_entity_filters"] = []
             st.session_state["entity_builder_value"] = ""
-            st.experimental_rerun()
-
-    active_entities = st.session_state.get("search_entity_filters") or []
-    if active_entities:
-        st.caption("Active entity filters")
-        for idx, entity in enumerate(active_entities):
-            label = f"{entity.get('type')}: {entity.get('value')} ({entity.get('match_mode', 'exact')})"
-            cols = st.columns([4, 1])
-            cols[0].write(label)
-            if cols[1].button("✕", key=f"remove_entity_{idx}"):
-                updated = list(active_entities)
-                updated.pop(idx)
-                st.session_state["search_entity_filters"] = updated
-                st.experimental_rerun()
-    else:
-        st.caption("No entity filters defined.")
-
-    if entity_examples:
-        st.caption("Entity examples")
-        for indicator, samples in entity_examples.items():
-            if not samples:
-                continue
-            preview = ", ".join(samples[:3])
-            st.markdown(f"- **{indicator}**: {preview}")
-
-    time_enabled = st.checkbox("Filter by time range", key="search_time_filter_enabled")
-    if time_enabled:
-        presets = schema.get("time_presets", [])
-        preset_options = [""] + presets
-        current_preset = st.session_state.get("search_time_preset") or ""
-        if current_preset not in preset_options:
-            current_preset = ""
-            st.session_state["search_time_preset"] = current_preset
-        preset_index = preset_options.index(current_preset)
-        st.selectbox(
-            "Preset window",
-            options=preset_options,
-            index=preset_index,
-            format_func=lambda value: value or "Custom",
-            key="search_time_preset",
-            on_change=_handle_time_preset_change,
-        )
-        st.date_input(
-            "Start date",
-            value=st.session_state.get("search_time_start"),
-            key="search_time_start",
-        )
-        st.date_input(
-            "End date",
-            value=st.session_state.get("search_time_end"),
-            key="search_time_end",
-        )
-    else:
-        st.session_state["search_time_preset"] = None
+            st.session_state["search_time_filter_enabled"] = False
+            st.session_state["search_time_preset"] = None
+            st.rerun(scope="fragment")
+
 
-    if st.button("Reset advanced filters", key="reset_advanced_filters"):
-        st.session_state["search_dataset_filters"] = []
-        st.session_state["search_loss_filters"] = []
-        st.session_state["search_entity_filters"] = []
-        st.session_state["entity_builder_value"] = ""
-        st.session_state["search_time_filter_enabled"] = False
-        st.session_state["search_time_preset"] = None
-        st.experimental_rerun()
+with st.sidebar:
+    _advanced_filters_fragment()
 
 if st.session_state.get("pending_saved_search_preview"):
     preview = st.session_state["pending_saved_search_preview"]
     with st.container():
         label = preview.get("label") or preview.get("name") or preview.get("id")
         st.info(f"Preview saved search: {label}")
-        st.json(preview.get("params", {}))
+        st.code(preview["params_json"], language="json")
         confirm_col, cancel_col = st.columns([1, 1])
         if confirm_col.button("Run saved search", key="confirm_saved_search_preview"):
             data = st.session_state.pop("pending_saved_search_preview")
@@ -721,7 +1036,7 @@ if st.session_state.get("pending_history_search_preview"):
     with st.container():
         label = history_preview.get("label") or history_preview.get("key")
         st.info(f"Preview history search: {label}")
-        st.json(history_preview.get("params", {}))
+        st.code(history_preview["params_json"], language="json")
         confirm_hist, cancel_hist = st.columns([1, 1])
         if confirm_hist.button("Run history search", key="confirm_history_search_preview"):
             data = st.session_state.pop("pending_history_search_preview")
@@ -734,272 +1049,291 @@ if st.session_state.get("pending_history_search_preview"):
             st.session_state.pop("pending_history_search_preview", None)
             st.rerun()
 
-with st.sidebar.expander("Recent search history", expanded=False):
-    history_limit = st.slider(
-        "Entries to load",
-        5,
-        50,
-        st.session_state["history_limit"],
-        key="history_limit_slider",
-    )
-    if st.button("Refresh history", key="refresh_history_btn"):
-        try:
-            payload = ui_api.fetch_search_history(limit=history_limit)
-            st.session_state["search_history"] = payload.get("events", [])
-            st.session_state["search_history_error"] = None
-            st.session_state["history_limit"] = history_limit
-        except Exception as exc:
-            st.session_state["search_history_error"] = str(exc)
 
-with st.sidebar.expander("Saved searches", expanded=False):
-    if st.button("Refresh saved searches", key="refresh_saved_searches_btn"):
-        try:
-            payload = ui_api.fetch_saved_searches(limit=25)
-            st.session_state["saved_searches"] = payload.get("items", [])
-            st.session_state["saved_search_error"] = None
-        except Exception as exc:
-            st.session_state["saved_search_error"] = str(exc)
+@st.fragment
+def _search_history_fragment() -> None:
+    """Render the history loader without rerunning the results panel on slider drags."""
 
-    if st.button("Export tag presets", key="export_tag_presets_btn"):
-        try:
-            presets = ui_api.fetch_tag_presets()
-            data = json.dumps(presets, indent=2)
-            st.download_button(
-                label="Download Tag Presets",
-                data=data,
-                file_name="tag_presets.json",
-                mime="application/json",
-                key="download_tag_presets",
-            )
-        except RuntimeError as exc:
-            st.error(str(exc))
-    if st.button("Share current tag filters", key="share_tag_filters_btn"):
-        tags_to_share = list(st.session_state.get("tag_filters") or [])
-        if not tags_to_share:
-            st.warning("Select at least one tag filter before sharing.")
-        else:
-            preset_payload = {
-                "name": ", ".join(tags_to_share) or "Preset",
-                "params": {},
-                "tags": tags_to_share,
-            }
+    with st.expander("Recent search history", expanded=False):
+        history_limit = st.slider(
+            "Entries to load",
+            5,
+            50,
+            st.session_state["history_limit"],
+            key="history_limit_slider",
+        )
+        if st.button("Refresh history", key="refresh_history_btn"):
+            try:
+                payload = ui_api.cached_search_history(limit=history_limit, force=True)
+                st.session_state["search_history"] = payload.get("events", [])
+                st.session_state["search_history_error"] = None
+                st.session_state["history_limit"] = history_limit
+            except Exception as exc:
+                st.session_state["search_history_error"] = str(exc)
+            # The history list renders in the main panel, outside this fragment.
+            st.rerun()
+
+
+with st.sidebar:
+    _search_history_fragment()
+
+
+@st.fragment
+def _saved_searches_fragment() -> None:
+    """Render saved-search management; mutations that affect the page trigger a full rerun."""
+
+    with st.expander("Saved searches", expanded=False):
+        if st.button("Refresh saved searches", key="refresh_saved_searches_btn"):
+            try:
+                payload = ui_api.cached_saved_searches(limit=25, force=True)
+                _store_saved_searches(payload.get("items", []))
+                st.session_state["saved_search_error"] = None
+            except Exception as exc:
+                st.session_state["saved_search_error"] = str(exc)
+
+        if st.button("Export tag presets", key="export_tag_presets_btn"):
             try:
-                ui_api.import_saved_search_api(preset_payload)
-                st.success("Tag filter saved as shared preset via saved searches.")
+                presets = ui_api.cached_tag_presets()
+                data = _json.dumps(presets, indent=True)
+                st.download_button(
+                    label="Download Tag Presets",
+                    data=data,
+                    file_name="tag_presets.json",
+                    mime="application/json",
+                    key="download_tag_presets",
+                )
             except RuntimeError as exc:
                 st.error(str(exc))
-    uploaded_file = st.file_uploader("Import saved search (.json)", type=["json"], key="saved_search_import")
-    if uploaded_file is not None:
-        try:
-            content = uploaded_file.read()
-            data = json.loads(content.decode("utf-8"))
-            items = data if isinstance(data, list) else [data]
-            for item in items:
-                ui_api.import_saved_search_api(item)
-            st.success(f"Imported {len(items)} saved search(es).")
-            refreshed = ui_api.fetch_saved_searches(limit=25)
-            st.session_state["saved_searches"] = refreshed.get("items", [])
-            st.session_state["saved_search_error"] = None
-        except RuntimeError as exc:
-            st.error(str(exc))
-        except Exception as exc:
-            st.error(f"Failed to import saved search: {exc}")
-        finally:
-            uploaded_file.close()
-    presets_file = st.file_uploader("Import tag presets (.json)", type=["json"], key="tag_preset_import")
-    if presets_file is not None:
-        try:
-            content = presets_file.read()
-            data = json.loads(content.decode("utf-8"))
-            items = data if isinstance(data, list) else [data]
-            imported = 0
-            for preset in items:
-                tags = preset.get("tags") or []
-                if not tags:
-                    continue
-                if tags not in st.session_state["saved_tag_filters"]:
-                    st.session_state["saved_tag_filters"].append(tags)
+        if st.button("Share current tag filters", key="share_tag_filters_btn"):
+            tags_to_share = list(st.session_state.get("tag_filters") or [])
+            if not tags_to_share:
+                st.warning("Select at least one tag filter before sharing.")
+            else:
+                preset_payload = {
+                    "name": ", ".join(tags_to_share) or "Preset",
+                    "params": {},
+                    "tags": tags_to_share,
+                }
+                try:
+                    ui_api.import_saved_search_api(preset_payload)
+                    st.success("Tag filter saved as shared preset via saved searches.")
+                except RuntimeError as exc:
+                    st.error(str(exc))
+        uploaded_file = st.file_uploader("Import saved search (.json)", type=["json"], key="saved_search_import")
+        if uploaded_file is not None:
+            try:
+                imported = 0
+                for item in _uploaded_json_entries(uploaded_file):
+                    ui_api.import_saved_search_api(item)
                     imported += 1
-            st.success(f"Imported {imported} tag preset(s).")
-        except Exception as exc:
-            st.error(f"Failed to import tag presets: {exc}")
-        finally:
-            presets_file.close()
-    saved_error = st.session_state.get("saved_search_error")
-    if saved_error:
-        st.error(saved_error)
-
-    saved_items = st.session_state.get("saved_searches") or []
-    all_tags = sorted({tag for item in saved_items for tag in (item.get("tags") or [])})
-
-    if "saved_search_tag_filter" not in st.session_state:
-        st.session_state["saved_search_tag_filter"] = list(st.session_state.get("tag_filters") or [])
-
-    if all_tags:
-        cols_tag = st.columns([2, 1])
-        selected_tags = cols_tag[0].multiselect(
-            "Filter by tag",
-            options=all_tags,
-            default=st.session_state.get("saved_search_tag_filter", []),
-            key="saved_search_tag_filter",
-            help="Narrow saved searches by tag label(s).",
-        )
-        st.session_state["tag_filters"] = set(selected_tags)
-        with cols_tag[1]:
-            st.write("")
-            if st.button("Clear filters", key="clear_tag_filters", width="stretch"):
-                st.session_state["tag_filters"] = set()
-                st.session_state["saved_search_tag_filter"] = []
-                selected_tags = []
-        if st.button("Save preset", key="save_tag_filter_preset", disabled=not selected_tags):
-            normalized = sorted({tag.strip() for tag in selected_tags})
-            presets = st.session_state["saved_tag_filters"]
-            if normalized not in presets:
-                presets.append(normalized)
-                st.success("Preset saved for this session.")
-        preset_labels = [", ".join(tags) for tags in st.session_state["saved_tag_filters"]]
-        if preset_labels:
-            preset_choice = st.selectbox(
-                "Load preset",
-                options=["(none)"] + preset_labels,
-                key="tag_filter_preset_select",
-                help="Apply a previously saved tag combination.",
+                st.success(f"Imported {imported} saved search(es).")
+                refreshed = ui_api.cached_saved_searches(limit=25)
+                _store_saved_searches(refreshed.get("items", []))
+                st.session_state["saved_search_error"] = None
+            except RuntimeError as exc:
+                st.error(str(exc))
+            except Exception as exc:
+                st.error(f"Failed to import saved search: {exc}")
+            finally:
+                uploaded_file.close()
+        presets_file = st.file_uploader("Import tag presets (.json)", type=["json"], key="tag_preset_import")
+        if presets_file is not None:
+            tag_presets = st.session_state["saved_tag_filters"]
+            try:
+                imported = 0
+                for preset in _uploaded_json_entries(presets_file):
+                    tags = [str(tag).strip() for tag in preset.get("tags") or [] if str(tag).strip()]
+                    if not tags:
+                        continue
+                    key = frozenset(tags)
+                    if key not in tag_presets:
+                        tag_presets[key] = tags
+                        imported += 1
+                st.success(f"Imported {imported} tag preset(s).")
+            except Exception as exc:
+                st.error(f"Failed to import tag presets: {exc}")
+            finally:
+                presets_file.close()
+        saved_error = st.session_state.get("saved_search_error")
+        if saved_error:
+            st.error(saved_error)
+
+        saved_items = st.session_state.get("saved_searches") or []
+        tag_rows = tuple(tuple(item.get("tags") or ()) for item in saved_items)
+        all_tags = saved_search_tag_options(tag_rows)
+
+        if "saved_search_tag_filter" not in st.session_state:
+            st.session_state["saved_search_tag_filter"] = list(st.session_state.get("tag_filters") or [])
+
+        if all_tags:
+            cols_tag = st.columns([2, 1])
+            selected_tags = cols_tag[0].multiselect(
+                "Filter by tag",
+                options=all_tags,
+                default=st.session_state.get("saved_search_tag_filter", []),
+                key="saved_search_tag_filter",
+                help="Narrow saved searches by tag label(s).",
             )
-            if preset_choice != "(none)":
-                idx = preset_labels.index(preset_choice)
-                chosen = st.session_state["saved_tag_filters"][idx]
-                st.session_state["tag_filters"] = set(chosen)
-                st.session_state["saved_search_tag_filter"] = list(chosen)
-    else:
-        st.caption("Apply tags to saved searches to enable filtering and presets.")
-
-    active_filters = set(st.session_state.get("tag_filters") or [])
-    selected_ids = st.session_state["bulk_selected_saved_searches"]
-    grouped: Dict[str, List[Dict[str, Any]]] = {}
-    filtered_items: List[Dict[str, Any]] = []
-
-    for saved in saved_items:
-        tags = saved.get("tags") or []
-        filter_tags = tags or ["untagged"]
-        if active_filters and not active_filters.intersection(filter_tags):
-            continue
-        filtered_items.append(saved)
-        for tag in filter_tags:
-            grouped.setdefault(tag, []).append(saved)
-
-    if filtered_items:
-        bulk_cols = st.columns([1.2, 1.2, 0.8])
-        if bulk_cols[0].button("Select all filtered", key="bulk_select_all_filtered"):
-            for item in filtered_items:
-                search_id = item.get("search_id")
-                if not search_id:
-                    continue
-                selected_ids.add(search_id)
-                st.session_state[f"saved_select_{search_id}"] = True
-        if bulk_cols[1].button("Clear selection", key="bulk_clear_selection"):
-            selected_ids.clear()
-            for item in saved_items:
-                search_id = item.get("search_id")
-                if not search_id:
-                    continue
-                st.session_state[f"saved_select_{search_id}"] = False
-        bulk_cols[2].markdown(f"**Selected:** {len(selected_ids)}")
-    else:
-        st.info("No saved searches match the current tag filters.")
-
-    if selected_ids:
-        with st.expander(f"Bulk tag update ({len(selected_ids)} selected)", expanded=True):
-            st.caption("IDs: " + ", ".join(list(selected_ids)[:5]) + ("..." if len(selected_ids) > 5 else ""))
-            add_tags_raw = st.text_input("Add tags (comma separated)", key="bulk_tags_add")
-            remove_tags_raw = st.text_input("Remove tags", key="bulk_tags_remove")
-            replace_tags_raw = st.text_input(
-                "Replace tags entirely",
-                key="bulk_tags_replace",
-                help="When provided, replaces the existing tags with this list.",
+            st.session_state["tag_filters"] = set(selected_tags)
+            with cols_tag[1]:
+                st.write("")
+                if st.button("Clear filters", key="clear_tag_filters", width="stretch"):
+                    st.session_state["tag_filters"] = set()
+                    st.session_state["saved_search_tag_filter"] = []
+                    selected_tags = []
+            if st.button("Save preset", key="save_tag_filter_preset", disabled=not selected_tags):
+                key = frozenset(tag.strip() for tag in selected_tags)
+                presets = st.session_state["saved_tag_filters"]
+                if key not in presets:
+                    presets[key] = sorted(key)
+                    st.success("Preset saved for this session.")
+            preset_lookup = {", ".join(tags): tags for tags in st.session_state["saved_tag_filters"].values()}
+            if preset_lookup:
+                preset_choice = st.selectbox(
+                    "Load preset",
+                    options=["(none)", *preset_lookup],
+                    key="tag_filter_preset_select",
+                    help="Apply a previously saved tag combination.",
+                )
+                if preset_choice != "(none)":
+                    chosen = preset_lookup[preset_choice]
+                    st.session_state["tag_filters"] = set(chosen)
+                    st.session_state["saved_search_tag_filter"] = list(chosen)
+        else:
+            st.caption("Apply tags to saved searches to enable filtering and presets.")
+
+        active_filters = set(st.session_state.get("tag_filters") or [])
+        selected_ids = st.session_state["bulk_selected_saved_searches"]
+        filtered_indices = filter_saved_searches_by_tag(tag_rows, frozenset(active_filters))
+        filtered_items = [saved_items[index] for index in filtered_indices]
+
+        if filtered_items:
+            grid_version = st.session_state.setdefault("saved_search_grid_version", 0)
+            bulk_cols = st.columns([1.2, 1.2, 0.8])
+            if bulk_cols[0].button("Select all filtered", key="bulk_select_all_filtered"):
+                selected_ids.update(item["search_id"] for item in filtered_items if item.get("search_id"))
+                grid_version = _bump_saved_search_grid()
+            if bulk_cols[1].button("Clear selection", key="bulk_clear_selection"):
+                selected_ids.clear()
+                grid_version = _bump_saved_search_grid()
+
+            # One editable grid replaces the per-row checkbox/button/expander widgets. The key
+            # carries a version so programmatic selection changes and applied edits reset the
+            # editor's pending deltas, plus a fingerprint of the listed ids so row-indexed deltas
+            # never carry over to a differently filtered list.
+            row_ids = "\x00".join(str(item.get("search_id")) for item in filtered_items)
+            grid_key = f"saved_search_grid_{grid_version}_{zlib.crc32(row_ids.encode('utf-8')):08x}"
+            st.data_editor(
+                [_saved_search_grid_row(item, selected_ids) for item in filtered_items],
+                column_config={
+                    "select": st.column_config.CheckboxColumn("Select", width="small"),
+                    "favorite": st.column_config.CheckboxColumn("★", width="small"),
+                    "name": st.column_config.TextColumn("Name"),
+                    "tags": st.column_config.TextColumn("Tags", help="Comma separated"),
+                    "owner": st.column_config.TextColumn("Owner"),
+                    "created_at": st.column_config.TextColumn("Created"),
+                    "search_id": st.column_config.TextColumn("ID"),
+                },
+                disabled=["owner", "created_at", "search_id"],
+                hide_index=True,
+                num_rows="fixed",
+                key=grid_key,
             )
-            apply_cols = st.columns([1, 1])
-            if apply_cols[0].button("Apply bulk tag update", key="apply_bulk_tag_update"):
-                add_tags = ui_api._parse_tags(add_tags_raw)
-                remove_tags = ui_api._parse_tags(remove_tags_raw)
-                replace_tags = ui_api._parse_tags(replace_tags_raw)
-                if not any([add_tags, remove_tags, replace_tags]):
-                    st.warning("Provide tags to add, remove, or replace before applying.")
+            # Apply only the rows the user touched rather than re-syncing every row.
+            edited_deltas = st.session_state[grid_key].get("edited_rows", {})
+            for index, delta in edited_deltas.items():
+                if "select" not in delta:
+                    continue
+                search_id = filtered_items[int(index)].get("search_id")
+                if delta["select"]:
+                    selected_ids.add(search_id)
                 else:
-                    try:
-                        result = ui_api.bulk_update_saved_search_tags(
-                            list(selected_ids),
-                            add=add_tags or None,
-                            remove=remove_tags or None,
-                            replace=replace_tags or None,
-                        )
-                        updated = result.get("updated", len(selected_ids))
-                        st.success(f"Updated {updated} saved search(es).")
-                        selected_ids.clear()
-                        for item in saved_items:
-                            search_id = item.get("search_id")
-                            if not search_id:
-                                continue
-                            st.session_state[f"saved_select_{search_id}"] = False
-                        st.session_state["bulk_tags_add"] = ""
-                        st.session_state["bulk_tags_remove"] = ""
-                        st.session_state["bulk_tags_replace"] = ""
-                        refreshed = ui_api.fetch_saved_searches(limit=25)
-                        st.session_state["saved_searches"] = refreshed.get("items", [])
-                        st.rerun()
-                    except RuntimeError as exc:
-                        st.error(str(exc))
-            if apply_cols[1].button("Cancel bulk edit", key="cancel_bulk_tag_update"):
-                selected_ids.clear()
-                st.session_state["bulk_tags_add"] = ""
-                st.session_state["bulk_tags_remove"] = ""
-                st.session_state["bulk_tags_replace"] = ""
-                for item in saved_items:
-                    search_id = item.get("search_id")
-                    if not search_id:
-                        continue
-                    st.session_state[f"saved_select_{search_id}"] = False
+                    selected_ids.discard(search_id)
+            bulk_cols[2].markdown(f"**Selected:** {len(selected_ids)}")
 
-    for tag in sorted(grouped):
-        items = grouped[tag]
-        st.markdown(f"#### Tag: `{tag}`")
-        for saved in items:
+            grid_changes = _saved_search_grid_changes(filtered_items, edited_deltas)
+            if grid_changes:
+                try:
+                    for item, changes in grid_changes:
+                        ui_api.patch_saved_search(item["search_id"], **changes)
+                        item.update(changes)
+                except RuntimeError as exc:
+                    st.error(str(exc))
+                except Exception as exc:
+                    st.error(f"Failed to update saved search: {exc}")
+                else:
+                    _sort_saved_searches(saved_items)
+                    _bump_saved_search_grid()
+                    st.rerun(scope="fragment")
+        else:
+            st.info("No saved searches match the current tag filters.")
+
+        if selected_ids:
+            with st.expander(f"Bulk tag update ({len(selected_ids)} selected)", expanded=True):
+                st.caption("IDs: " + ", ".join(list(selected_ids)[:5]) + ("..." if len(selected_ids) > 5 else ""))
+                add_tags_raw = st.text_input("Add tags (comma separated)", key="bulk_tags_add")
+                remove_tags_raw = st.text_input("Remove tags", key="bulk_tags_remove")
+                replace_tags_raw = st.text_input(
+                    "Replace tags entirely",
+                    key="bulk_tags_replace",
+                    help="When provided, replaces the existing tags with this list.",
+                )
+                apply_cols = st.columns([1, 1])
+                if apply_cols[0].button("Apply bulk tag update", key="apply_bulk_tag_update"):
+                    add_tags = ui_api._parse_tags(add_tags_raw)
+                    remove_tags = ui_api._parse_tags(remove_tags_raw)
+                    replace_tags = ui_api._parse_tags(replace_tags_raw)
+                    if not any([add_tags, remove_tags, replace_tags]):
+                        st.warning("Provide tags to add, remove, or replace before applying.")
+                    else:
+                        try:
+                            result = ui_api.bulk_update_saved_search_tags(
+                                list(selected_ids),
+                                add=add_tags or None,
+                                remove=remove_tags or None,
+                                replace=replace_tags or None,
+                            )
+                            updated = result.get("updated", len(selected_ids))
+                            st.success(f"Updated {updated} saved search(es).")
+                            if updated == len(selected_ids):
+                                for item in saved_items:
+                                    if item.get("search_id") in selected_ids:
+                                        item["tags"] = _apply_bulk_tag_update(
+                                            item.get("tags") or [],
+                                            add=add_tags,
+                                            remove=remove_tags,
+                                            replace=replace_tags or None,
+                                        )
+                            else:
+                                # Some ids were not updated server-side; reload the list to resync.
+                                refreshed = ui_api.cached_saved_searches(limit=25)
+                                _store_saved_searches(refreshed.get("items", []))
+                            selected_ids.clear()
+                            _bump_saved_search_grid()
+                            st.session_state["bulk_tags_add"] = ""
+                            st.session_state["bulk_tags_remove"] = ""
+                            st.session_state["bulk_tags_replace"] = ""
+                            st.rerun(scope="fragment")
+                        except RuntimeError as exc:
+                            st.error(str(exc))
+                if apply_cols[1].button("Cancel bulk edit", key="cancel_bulk_tag_update"):
+                    selected_ids.clear()
+                    _bump_saved_search_grid()
+                    st.session_state["bulk_tags_add"] = ""
+                    st.session_state["bulk_tags_remove"] = ""
+                    st.session_state["bulk_tags_replace"] = ""
+
+        # Run/Share/Export/Delete act on a single selected row.
+        selected_saved = [item for item in filtered_items if item.get("search_id") in selected_ids]
+        if len(selected_saved) == 1:
+            saved = selected_saved[0]
             params = saved.get("params", {}) or {}
             name = saved.get("name", saved.get("search_id"))
             saved_id = saved.get("search_id")
-            is_favorite = bool(saved.get("favorite"))
-            tag_badge = " ".join(_tag_badge(t) for t in (saved.get("tags") or []))
+            tag_badge = tag_badges(tuple(saved.get("tags") or ()))
             owner_badge = "(shared)" if saved.get("owner") is None else f"(owner: {saved.get('owner')})"
             st.markdown(f"**{name}** {owner_badge} {tag_badge}", unsafe_allow_html=True)
-            (
-                col_select,
-                col_fav,
-                col_load,
-                col_info,
-                col_share,
-                col_download,
-                col_delete,
-            ) = st.columns([0.6, 0.5, 1, 1, 1, 1, 1])
-            is_selected = saved_id in selected_ids
-            new_selected = col_select.checkbox(
-                "Select",
-                value=is_selected,
-                key=f"saved_select_{saved_id}",
-            )
-            if new_selected and not is_selected:
-                selected_ids.add(saved_id)
-            elif not new_selected and is_selected:
-                selected_ids.discard(saved_id)
-
-            fav_label = "★" if is_favorite else "☆"
-            if col_fav.button(fav_label, key=f"fav_saved_{saved_id}"):
-                try:
-                    ui_api.patch_saved_search(saved_id, favorite=not is_favorite)
-                    st.success(f"{'Pinned' if not is_favorite else 'Unpinned'} '{name}'")
-                    refreshed = ui_api.fetch_saved_searches(limit=25)
-                    st.session_state["saved_searches"] = refreshed.get("items", [])
-                    st.rerun()
-                except Exception as exc:
-                    st.error(f"Failed to toggle favorite: {exc}")
+            col_load, col_share, col_download, col_delete = st.columns([1, 1, 1, 1])
             descriptor_payload: Dict[str, Any] = {"search_id": saved_id, "name": name}
             owner_value = saved.get("owner")
             if owner_value:
@@ -1008,11 +1342,12 @@ with st.sidebar.expander("Saved searches", expanded=False):
             if tag_values:
                 descriptor_payload["tags"] = tag_values
 
-            if col_load.button("Run", key=f"run_saved_{saved_id}"):
+            if col_load.button("Run", key="run_selected_saved_search"):
                 if st.session_state.get("preview_enabled", True):
                     st.session_state["pending_saved_search_preview"] = {
                         "id": saved_id,
                         "params": params,
+                        "params_json": _dumps_params_json(params),
                         "name": name,
                         "label": name or saved_id,
                         "descriptor": descriptor_payload,
@@ -1020,35 +1355,13 @@ with st.sidebar.expander("Saved searches", expanded=False):
                     st.rerun()
                 else:
                     _execute_saved_search(saved_id, params, descriptor=descriptor_payload)
-            with col_info.expander("Details / Rename", expanded=False):
-                st.json(params)
-                st.caption(f"Owner: {saved.get('owner', 'shared')} · Created {saved.get('created_at', 'unknown')}")
-                current_tags = saved.get("tags") or []
-                tag_input = st.text_input(
-                    "Tags (comma separated)",
-                    ", ".join(current_tags),
-                    key=f"tags_{saved_id}",
-                )
-                new_name = st.text_input("Rename", value=name, key=f"rename_{saved_id}")
-                if st.button("Apply rename", key=f"apply_rename_{saved_id}"):
-                    try:
-                        tags_list = ui_api._parse_tags(tag_input)
-                        ui_api.patch_saved_search(saved_id, name=new_name, tags=tags_list)
-                        st.success(f"Renamed to '{new_name}'")
-                        refreshed = ui_api.fetch_saved_searches(limit=25)
-                        st.session_state["saved_searches"] = refreshed.get("items", [])
-                        st.rerun()
-                    except RuntimeError as exc:
-                        st.error(str(exc))
-                    except Exception as exc:
-                        st.error(f"Failed to rename saved search: {exc}")
             if saved.get("owner"):
-                if col_share.button("Share", key=f"share_saved_{saved_id}"):
+                if col_share.button("Share", key="share_selected_saved_search"):
                     try:
                         resp = ui_api.share_saved_search(saved_id)
                         st.success("Shared search published to team scope")
-                        refreshed = ui_api.fetch_saved_searches(limit=25)
-                        st.session_state["saved_searches"] = refreshed.get("items", [])
+                        refreshed = ui_api.cached_saved_searches(limit=25)
+                        _store_saved_searches(refreshed.get("items", []))
                         st.session_state["active_saved_search_id"] = resp.get("search_id")
                         st.rerun()
                     except RuntimeError as exc:
@@ -1057,30 +1370,38 @@ with st.sidebar.expander("Saved searches", expanded=False):
                         st.error(f"Failed to share search: {exc}")
             else:
                 col_share.write(" ")
-            if col_download.button("Export", key=f"export_saved_{saved_id}"):
+            if col_download.button("Export", key="export_selected_saved_search"):
                 try:
-                    record = ui_api.export_saved_search(saved_id)
-                    data = json.dumps(record, indent=2)
                     st.download_button(
                         label="Download JSON",
-                        data=data,
+                        data=ui_api.export_saved_search_bytes(saved_id),
                         file_name=f"saved_search_{saved_id}.json",
                         mime="application/json",
                         key=f"download_btn_{saved_id}",
                     )
                 except RuntimeError as exc:
                     st.error(str(exc))
-            if col_delete.button("Delete", key=f"delete_saved_{saved_id}"):
+            if col_delete.button("Delete", key="delete_selected_saved_search"):
                 try:
                     ui_api.delete_saved_search(saved_id)
                     st.success(f"Deleted saved search '{name}'")
-                    updated = ui_api.fetch_saved_searches(limit=25)
-                    st.session_state["saved_searches"] = updated.get("items", [])
+                    _store_saved_searches([item for item in saved_items if item.get("search_id") != saved_id])
+                    selected_ids.discard(saved_id)
+                    _bump_saved_search_grid()
                     if st.session_state.get("active_saved_search_id") == saved_id:
+                        # The search form's "update current" toggle depends on the active id.
                         st.session_state["active_saved_search_id"] = None
-                    st.rerun()
+                        st.rerun()
+                    st.rerun(scope="fragment")
                 except Exception as exc:
                     st.error(f"Failed to delete saved search: {exc}")
+            with st.expander("Details", expanded=False):
+                st.caption(f"Owner: {saved.get('owner', 'shared')} · Created {saved.get('created_at', 'unknown')}")
+                st.code(_dumps_params_json(params), language="json")
+
+
+with st.sidebar:
+    _saved_searches_fragment()
 
 st.session_state["history_limit"] = st.session_state.get("history_limit_slider", st.session_state["history_limit"])
 
@@ -1185,14 +1506,15 @@ with account_cols[1]:
         st.caption(f"Generated at {latest_result.get('generated_at', 'unknown')}")
 
         metadata = latest_result.get("metadata") or {}
-        summary_rows = [
-            {"Field": "Request ID", "Value": latest_result.get("request_id", "unknown")},
-            {"Field": "Generated at", "Value": latest_result.get("generated_at", "unknown")},
-            {"Field": "Categories", "Value": metadata.get("category_count", "n/a")},
-            {"Field": "Indicators (deduped)", "Value": metadata.get("indicator_count", len(indicators))},
-            {"Field": "Requested top_k", "Value": metadata.get("requested_top_k", "n/a")},
-        ]
-        st.table(summary_rows)
+        summary_rows = (
+            ("Request ID", latest_result.get("request_id", "unknown")),
+            ("Generated at", latest_result.get("generated_at", "unknown")),
+            ("Categories", metadata.get("category_count", "n/a")),
+            ("Indicators (deduped)", metadata.get("indicator_count", len(indicators))),
+            ("Requested top_k", metadata.get("requested_top_k", "n/a")),
+        )
+        # A fixed key/value summary does not need st.table's DataFrame/Arrow round trip.
+        st.markdown("\n".join(f"- **{field}**: {value}" for field, value in summary_rows))
 
         artifacts = latest_result.get("artifacts") or {}
         if artifacts:
@@ -1209,7 +1531,7 @@ with account_cols[1]:
 
         st.download_button(
             label="Download raw JSON",
-            data=json.dumps(latest_result, indent=2),
+            data=_json.dumps(latest_result, indent=True),
             file_name="account_list_result.json",
             mime="application/json",
             key="account_list_download_btn",
@@ -1221,7 +1543,11 @@ latest_result = st.session_state.get("account_list_last_result") or {}
 latest_indicators = latest_result.get("indicators") or []
 if latest_indicators:
     st.markdown("#### Extracted indicators")
-    st.dataframe(latest_indicators, use_container_width=True)
+    request_id = latest_result.get("request_id")
+    st.dataframe(
+        _indicators_frame(str(request_id), latest_indicators) if request_id else latest_indicators,
+        use_container_width=True,
+    )
 else:
     st.caption("No indicator records loaded yet.")
 
@@ -1334,7 +1660,7 @@ if dossier_records:
                 st.json(manifest_payload)
                 st.download_button(
                     label="Download manifest JSON",
-                    data=json.dumps(manifest_payload, indent=2),
+                    data=_json.dumps(manifest_payload, indent=True),
                     file_name=f"{safe_plan_key}_manifest.json",
                     mime="application/json",
                     key=f"manifest_download_{safe_plan_key}",
@@ -1412,9 +1738,6 @@ else:
     if not dossier_error:
         st.caption("No dossier plans match the current filters yet.")
 
-if not st.session_state.get("intake_items") and st.session_state.get("intake_error") is None:
-    _refresh_intakes()
-
 st.divider()
 st.subheader("📝 Intake submissions")
 
@@ -1477,9 +1800,9 @@ with intake_cols[0]:
 
             loss_amount_value: Optional[float] = None
             if loss_amount_raw.strip():
-                try:
+                if _LOSS_AMOUNT_RE.fullmatch(loss_amount_raw):
                     loss_amount_value = float(loss_amount_raw.replace(",", ""))
-                except ValueError:
+                else:
                     errors.append("Loss amount must be numeric.")
 
             if errors:
@@ -1500,19 +1823,12 @@ with intake_cols[0]:
                     "source": source.strip() or "unknown",
                     "metadata": metadata,
                 }
-                attachment_payloads = []
-                for upload in attachments or []:
-                    try:
-                        content = upload.read()
-                        attachment_payloads.append(
-                            (
-                                upload.name or "upload",
-                                content,
-                                upload.type or "application/octet-stream",
-                            )
-                        )
-                    finally:
-                        upload.close()
+                # Hand the upload handles to the client so the multipart body is streamed from
+                # them instead of copying every attachment into a bytes object first.
+                attachment_payloads = [
+                    (upload.name or "upload", upload, upload.type or "application/octet-stream")
+                    for upload in attachments or []
+                ]
 
                 try:
                     response = ui_api.submit_intake(submission_payload, attachment_payloads)
@@ -1521,6 +1837,9 @@ with intake_cols[0]:
                     _refresh_intakes(limit=st.session_state.get("intake_list_limit", 25))
                 except Exception as exc:
                     st.error(f"Failed to submit intake: {exc}")
+                finally:
+                    for upload in attachments or []:
+                        upload.close()
 
 with intake_cols[1]:
     st.markdown("#### Recent submissions")
@@ -1533,7 +1852,9 @@ with intake_cols[1]:
     )
     st.session_state["intake_list_limit"] = list_limit
     if st.button("Refresh intakes", key="intake_refresh_btn"):
-        _refresh_intakes(limit=list_limit)
+        _refresh_intakes(limit=list_limit, force=True)
+    elif st.session_state.get("intake_items") is None:
+        st.caption("Intake submissions are not loaded yet. Use **Refresh intakes** to fetch them.")
 
     last_response = st.session_state.get("intake_last_response")
     if last_response:
@@ -1552,50 +1873,38 @@ if intake_items:
         intake_id = item.get("intake_id", "unknown")
         status_label = item.get("status", "unknown")
         header = f"{intake_id} · status={status_label}"
+        job_status = item.get("job_status")
         with st.expander(header, expanded=False):
-            st.write(f"Submitted {item.get('created_at', 'unknown')} · Updated {item.get('updated_at', 'unknown')}")
-            st.write(
-                f"Reporter: {item.get('reporter_name', 'n/a')} · Submitted by: {item.get('submitted_by') or 'unknown'}"
-            )
-            contact_parts = [
-                part
-                for part in [
-                    item.get("contact_email"),
-                    item.get("contact_phone"),
-                    item.get("contact_handle"),
-                ]
-                if part
-            ]
-            if contact_parts:
-                st.write("Contact: " + " | ".join(contact_parts))
-            st.write(f"Source: {item.get('source') or 'unknown'}")
-            if item.get("summary"):
-                st.markdown("**Summary**")
-                st.write(item.get("summary"))
-
-            job_status = item.get("job_status")
+            st.markdown(_intake_overview_markdown(str(intake_id), item.get("updated_at"), job_status, item))
+
             job_message = item.get("job_message")
             job_id = item.get("job_id")
-            st.write(f"Job status: {job_status or 'pending'}")
             if job_message:
                 st.caption(job_message)
 
             detail_key = f"intake_detail_{intake_id}"
             detail = st.session_state.get(detail_key)
             if detail:
+                # Contiguous markdown (attachment list plus the header of the next JSON
+                # block) goes out as one element; only the JSON payloads stay separate.
+                md_parts: List[str] = []
                 attachments_detail = detail.get("attachments") or []
                 if attachments_detail:
-                    st.markdown("**Attachments**")
-                    for attachment in attachments_detail:
-                        st.write(
-                            f"- {attachment.get('file_name', 'file')} · {attachment.get('storage_uri', 'unknown')}"
-                        )
+                    md_parts.append("**Attachments**\n")
+                    md_parts.extend(
+                        f"- {attachment.get('file_name', 'file')} · {attachment.get('storage_uri', 'unknown')}"
+                        for attachment in attachments_detail
+                    )
+                    md_parts.append("")
                 job_blob = detail.get("job") or {}
                 if job_blob:
                     job_id = job_blob.get("job_id", job_id)
-                    st.markdown("**Job metadata**")
+                    md_parts.append("**Job metadata**")
+                    st.markdown("\n".join(md_parts))
                     st.json(job_blob)
-                st.markdown("**Metadata**")
+                    md_parts = []
+                md_parts.append("**Metadata**")
+                st.markdown("\n".join(md_parts))
                 st.json(detail.get("metadata", {}))
                 if detail.get("case_id"):
                     st.caption(f"Linked case ID: {detail.get('case_id')}")
@@ -1612,8 +1921,16 @@ if intake_items:
                     st.error(f"Failed to refresh intake: {exc}")
 
             if job_id and action_cols[1].button("Refresh job", key=f"refresh_job_{job_id}"):
+                # The job lookup and the list reload are independent; overlap the two round-trips.
+                with ThreadPoolExecutor(
+                    max_workers=2, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())
+                ) as executor:
+                    job_future = executor.submit(ui_api.fetch_intake_job, job_id)
+                    list_future = executor.submit(
+                        _refresh_intakes, limit=st.session_state.get("intake_list_limit", 25), force=True
+                    )
                 try:
-                    job_payload = ui_api.fetch_intake_job(job_id)
+                    job_payload = job_future.result()
                     detail_payload = st.session_state.get(detail_key) or {}
                     detail_payload = dict(detail_payload) if detail_payload else {}
                     detail_payload["job"] = job_payload
@@ -1621,11 +1938,10 @@ if intake_items:
                     st.success("Job status refreshed.")
                 except Exception as exc:
                     st.error(f"Failed to refresh job status: {exc}")
-                finally:
-                    _refresh_intakes(limit=st.session_state.get("intake_list_limit", 25))
+                list_future.result()
 
             if action_cols[2].button("Reload list", key=f"reload_intake_{intake_id}"):
-                _refresh_intakes(limit=st.session_state.get("intake_list_limit", 25))
+                _refresh_intakes(limit=st.session_state.get("intake_list_limit", 25), force=True)
 else:
     if not intake_error:
         st.info("No recent intake submissions found.")
@@ -1640,9 +1956,9 @@ if search_submitted:
         text=(search_text.strip() or None) if search_text else None,
         classification=(search_classification.strip() or None) if search_classification else None,
         case_id=(search_case_id.strip() or None) if search_case_id else None,
-        vector_limit=st.session_state["search_vector_limit_value"],
-        structured_limit=st.session_state["search_structured_limit_value"],
-        page_size=st.session_state["search_page_size_value"],
+        vector_limit=search_vector_limit,
+        structured_limit=search_structured_limit,
+        page_size=search_page_size,
         datasets=dataset_filters,
         loss_buckets=loss_filters,
         entities=entity_filters,
@@ -1655,10 +1971,9 @@ if search_submitted:
             active_id = st.session_state.get("active_saved_search_id") if update_existing else None
             current_favorite = None
             if active_id:
-                for item in st.session_state.get("saved_searches", []):
-                    if item.get("search_id") == active_id:
-                        current_favorite = bool(item.get("favorite"))
-                        break
+                active_item = st.session_state.get("saved_searches_by_id", {}).get(active_id)
+                if active_item is not None:
+                    current_favorite = bool(active_item.get("favorite"))
             response = ui_api.save_search(
                 save_name.strip(),
                 params,
@@ -1666,8 +1981,8 @@ if search_submitted:
                 favorite=current_favorite,
             )
             st.success(f"Saved search '{save_name.strip()}'")
-            payload = ui_api.fetch_saved_searches(limit=25)
-            st.session_state["saved_searches"] = payload.get("items", [])
+            payload = ui_api.cached_saved_searches(limit=25)
+            _store_saved_searches(payload.get("items", []))
             st.session_state["saved_search_error"] = None
             st.session_state["active_saved_search_id"] = response.get("search_id")
         except Exception as exc:
@@ -1684,8 +1999,7 @@ if search_submitted:
 status = st.sidebar.selectbox("Show cases by status", ["queued", "in_review", "accepted", "rejected"], index=0)
 limit = st.sidebar.slider("Max cases to load", 5, 200, 50)
 
-if st.sidebar.button("Refresh queue"):
-    st.rerun()
+refresh_queue = st.sidebar.button("Refresh queue")
 
 search_error = st.session_state.get("search_error")
 if search_error:
@@ -1725,6 +2039,89 @@ if search_params and page_size:
         run_search(search_params, offset=new_offset)
         st.rerun()
 
+
+@st.fragment
+def _search_result_fragment(result: Dict[str, Any]) -> None:
+    """Render one search hit; loading and acting on its queue entries reruns only this block."""
+
+    case_id = result.get("case_id", "Unknown case")
+    score = result.get("score")
+    record = result.get("record")
+    vector_hit = result.get("vector")
+    sources = ", ".join(result.get("sources", []))
+    score_txt = f"{score:.2f}" if isinstance(score, (int, float)) else "n/a"
+    st.markdown(f"**Case {case_id}** — score: {score_txt} · sources: {sources or 'n/a'}")
+
+    case_reviews_by_id = st.session_state["case_reviews"]
+    case_reviews = case_reviews_by_id.get(case_id)
+
+    if record:
+        st.markdown("Structured record:")
+        st.json(record)
+    if vector_hit:
+        st.markdown("Semantic match:")
+        st.json(vector_hit)
+
+    if st.button("Show queue entries", key=f"show_queue_{case_id}"):
+        try:
+            payload = ui_api.fetch_case_reviews(
+                case_id,
+                limit=search_structured_limit,
+            )
+            case_reviews = case_reviews_by_id[case_id] = payload.get("reviews", [])
+        except Exception as exc:
+            st.error(f"Failed to load queue entries for {case_id}: {exc}")
+            case_reviews = None
+
+    if case_reviews:
+        st.markdown("Queue entries:")
+        for review in case_reviews:
+            review_id = review.get("review_id")
+            review_status = review.get("status")
+            notes = review.get("notes", "")
+            st.write(f"- `review_id={review_id}` · status={review_status} · notes={notes or '—'}")
+            action_cols = st.columns(3)
+
+            if action_cols[0].button("Claim", key=f"claim_search_{review_id}"):
+                try:
+                    ui_api.post_action(f"/{review_id}/claim", {})
+                    st.success(f"Review {review_id} claimed.")
+                    st.rerun()
+                except Exception as exc:
+                    st.error(f"Failed to claim {review_id}: {exc}")
+
+            if action_cols[1].button("Accept", key=f"accept_search_{review_id}"):
+                try:
+                    ui_api.post_action(
+                        f"/{review_id}/decision",
+                        {
+                            "decision": "accepted",
+                            "notes": "Accepted from search panel",
+                            "auto_generate_report": False,
+                        },
+                    )
+                    st.success(f"Review {review_id} accepted.")
+                    st.rerun()
+                except Exception as exc:
+                    st.error(f"Failed to accept {review_id}: {exc}")
+
+            if action_cols[2].button("Reject", key=f"reject_search_{review_id}"):
+                try:
+                    ui_api.post_action(
+                        f"/{review_id}/decision",
+                        {
+                            "decision": "rejected",
+                            "notes": "Rejected from search panel",
+                        },
+                    )
+                    st.warning(f"Review {review_id} rejected.")
+                    st.rerun()
+                except Exception as exc:
+                    st.error(f"Failed to reject {review_id}: {exc}")
+
+    st.divider()
+
+
 search_results = st.session_state.get("search_results") or []
 if search_results:
     st.subheader("🔍 Search results")
@@ -1736,27 +2133,14 @@ if search_results:
     csv_button = st.button("⬇️ Export current page", key="export_search_csv")
     if csv_button:
         try:
-            import csv
-            from io import StringIO
-
-            output = StringIO()
-            fieldnames = ["case_id", "score", "sources", "vector", "record"]
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            for result in search_results:
-                writer.writerow(
-                    {
-                        "case_id": result.get("case_id"),
-                        "score": result.get("score"),
-                        "sources": ",".join(result.get("sources", [])),
-                        "vector": json.dumps(result.get("vector", {})),
-                        "record": json.dumps(result.get("record", {})),
-                    }
-                )
+            if search_id:
+                csv_bytes = _search_results_csv(str(search_id), current_offset, search_results)
+            else:
+                csv_bytes = b"".join(_iter_search_results_csv(search_results))
 
             st.download_button(
                 label="Download CSV",
-                data=output.getvalue(),
+                data=csv_bytes,
                 file_name=f"search_results_{search_id or 'page'}.csv",
                 mime="text/csv",
                 key="download_search_csv",
@@ -1764,82 +2148,7 @@ if search_results:
         except Exception as exc:
             st.error(f"Failed to export search results: {exc}")
     for result in search_results:
-        case_id = result.get("case_id", "Unknown case")
-        sources = ", ".join(result.get("sources", []))
-        score = result.get("score")
-        score_txt = f"{score:.2f}" if isinstance(score, (int, float)) else "n/a"
-        st.markdown(f"**Case {case_id}** — score: {score_txt} · sources: {sources or 'n/a'}")
-
-        record = result.get("record")
-        vector_hit = result.get("vector")
-        case_reviews = st.session_state["case_reviews"].get(case_id)
-
-        if record:
-            st.markdown("Structured record:")
-            st.json(record)
-        if vector_hit:
-            st.markdown("Semantic match:")
-            st.json(vector_hit)
-
-        if st.button("Show queue entries", key=f"show_queue_{case_id}"):
-            try:
-                payload = ui_api.fetch_case_reviews(
-                    case_id,
-                    limit=st.session_state.get("search_structured_limit_value", 5),
-                )
-                st.session_state["case_reviews"][case_id] = payload.get("reviews", [])
-                case_reviews = st.session_state["case_reviews"].get(case_id)
-            except Exception as exc:
-                st.error(f"Failed to load queue entries for {case_id}: {exc}")
-                case_reviews = None
-
-        if case_reviews:
-            st.markdown("Queue entries:")
-            for review in case_reviews:
-                review_id = review.get("review_id")
-                status = review.get("status")
-                notes = review.get("notes", "")
-                st.write(f"- `review_id={review_id}` · status={status} · notes={notes or '—'}")
-                action_cols = st.columns(3)
-
-                if action_cols[0].button("Claim", key=f"claim_search_{review_id}"):
-                    try:
-                        ui_api.post_action(f"/{review_id}/claim", {})
-                        st.success(f"Review {review_id} claimed.")
-                        st.rerun()
-                    except Exception as exc:
-                        st.error(f"Failed to claim {review_id}: {exc}")
-
-                if action_cols[1].button("Accept", key=f"accept_search_{review_id}"):
-                    try:
-                        ui_api.post_action(
-                            f"/{review_id}/decision",
-                            {
-                                "decision": "accepted",
-                                "notes": "Accepted from search panel",
-                                "auto_generate_report": False,
-                            },
-                        )
-                        st.success(f"Review {review_id} accepted.")
-                        st.rerun()
-                    except Exception as exc:
-                        st.error(f"Failed to accept {review_id}: {exc}")
-
-                if action_cols[2].button("Reject", key=f"reject_search_{review_id}"):
-                    try:
-                        ui_api.post_action(
-                            f"/{review_id}/decision",
-                            {
-                                "decision": "rejected",
-                                "notes": "Rejected from search panel",
-                            },
-                        )
-                        st.warning(f"Review {review_id} rejected.")
-                        st.rerun()
-                    except Exception as exc:
-                        st.error(f"Failed to reject {review_id}: {exc}")
-
-        st.divider()
+        _search_result_fragment(result)
 
 history_error = st.session_state.get("search_history_error")
 if history_error:
@@ -1848,66 +2157,64 @@ if history_error:
 history_events = st.session_state.get("search_history") or []
 if history_events:
     st.subheader("🕘 Recent search history")
-    for event in history_events:
-        payload = event.get("payload", {})
-        request_snapshot = payload.get("request") if isinstance(payload.get("request"), dict) else None
-        summary_source = request_snapshot or payload
-        timestamp = event.get("created_at", "unknown time")
-        actor = event.get("actor", "unknown")
-        summary = summary_source.get("text") or summary_source.get("case_id") or "(no query)"
-        search_key = payload.get("search_id", event.get("action_id"))
-        descriptor_payload = _combine_saved_search_descriptors(payload, request_snapshot)
-        descriptor_label = descriptor_payload.get("name") if descriptor_payload else None
-        tags = (descriptor_payload.get("tags") if descriptor_payload else None) or payload.get("tags") or []
-        metadata_parts = [f"`{search_key}`" if search_key else "(no id)", timestamp, actor]
-        if descriptor_label:
-            metadata_parts.append(f"saved: **{descriptor_label}**")
-        if summary:
-            metadata_parts.append(f"query: `{summary}`")
-        line = " · ".join(metadata_parts)
-        tag_markup = " ".join(_tag_badge(t) for t in tags)
-        if tag_markup:
-            line = f"{line} {tag_markup}"
-        cols = st.columns([0.6, 0.4])
-        cols[0].markdown(line, unsafe_allow_html=True)
-
+    # One markdown table plus a single Run control keeps the element count flat
+    # instead of emitting columns, markdown and a button for every event. History
+    # lists are replaced (never mutated) on refresh, so the rendered table is reused
+    # for as long as the same list object stays in session state.
+    history_cache = st.session_state.get("_history_render_cache")
+    if history_cache is not None and history_cache[0] is history_events:
+        _, history_markdown, history_entries = history_cache
+    else:
+        history_markdown, history_entries = _history_table(history_events)
+        st.session_state["_history_render_cache"] = (history_events, history_markdown, history_entries)
+    st.markdown(history_markdown, unsafe_allow_html=True)
+
+    history_cols = st.columns([0.8, 0.2])
+    history_choice = history_cols[0].selectbox(
+        "History entry",
+        options=range(len(history_entries)),
+        format_func=lambda index: history_entries[index]["label"],
+        key="history_run_choice",
+        label_visibility="collapsed",
+    )
+    if history_cols[1].button("Run", key="run_history_entry", width="stretch") and history_choice is not None:
+        entry = history_entries[history_choice]
+        payload = entry["payload"]
+        request_snapshot = entry["request"]
+        search_key = entry["search_key"]
+        descriptor_payload = entry["descriptor"]
         descriptor_for_run = dict(descriptor_payload) if descriptor_payload else None
-        saved_id_for_run = descriptor_payload.get("id") if descriptor_payload else None
-        saved_id_for_run = saved_id_for_run or search_key
-
-        if cols[1].button("Run", key=f"run_history_{search_key}"):
-            base_params = request_snapshot or {
-                "text": payload.get("text"),
-                "classification": payload.get("classification"),
-                "case_id": payload.get("case_id"),
-                "vector_limit": payload.get("vector_limit", st.session_state["search_vector_limit_value"]),
-                "structured_limit": payload.get(
-                    "structured_limit",
-                    st.session_state["search_structured_limit_value"],
-                ),
-                "page_size": payload.get("page_size", st.session_state["search_page_size_value"]),
-                "limit": payload.get("limit"),
-                "datasets": payload.get("datasets"),
-                "loss_buckets": payload.get("loss_buckets"),
-                "entities": payload.get("entities"),
-                "time_range": payload.get("time_range"),
+        saved_id_for_run = entry["saved_id"]
+        base_params = request_snapshot or {
+            "text": payload.get("text"),
+            "classification": payload.get("classification"),
+            "case_id": payload.get("case_id"),
+            "vector_limit": payload.get("vector_limit", search_vector_limit),
+            "structured_limit": payload.get("structured_limit", search_structured_limit),
+            "page_size": payload.get("page_size", search_page_size),
+            "limit": payload.get("limit"),
+            "datasets": payload.get("datasets"),
+            "loss_buckets": payload.get("loss_buckets"),
+            "entities": payload.get("entities"),
+            "time_range": payload.get("time_range"),
+        }
+        params = _normalize_ui_saved_search_params(base_params)
+        if st.session_state.get("preview_enabled", True):
+            st.session_state["pending_history_search_preview"] = {
+                "key": search_key,
+                "saved_id": saved_id_for_run,
+                "params": params,
+                "params_json": _dumps_params_json(params),
+                "descriptor": descriptor_for_run,
+                "label": entry["descriptor_label"] or entry["summary"] or search_key,
             }
-            params = _normalize_ui_saved_search_params(base_params)
-            if st.session_state.get("preview_enabled", True):
-                st.session_state["pending_history_search_preview"] = {
-                    "key": search_key,
-                    "saved_id": saved_id_for_run,
-                    "params": params,
-                    "descriptor": descriptor_for_run,
-                    "label": descriptor_label or summary or search_key,
-                }
-                st.rerun()
-            else:
-                _execute_saved_search(saved_id_for_run or "history", params, descriptor=descriptor_for_run)
+            st.rerun()
+        else:
+            _execute_saved_search(saved_id_for_run or "history", params, descriptor=descriptor_for_run)
 
 queue = []
 try:
-    queue = ui_api.fetch_queue(status=status, limit=limit)
+    queue = ui_api.cached_queue(status=status, limit=limit, force=refresh_queue)
 except Exception as e:
     st.error(f"Failed to fetch queue: {e}")
 
@@ -1915,9 +2222,22 @@ if not queue:
     st.info(f"No cases in '{status}' status.")
     st.stop()
 
-st.write(f"Showing {len(queue)} cases (status={status})")
+# Every expander body registers its widgets even while collapsed, so render the queue
+# in pages and let the analyst pull in more cases on demand.
+queue_view_key = (status, limit)
+if st.session_state.get("queue_view_key") != queue_view_key:
+    st.session_state["queue_view_key"] = queue_view_key
+    st.session_state["queue_visible_count"] = QUEUE_PAGE_SIZE
+visible_count = st.session_state["queue_visible_count"]
+visible_queue = queue[:visible_count]
+
+st.write(f"Showing {len(visible_queue)} of {len(queue)} cases (status={status})")
+
+
+@st.fragment
+def _review_case_fragment(case: Dict[str, Any]) -> None:
+    """Render one queue case; only actions that change the queue rerun the whole page."""
 
-for case in queue:
     with st.expander(f"Case {case.get('case_id')} / review_id={case.get('review_id')}"):
         st.write(case.get("notes", "No notes"))
         cols = st.columns([1, 1, 1, 2])
@@ -1994,6 +2314,11 @@ for case in queue:
                 st.error(f"Failed to fetch history: {e}")
 
 
-def _tag_badge(tag: str) -> str:
-    color = TAG_PAL[hash(tag) % len(TAG_PAL)]
-    return f"<span style='background:{color}; padding:2px 6px; border-radius:6px; margin-right:4px;'>{tag}</span>"
+for case in visible_queue:
+    _review_case_fragment(case)
+
+if len(queue) > visible_count:
+    remaining = len(queue) - visible_count
+    if st.button(f"Load {min(remaining, QUEUE_PAGE_SIZE)} more cases", key="queue_load_more"):
+        st.session_state["queue_visible_count"] = visible_count + QUEUE_PAGE_SIZE
+        st.rerun()
@@ -4,30 +4,40 @@ from __future__ import annotations
 
 import json
 from collections.abc import Sequence
-from typing import Any, Dict, List, Optional
+from importlib.util import find_spec
+from typing import Any, BinaryIO, Dict, List, Optional
 from typing import Sequence as Seq
 
 import httpx
 import streamlit as st
 
-try:
-    from google.cloud import discoveryengine_v1beta as discoveryengine
-    from google.protobuf import json_format
-except ImportError:  # pragma: no cover - optional dependency
-    discoveryengine = None  # type: ignore[assignment]
-    json_format = None  # type: ignore[assignment]
 
-HAS_VERTEX_SEARCH = discoveryengine is not None and json_format is not None
+@st.cache_resource(show_spinner=False)
+def _discovery_sdk() -> tuple[Any, Any] | None:
+    """Import the Discovery SDK once per process; ``None`` when it is not installed."""
 
+    try:
+        from google.cloud import discoveryengine_v1beta as discoveryengine
+        from google.protobuf import json_format
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return discoveryengine, json_format
 
-@st.cache_resource
-def _search_client() -> Any:
-    """Reuse a single Discovery client to avoid reconnect overhead."""
 
-    if not HAS_VERTEX_SEARCH:
+def _require_discovery_sdk() -> tuple[Any, Any]:
+    sdk = _discovery_sdk()
+    if sdk is None:
         raise RuntimeError(
             "Discovery SDK not installed. Install `google-cloud-discoveryengine` to enable the Vertex search panel."
         )
+    return sdk
+
+
+@st.cache_resource
+def _search_client() -> Any:
+    """Reuse a single Discovery client to avoid reconnect overhead."""
+
+    discoveryengine, _ = _require_discovery_sdk()
     return discoveryengine.SearchServiceClient()
 
 
@@ -49,6 +59,7 @@ def _convert_struct(data: Any) -> Any:
 
 
 def perform_vertex_search(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    discoveryengine, json_format = _require_discovery_sdk()
     client = _search_client()
 
     serving_config = client.serving_config_path(
@@ -121,38 +132,53 @@ def perform_vertex_search(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     return formatted_results
 
 
+@st.cache_resource(show_spinner=False)
 def vertex_search_available() -> bool:
-    """Expose whether the Discovery client dependencies are installed."""
+    """Expose whether the Discovery client dependencies are installed.
+
+    Only the module specs are probed so the dashboard does not pay the SDK import
+    cost until a Discovery search actually runs.
+    """
+
+    try:
+        return all(find_spec(name) is not None for name in ("google.cloud.discoveryengine_v1beta", "google.protobuf"))
+    except ModuleNotFoundError:  # pragma: no cover - missing parent package
+        return False
+
 
-    return HAS_VERTEX_SEARCH
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _http_client(base_url: str, headers: tuple[tuple[str, str], ...], timeout: float) -> httpx.Client:
+    """Share one pooled client per base URL and credential set across reruns and sessions."""
+
+    return httpx.Client(base_url=base_url, headers=dict(headers), timeout=timeout)
 
 
 def api_client() -> httpx.Client:
     base = st.session_state.get("api_base", API_BASE_URL)
     key = st.session_state.get("api_key", API_KEY)
-    return httpx.Client(base_url=base, headers={"X-API-KEY": key}, timeout=30.0)
+    return _http_client(base, (("X-API-KEY", key),), 30.0)
 
 
 def reviews_client() -> httpx.Client:
     base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
     key = st.session_state.get("api_key", API_KEY)
     reviews_base = f"{base}/reviews"
-    return httpx.Client(base_url=reviews_base, headers={"X-API-KEY": key}, timeout=30.0)
+    return _http_client(reviews_base, (("X-API-KEY", key),), 30.0)
 
 
 def intake_client() -> httpx.Client:
     base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
     key = st.session_state.get("api_key", API_KEY)
     intake_base = f"{base}/intakes"
-    return httpx.Client(base_url=intake_base, headers={"X-API-KEY": key}, timeout=30.0)
+    return _http_client(intake_base, (("X-API-KEY", key),), 30.0)
 
 
 def account_list_client() -> httpx.Client:
     base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
     key = st.session_state.get("api_key", API_KEY)
     accounts_base = f"{base}/accounts"
-    headers = {"X-API-KEY": key, "X-ACCOUNTLIST-KEY": key}
-    return httpx.Client(base_url=accounts_base, headers=headers, timeout=60.0)
+    headers = (("X-API-KEY", key), ("X-ACCOUNTLIST-KEY", key))
+    return _http_client(accounts_base, headers, 60.0)
 
 
 def run_account_list_extraction(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -162,7 +188,9 @@ def run_account_list_extraction(payload: Dict[str, Any]) -> Dict[str, Any]:
     return response.json()
 
 
-def fetch_dossiers(status: str = "completed", limit: int = 20, include_manifest: bool = False) -> Dict[str, Any]:
+def fetch_dossiers(
+    status: str = "completed", limit: int = 20, include_manifest: bool = False, include_payload: bool = True
+) -> Dict[str, Any]:
     """Retrieve dossier queue entries from the reports API."""
 
     client = api_client()
@@ -170,6 +198,7 @@ def fetch_dossiers(status: str = "completed", limit: int = 20, include_manifest:
         "status": status,
         "limit": max(1, min(int(limit), 200)),
         "include_manifest": include_manifest,
+        "include_payload": include_payload,
     }
     response = client.get("/reports/dossiers", params=params)
     response.raise_for_status()
@@ -195,6 +224,7 @@ def post_action(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post(path, json=payload)
     response.raise_for_status()
+    _cached_queue.clear()
     return response.json()
 
 
@@ -202,6 +232,7 @@ def post_patch(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.patch(path, json=payload)
     response.raise_for_status()
+    _cached_queue.clear()
     return response.json()
 
 
@@ -239,6 +270,7 @@ def search_cases_hybrid_api(payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post("/search/query", json=payload)
     response.raise_for_status()
+    _cached_search_history.clear()
     return response.json()
 
 
@@ -288,6 +320,7 @@ def save_search(
         body["favorite"] = favorite
     response = client.post("/search/saved", json=body)
     response.raise_for_status()
+    _invalidate_saved_searches()
     return response.json()
 
 
@@ -307,6 +340,7 @@ def patch_saved_search(
         payload["favorite"] = favorite
     response = client.patch(f"/search/saved/{search_id}", json=payload)
     response.raise_for_status()
+    _invalidate_saved_searches()
     return response.json()
 
 
@@ -314,6 +348,7 @@ def share_saved_search(search_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post(f"/search/saved/{search_id}/share")
     response.raise_for_status()
+    _invalidate_saved_searches()
     return response.json()
 
 
@@ -324,10 +359,24 @@ def export_saved_search(search_id: str) -> Dict[str, Any]:
     return response.json()
 
 
+def export_saved_search_bytes(search_id: str) -> bytes:
+    """Return the exported saved search as the raw JSON body for download buttons.
+
+    Skips the decode/re-encode round trip of :func:`export_saved_search` so large
+    records are held in memory once.
+    """
+
+    client = reviews_client()
+    response = client.get(f"/search/saved/{search_id}/export")
+    response.raise_for_status()
+    return response.content
+
+
 def import_saved_search_api(payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post("/search/saved/import", json=payload)
     response.raise_for_status()
+    _invalidate_saved_searches()
     return response.json()
 
 
@@ -335,6 +384,7 @@ def delete_saved_search(search_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.delete(f"/search/saved/{search_id}")
     response.raise_for_status()
+    _invalidate_saved_searches()
     return response.json()
 
 
@@ -345,12 +395,19 @@ def fetch_tag_presets(limit: int = 100) -> Dict[str, Any]:
     return response.json()
 
 
-def submit_intake(submission: Dict[str, Any], attachments: Seq[tuple[str, bytes, str]]) -> Dict[str, Any]:
+def submit_intake(submission: Dict[str, Any], attachments: Seq[tuple[str, bytes | BinaryIO, str]]) -> Dict[str, Any]:
+    """Post an intake; attachment content may be bytes or a readable binary handle.
+
+    File handles are streamed into the multipart body in chunks, so callers can pass
+    uploads through without reading them into memory first.
+    """
+
     client = intake_client()
     data = {"payload": json.dumps(submission)}
     files = [("files", (name, content, content_type)) for name, content, content_type in attachments]
     response = client.post("/", data=data, files=files if files else None)
     response.raise_for_status()
+    _cached_intakes.clear()
     return response.json()
 
 
@@ -406,9 +463,106 @@ def bulk_update_saved_search_tags(
             except Exception:
                 detail = exc.response.text
         raise RuntimeError(detail) from exc
+    _invalidate_saved_searches()
     return response.json()
 
 
+def _session_credentials() -> tuple[str, str]:
+    return (
+        st.session_state.get("api_base", API_BASE_URL),
+        st.session_state.get("api_key", API_KEY),
+    )
+
+
+# The cached readers take the API base and key as explicit arguments so each
+# credential pair gets its own cache entries; the wrapped fetchers still build
+# their client from session state, which holds the same values.
+@st.cache_data(ttl="15s", max_entries=32, show_spinner=False)
+def _cached_queue(api_base: str, api_key: str, status: str, limit: int) -> List[Dict[str, Any]]:
+    return fetch_queue(status=status, limit=limit)
+
+
+@st.cache_data(ttl="1m", max_entries=32, show_spinner=False)
+def _cached_search_history(api_base: str, api_key: str, limit: int) -> Dict[str, Any]:
+    return fetch_search_history(limit=limit)
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def _cached_saved_searches(api_base: str, api_key: str, limit: int) -> Dict[str, Any]:
+    return fetch_saved_searches(limit=limit)
+
+
+@st.cache_data(ttl="1h", max_entries=32, show_spinner=False)
+def _cached_search_schema(api_base: str, api_key: str) -> Dict[str, Any]:
+    return fetch_search_schema()
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def _cached_tag_presets(api_base: str, api_key: str, limit: int) -> Dict[str, Any]:
+    return fetch_tag_presets(limit=limit)
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def _cached_intakes(api_base: str, api_key: str, limit: int) -> Dict[str, Any]:
+    return list_intakes(limit=limit)
+
+
+def _invalidate_saved_searches() -> None:
+    _cached_saved_searches.clear()
+    _cached_tag_presets.clear()
+
+
+def cached_queue(status: str = "queued", limit: int = 50, *, force: bool = False) -> List[Dict[str, Any]]:
+    """Return the review queue, reusing responses across reruns for 15 seconds.
+
+    Review actions posted through :func:`post_action`/:func:`post_patch` clear the cache.
+    """
+
+    if force:
+        _cached_queue.clear()
+    return _cached_queue(*_session_credentials(), status, limit)
+
+
+def cached_search_history(limit: int = 10, *, force: bool = False) -> Dict[str, Any]:
+    """Return recent search history, reusing responses across reruns for a minute."""
+
+    if force:
+        _cached_search_history.clear()
+    return _cached_search_history(*_session_credentials(), limit)
+
+
+def cached_saved_searches(limit: int = 25, *, force: bool = False) -> Dict[str, Any]:
+    """Return saved searches; mutations made through this module invalidate the cache."""
+
+    if force:
+        _invalidate_saved_searches()
+    return _cached_saved_searches(*_session_credentials(), limit)
+
+
+def cached_search_schema(*, force: bool = False) -> Dict[str, Any]:
+    """Return the hybrid-search schema, which changes rarely enough to cache for an hour."""
+
+    if force:
+        _cached_search_schema.clear()
+    return _cached_search_schema(*_session_credentials())
+
+
+def cached_tag_presets(limit: int = 100, *, force: bool = False) -> Dict[str, Any]:
+    """Return tag presets derived from saved searches."""
+
+    if force:
+        _cached_tag_presets.clear()
+    return _cached_tag_presets(*_session_credentials(), limit)
+
+
+def cached_intakes(limit: int = 25, *, force: bool = False) -> Dict[str, Any]:
+    """Return recent intake submissions; new submissions invalidate the cache."""
+
+    if force:
+        _cached_intakes.clear()
+    return _cached_intakes(*_session_credentials(), limit)
+
+
 __all__ = [
     "perform_vertex_search",
     "api_client",
@@ -427,9 +581,16 @@ __all__ = [
     "patch_saved_search",
     "share_saved_search",
     "export_saved_search",
+    "export_saved_search_bytes",
     "import_saved_search_api",
     "delete_saved_search",
     "fetch_tag_presets",
+    "cached_queue",
+    "cached_search_history",
+    "cached_saved_searches",
+    "cached_search_schema",
+    "cached_tag_presets",
+    "cached_intakes",
     "_parse_tags",
     "bulk_update_saved_search_tags",
     "intake_client",
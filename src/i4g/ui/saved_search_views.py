@@ -0,0 +1,68 @@
+"""Pure helpers behind the dashboard's saved-search panel and tag badges.
+
+Streamlit re-executes the dashboard script on every full rerun, so caches declared there start empty each time.
+Helpers that live in this imported module keep their ``lru_cache`` state for the life of the server process.
+"""
+
+from __future__ import annotations
+
+import html
+import zlib
+from functools import lru_cache
+
+TAG_PAL = [
+    "#E0BBE4",
+    "#957DAD",
+    "#D291BC",
+    "#FEC8D8",
+    "#FFDFD3",
+    "#C5E1A5",
+    "#B2DFDB",
+    "#FFF5BA",
+]
+# The palette length is a power of two so badge colors can be picked with a mask.
+_TAG_PAL_MASK = len(TAG_PAL) - 1
+_TAG_BADGE_PREFIXES = tuple(
+    f"<span style='background:{color}; padding:2px 6px; border-radius:6px; margin-right:4px;'>" for color in TAG_PAL
+)
+_TAG_BADGE_SUFFIX = "</span>"
+
+
+@lru_cache(maxsize=32)
+def saved_search_tag_options(tag_rows: tuple[tuple[str, ...], ...]) -> tuple[str, ...]:
+    """Return the sorted set of tags across saved searches, keyed by their per-row tags."""
+
+    # set().union runs in C. The panel lists at most 25 saved searches, so a pandas explode/unique pass (pandas is
+    # only imported lazily for the indicators frame) would cost more in import and Series construction than it saves.
+    return tuple(sorted(set().union(*tag_rows)))
+
+
+@lru_cache(maxsize=32)
+def filter_saved_searches_by_tag(
+    tag_rows: tuple[tuple[str, ...], ...], active_filters: frozenset[str]
+) -> tuple[int, ...]:
+    """Return indices of rows carrying any of ``active_filters`` (untagged rows match ``"untagged"``).
+
+    Indices rather than records are cached so callers keep operating on the live
+    session-state dicts.
+    """
+
+    if not active_filters:
+        return tuple(range(len(tag_rows)))
+    return tuple(index for index, tags in enumerate(tag_rows) if not active_filters.isdisjoint(tags or ("untagged",)))
+
+
+@lru_cache(maxsize=4096)
+def tag_badge(tag: str) -> str:
+    """Return the colored badge markup for a single tag."""
+
+    # crc32 is stable across processes (unlike str hash), so a tag keeps its color between sessions.
+    prefix = _TAG_BADGE_PREFIXES[zlib.crc32(tag.encode("utf-8")) & _TAG_PAL_MASK]
+    return prefix + html.escape(tag) + _TAG_BADGE_SUFFIX
+
+
+@lru_cache(maxsize=1024)
+def tag_badges(tags: tuple[str, ...]) -> str:
+    """Return the joined badge markup for a row's tags, memoized per tag combination."""
+
+    return " ".join(tag_badge(tag) for tag in tags)
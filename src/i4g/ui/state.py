@@ -30,7 +30,7 @@ def ensure_session_defaults() -> None:
     defaults: dict[str, Any] = {
         "api_base": default_api_base,
         "api_key": default_api_key,
-        "intake_items": [],
+        "intake_items": None,
         "intake_error": None,
         "intake_metadata_text": "{}",
         "intake_last_response": None,
@@ -60,10 +60,11 @@ def ensure_session_defaults() -> None:
         "search_history_error": None,
         "history_limit": 10,
         "saved_searches": [],
+        "saved_searches_by_id": {},
         "saved_search_error": None,
         "active_saved_search_id": None,
         "tag_filters": set(),
-        "saved_tag_filters": [],
+        "saved_tag_filters": {},
         "saved_search_tag_filter": [],
         "bulk_selected_saved_searches": set(),
         "bulk_tags_add": "",
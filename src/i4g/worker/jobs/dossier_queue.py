@@ -5,24 +5,27 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from typing import Callable
 
 from i4g.reports.dossier_queue_processor import DossierQueueProcessor, QueueProcessSummary
 from i4g.task_status import TaskStatusReporter
 
 LOGGER = logging.getLogger("i4g.worker.jobs.dossier_queue")
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
 
 
 def _configure_logging() -> None:
     level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    logging.basicConfig(level=level, format=_LOG_FORMAT)
 
 
 def _env_bool(key: str, default: bool = False) -> bool:
     raw = os.getenv(key)
     if raw is None:
         return default
-    return raw.lower() in {"1", "true", "yes", "on"}
+    return raw.lower() in _BOOL_TRUE
 
 
 def run_job(
@@ -31,11 +34,16 @@ def run_job(
     dry_run: bool,
     processor: DossierQueueProcessor | None = None,
     reporter: TaskStatusReporter | None = None,
+    on_plan: Callable[[dict], None] | None = None,
 ) -> QueueProcessSummary:
     """Run a single processor batch and return the summary (test helper)."""
 
     runner = processor or DossierQueueProcessor()
-    return runner.process_batch(batch_size=batch_size, dry_run=dry_run, reporter=reporter)
+    return runner.process_batch(batch_size=batch_size, dry_run=dry_run, reporter=reporter, on_plan=on_plan)
+
+
+def _log_plan(plan_summary: dict) -> None:
+    LOGGER.info("Dossier plan %s: %s", plan_summary.get("plan_id"), plan_summary.get("status"))
 
 
 def main() -> int:
@@ -47,10 +55,16 @@ def main() -> int:
 
     LOGGER.info("Starting dossier queue job: batch_size=%s dry_run=%s", batch_size, dry_run)
     reporter = TaskStatusReporter()
-    if reporter.is_enabled():
+    reporting = reporter.is_enabled()
+    if reporting:
         reporter.update(status="started", message="Dossier job started", batch_size=batch_size, dry_run=dry_run)
 
-    summary = run_job(batch_size=batch_size, dry_run=dry_run, reporter=reporter if reporter.is_enabled() else None)
+    summary = run_job(
+        batch_size=batch_size,
+        dry_run=dry_run,
+        reporter=reporter if reporting else None,
+        on_plan=_log_plan,
+    )
 
     LOGGER.info(
         "Dossier queue job complete: processed=%s completed=%s failed=%s dry_run=%s",
@@ -60,7 +74,7 @@ def main() -> int:
         summary.dry_run,
     )
 
-    if reporter.is_enabled():
+    if reporting:
         reporter.update(
             status="finished" if summary.failed == 0 else "partial",
             message="Dossier job complete",
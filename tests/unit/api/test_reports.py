@@ -37,8 +37,8 @@ def _sample_plan(plan_id: str = "test-plan-001") -> DossierPlan:
 
 
 @pytest.fixture()
-def queue_store(tmp_path) -> DossierQueueStore:
-    return DossierQueueStore(db_path=tmp_path / "dossier_queue.db")
+def queue_store() -> DossierQueueStore:
+    return DossierQueueStore(db_path=":memory:")
 
 
 def test_list_dossiers_returns_manifest_and_signature(tmp_path, queue_store, monkeypatch) -> None:
@@ -104,3 +104,21 @@ def test_list_dossiers_handles_missing_manifest(tmp_path, queue_store, monkeypat
     assert record["manifest"] is None
     assert record["signature_manifest"] is None
     assert any("Manifest missing" in warning for warning in record["artifact_warnings"])
+
+
+def test_list_dossiers_can_omit_plan_payload(tmp_path, queue_store, monkeypatch) -> None:
+    from i4g.api import reports as reports_api
+
+    plan = _sample_plan(plan_id="plan-metadata-only")
+    queue_store.enqueue_plan(plan)
+
+    monkeypatch.setattr(reports_api, "build_dossier_queue_store", lambda: queue_store)
+    monkeypatch.setattr(reports_api, "ARTIFACTS_DIR", tmp_path / "missing")
+
+    client = TestClient(create_app())
+    metadata = client.get("/reports/dossiers", params={"status": "all", "include_payload": False}).json()
+    full = client.get("/reports/dossiers", params={"status": "all"}).json()
+
+    assert metadata["items"][0]["plan_id"] == plan.plan_id
+    assert metadata["items"][0]["payload"] is None
+    assert full["items"][0]["payload"]["plan_id"] == plan.plan_id
@@ -0,0 +1,62 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from i4g.api import app as app_module
+from i4g.api.app import app
+
+_DOC_URL_ATTRS = ("openapi_url", "docs_url", "redoc_url", "swagger_ui_oauth2_redirect_url")
+
+
+@pytest.fixture(scope="session")
+def api_app() -> Iterator[FastAPI]:
+    """Return the module-level API app with its docs and OpenAPI routes detached for the session.
+
+    Unit tests never request those routes, and FastAPI registers them ahead of the API routers, so every request
+    would otherwise match against them first. The middleware stack is built up front as well; route dependants are
+    already resolved at registration, so that is the only per-app work the first request would otherwise pay for.
+    Rate limiting is switched off while the app is in use so per-test traffic never trips the limiter.
+    """
+
+    saved_urls = {attr: getattr(app, attr) for attr in _DOC_URL_ATTRS}
+    doc_paths = {url for url in saved_urls.values() if url}
+    saved_routes = list(app.router.routes)
+    app.router.routes[:] = [route for route in saved_routes if getattr(route, "path", None) not in doc_paths]
+    for attr in _DOC_URL_ATTRS:
+        setattr(app, attr, None)
+    saved_stack = app.middleware_stack
+    if saved_stack is None:
+        app.middleware_stack = app.build_middleware_stack()
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(app_module, "MAX_REQUESTS_PER_MINUTE", 0)
+            yield app
+    finally:
+        app.middleware_stack = saved_stack
+        app.router.routes[:] = saved_routes
+        for attr, url in saved_urls.items():
+            setattr(app, attr, url)
+
+
+@pytest.fixture(scope="session")
+def client(api_app: FastAPI) -> Iterator[TestClient]:
+    """Return one TestClient bound to the module-level API app for the whole test session."""
+
+    with TestClient(api_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+async def aclient(api_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Return an in-process async client that drives the app on the test's event loop, without a portal thread."""
+
+    transport = httpx.ASGITransport(app=api_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        yield async_client
@@ -0,0 +1,79 @@
+"""Shared fixtures for dossier report tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+
+from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
+from i4g.reports.dossier_context import CaseContext, DossierContextResult
+from i4g.reports.dossier_templates import TemplateRegistry
+
+
+@pytest.fixture(scope="session")
+def template_registry() -> TemplateRegistry:
+    """Return one registry so the default templates compile once per test session."""
+
+    return TemplateRegistry()
+
+
+@pytest.fixture
+def png_sink() -> BytesIO:
+    """Return an in-memory sink so renderer tests skip the disk write."""
+
+    return BytesIO()
+
+
+@pytest.fixture(scope="session")
+def sample_plan() -> DossierPlan:
+    """Return a single-case US-CA plan; use ``dataclasses.replace`` to vary it."""
+
+    candidate = DossierCandidate(
+        case_id="case-1",
+        loss_amount_usd=Decimal("100000"),
+        accepted_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+        jurisdiction="US-CA",
+        cross_border=False,
+        primary_entities=("wallet:abc",),
+    )
+    return DossierPlan(
+        plan_id="dossier-us-ca-20251203-01",
+        jurisdiction_key="US-CA",
+        created_at=datetime(2025, 12, 3, tzinfo=timezone.utc),
+        total_loss_usd=Decimal("100000"),
+        cases=(candidate,),
+        bundle_reason="test-plan",
+        cross_border=False,
+        shared_drive_parent_id=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def plan_context(sample_plan: DossierPlan) -> DossierContextResult:
+    """Return the context ``StaticContextLoader`` produces for ``sample_plan``."""
+
+    return StaticContextLoader().load(sample_plan)
+
+
+@pytest.fixture(scope="session")
+def static_context_loader() -> "StaticContextLoader":
+    return StaticContextLoader()
+
+
+class StaticContextLoader:
+    """Context loader stub that attaches a fixed record, review, and warning to each case."""
+
+    def load(self, plan: DossierPlan) -> DossierContextResult:
+        contexts = tuple(
+            CaseContext(
+                case_id=case.case_id,
+                structured_record={"case_id": case.case_id, "text": "context-text"},
+                review={"review_id": f"review-{case.case_id}"},
+                warnings=("case-warning",),
+            )
+            for case in plan.cases
+        )
+        return DossierContextResult(cases=contexts, warnings=("case-warning",))
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Dict, List
 
-from i4g.reports.bundle_builder import BundleBuilder, BundleCriteria, DossierCandidate
+from i4g.reports.bundle_builder import BundleBuilder, BundleCriteria, DossierCandidate, DossierPlan
 from i4g.reports.bundle_candidates import BundleCandidateProvider
 from i4g.store.dossier_queue_store import DossierQueueStore
+from i4g.store.review_store import ReviewStore
+from i4g.store.schema import ScamRecord
+from i4g.store.structured import StructuredStore
 
 
 def test_generate_plans_filters_by_loss_and_recency() -> None:
@@ -49,11 +53,93 @@ def test_generate_plans_filters_by_loss_and_recency() -> None:
     assert plans[0].plan_id.startswith("dossier-us-ca-")
 
 
+def test_generate_plans_rejects_stale_and_low_loss_in_either_order() -> None:
+    builder = BundleBuilder(queue_store=_MemoryQueueStore())
+    now = datetime(2025, 12, 3, tzinfo=timezone.utc)
+    candidates = [
+        DossierCandidate(
+            case_id="case-stale-low",
+            loss_amount_usd=Decimal("100"),
+            accepted_at=now - timedelta(days=90),
+            jurisdiction="US-CA",
+        ),
+        DossierCandidate(
+            case_id="case-boundary",
+            loss_amount_usd=Decimal("50000"),
+            accepted_at=now - timedelta(days=30),
+            jurisdiction="US-CA",
+        ),
+        DossierCandidate(
+            case_id="case-low-recent",
+            loss_amount_usd=Decimal("49999.99"),
+            accepted_at=now,
+            jurisdiction="US-CA",
+        ),
+        DossierCandidate(
+            case_id="case-high-stale",
+            loss_amount_usd=Decimal("900000"),
+            accepted_at=now - timedelta(days=30, seconds=1),
+            jurisdiction="US-CA",
+        ),
+    ]
+    criteria = BundleCriteria(min_loss_usd=50000, recency_days=30, max_cases_per_dossier=5)
+
+    forward = builder.generate_plans(candidates=candidates, criteria=criteria, reference_time=now)
+    backward = builder.generate_plans(candidates=candidates[::-1], criteria=criteria, reference_time=now)
+
+    assert criteria.min_loss_usd == Decimal("50000")
+    assert [case.case_id for plan in forward for case in plan.cases] == ["case-boundary"]
+    assert [case.case_id for plan in backward for case in plan.cases] == ["case-boundary"]
+
+
+def test_plan_to_dict_keeps_offsets_for_equal_instants() -> None:
+    utc = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    eastern = utc.astimezone(timezone(timedelta(hours=-5)))
+    cases = [
+        DossierCandidate(
+            case_id=f"case-{index}", loss_amount_usd=Decimal("60000"), accepted_at=value, jurisdiction="US"
+        )
+        for index, value in enumerate((utc, eastern, utc))
+    ]
+    plan = DossierPlan(
+        plan_id="plan-iso",
+        jurisdiction_key="US",
+        created_at=utc,
+        total_loss_usd=Decimal("180000"),
+        cases=cases,
+        bundle_reason="iso",
+        cross_border=False,
+    )
+
+    accepted = [case["accepted_at"] for case in plan.to_dict()["cases"]]
+
+    assert accepted == ["2025-12-01T00:00:00+00:00", "2025-11-30T19:00:00-05:00", "2025-12-01T00:00:00+00:00"]
+    assert DossierPlan.from_dict(plan.to_dict()).cases == plan.cases
+
+
+def test_candidate_interns_primary_entities() -> None:
+    accepted = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    first, second = (
+        DossierCandidate(
+            case_id=case_id,
+            loss_amount_usd=Decimal("60000"),
+            accepted_at=accepted,
+            jurisdiction="US",
+            primary_entities=["".join(["wallet:", "shared"])],
+        )
+        for case_id in ("case-a", "case-b")
+    )
+
+    assert first.primary_entities == ("wallet:shared",)
+    assert first.primary_entities[0] is second.primary_entities[0]
+
+
 def test_build_and_enqueue_persists_queue(tmp_path) -> None:
     db_path = tmp_path / "queue.db"
     queue_store = DossierQueueStore(db_path=db_path)
     builder = BundleBuilder(queue_store=queue_store, shared_drive_parent_id="drive-folder-123")
-    now = datetime(2025, 12, 3, tzinfo=timezone.utc)
+    # build_and_enqueue filters against the wall clock, so accepted_at must be relative to it.
+    now = datetime.now(timezone.utc) - timedelta(days=1)
     candidates = [
         DossierCandidate(
             case_id="case-1",
@@ -85,16 +171,44 @@ def test_build_and_enqueue_persists_queue(tmp_path) -> None:
     assert len(payload["cases"]) == 2
 
 
+def test_build_and_enqueue_batches_plans_through_queue_store() -> None:
+    queue_store = _MemoryQueueStore()
+    builder = BundleBuilder(queue_store=queue_store)
+    accepted = datetime.now(timezone.utc) - timedelta(days=1)
+    candidates = [
+        DossierCandidate(
+            case_id=f"case-{jurisdiction}",
+            loss_amount_usd=Decimal("90000"),
+            accepted_at=accepted,
+            jurisdiction=jurisdiction,
+        )
+        for jurisdiction in ("US-CA", "US-NY")
+    ]
+    criteria = BundleCriteria(min_loss_usd=Decimal("50000"), recency_days=30, jurisdiction_mode="single")
+
+    enqueued = builder.build_and_enqueue(candidates=candidates, criteria=criteria)
+
+    assert len(enqueued) == 2
+    assert enqueued == queue_store.plan_ids
+
+
 def test_bundle_candidate_provider_prefers_metrics_view() -> None:
     review_store = _MetricsReviewStore()
     provider = BundleCandidateProvider(
         review_store=review_store,
         structured_store=_StubStructuredStore(),
     )
+    now = datetime(2025, 12, 3, tzinfo=timezone.utc)
+    criteria = BundleCriteria(min_loss_usd=Decimal("50000"), recency_days=30)
 
-    candidates = provider.list_candidates(limit=5)
+    candidates = provider.list_candidates(limit=5, criteria=criteria, jurisdiction="US-CA", reference_time=now)
 
     assert review_store.view_calls == 1
+    assert review_store.filters == {
+        "min_loss_usd": Decimal("50000"),
+        "since": now - timedelta(days=30),
+        "jurisdiction": "US-CA",
+    }
     assert len(candidates) == 1
     candidate = candidates[0]
     assert candidate.case_id == "case-accepted"
@@ -105,7 +219,7 @@ def test_bundle_candidate_provider_prefers_metrics_view() -> None:
 
 
 def test_bundle_candidate_provider_fallbacks_to_queue() -> None:
-    review_store = _EmptyViewReviewStore()
+    review_store = _MissingViewReviewStore()
     provider = BundleCandidateProvider(
         review_store=review_store,
         structured_store=_StubStructuredStore(),
@@ -121,6 +235,61 @@ def test_bundle_candidate_provider_fallbacks_to_queue() -> None:
     assert candidate.cross_border is True
 
 
+def test_bundle_candidate_provider_fallback_applies_criteria() -> None:
+    provider = BundleCandidateProvider(review_store=_MissingViewReviewStore(), structured_store=_StubStructuredStore())
+    now = datetime(2025, 12, 3, tzinfo=timezone.utc)
+
+    def _ids(**kwargs: Any) -> List[str]:
+        return [candidate.case_id for candidate in provider.list_candidates(limit=5, reference_time=now, **kwargs)]
+
+    assert _ids(criteria=BundleCriteria(min_loss_usd=Decimal("50000"), recency_days=30)) == ["case-accepted"]
+    assert _ids(criteria=BundleCriteria(min_loss_usd=Decimal("70000"), recency_days=30)) == []
+    assert _ids(criteria=BundleCriteria(min_loss_usd=Decimal("50000"), recency_days=0)) == []
+    assert _ids(jurisdiction="US-NY") == []
+
+
+def test_bundle_candidate_provider_treats_empty_metrics_as_final(tmp_path) -> None:
+    db_path = tmp_path / "review.db"
+    review_store = ReviewStore(str(db_path))
+    structured = StructuredStore(db_path=db_path)
+    structured.upsert_record(
+        ScamRecord(
+            case_id="case-no-loss",
+            text="",
+            entities={},
+            classification="investment",
+            confidence=0.9,
+            metadata={"loss_amount_usd": 0, "jurisdiction": "US-CA"},
+        )
+    )
+    review_store.update_status(review_store.enqueue_case("case-no-loss"), status="accepted")
+    provider = BundleCandidateProvider(review_store=review_store, structured_store=structured)
+
+    unfiltered = provider.list_candidates(limit=5)
+    filtered = provider.list_candidates(limit=5, criteria=BundleCriteria(min_loss_usd=50000, recency_days=30))
+    structured.close()
+
+    assert [candidate.case_id for candidate in unfiltered] == ["case-no-loss"]
+    assert filtered == []
+
+
+def test_bundle_candidate_provider_defers_structured_store_until_rows_exist() -> None:
+    factory_calls: List[int] = []
+
+    def _factory() -> _StubStructuredStore:
+        factory_calls.append(1)
+        return _StubStructuredStore()
+
+    empty_provider = BundleCandidateProvider(review_store=_NoRowsReviewStore(), structured_store_factory=_factory)
+    assert empty_provider.list_candidates(limit=5) == []
+    assert factory_calls == []
+
+    provider = BundleCandidateProvider(review_store=_MetricsReviewStore(), structured_store_factory=_factory)
+    provider.list_candidates(limit=5)
+    provider.list_candidates(limit=5)
+    assert factory_calls == [1]
+
+
 class _MemoryQueueStore:
     """Minimal in-memory queue stub for builder tests."""
 
@@ -131,14 +300,21 @@ class _MemoryQueueStore:
         self.plan_ids.append(plan.plan_id)
         return plan.plan_id
 
+    def enqueue_plans(self, plans, *, priority: str = "normal") -> List[str]:  # noqa: D401 - used as a stub
+        return [self.enqueue_plan(plan, priority=priority) for plan in plans]
+
 
 class _MetricsReviewStore:
     def __init__(self) -> None:
         self.view_calls = 0
+        self.filters: Dict[str, Any] = {}
 
-    def list_dossier_candidates(self, status: str = "accepted", limit: int = 200) -> List[Dict[str, Any]]:  # noqa: D401
+    def list_dossier_candidates(  # noqa: D401
+        self, status: str = "accepted", limit: int = 200, **filters: Any
+    ) -> List[Dict[str, Any]]:
         assert status == "accepted"
         self.view_calls += 1
+        self.filters = filters
         return [
             {
                 "case_id": "case-accepted",
@@ -164,13 +340,25 @@ class _StubReviewStore:
         ]
 
 
-class _EmptyViewReviewStore(_StubReviewStore):
+class _MissingViewReviewStore(_StubReviewStore):
     def __init__(self) -> None:
         self.view_calls = 0
 
-    def list_dossier_candidates(self, status: str = "accepted", limit: int = 200) -> List[Dict[str, Any]]:  # noqa: D401
+    def list_dossier_candidates(  # noqa: D401
+        self, status: str = "accepted", limit: int = 200, **filters: Any
+    ) -> List[Dict[str, Any]]:
         assert status == "accepted"
         self.view_calls += 1
+        raise sqlite3.OperationalError("no such table: main.scam_records")
+
+
+class _NoRowsReviewStore:
+    def list_dossier_candidates(  # noqa: D401
+        self, status: str = "accepted", limit: int = 200, **filters: Any
+    ) -> List[Dict[str, Any]]:
+        return []
+
+    def get_queue(self, status: str = "queued", limit: int = 25) -> List[Dict[str, Any]]:  # noqa: D401 - stub
         return []
 
 
@@ -181,14 +369,16 @@ class _StubRecord:
 
 
 class _StubStructuredStore:
-    def get_by_id(self, case_id: str) -> _StubRecord:  # noqa: D401 - stub interface
-        assert case_id == "case-accepted"
-        return _StubRecord(
-            metadata={
-                "loss_amount_usd": 65000,
-                "jurisdiction": "US-CA",
-                "victim_country": "US",
-                "scammer_country": "CN",
-            },
-            entities={"wallets": ["wallet:abc"], "emails": ["foo@example.com"]},
-        )
+    def get_by_ids(self, case_ids: List[str]) -> Dict[str, _StubRecord]:  # noqa: D401 - stub interface
+        assert case_ids == ["case-accepted"]
+        return {
+            "case-accepted": _StubRecord(
+                metadata={
+                    "loss_amount_usd": 65000,
+                    "jurisdiction": "US-CA",
+                    "victim_country": "US",
+                    "scammer_country": "CN",
+                },
+                entities={"wallets": ["wallet:abc"], "emails": ["foo@example.com"]},
+            )
+        }
@@ -32,3 +32,19 @@ def test_compute_bundle_metrics_handles_missing_metadata() -> None:
     assert metrics.loss_band == "unknown"
     assert metrics.cross_border is False
     assert metrics.geo_bucket == "UNKNOWN"
+
+
+def test_compute_bundle_metrics_band_edges_are_inclusive() -> None:
+    bands = {
+        amount: compute_bundle_metrics({"loss_amount_usd": amount}).loss_band
+        for amount in ("49999.99", "50000", "100000", "249999", "250000", "0")
+    }
+
+    assert bands == {
+        "49999.99": "below-50k",
+        "50000": "50k-100k",
+        "100000": "100k-250k",
+        "249999": "100k-250k",
+        "250000": "250k-plus",
+        "0": "unknown",
+    }
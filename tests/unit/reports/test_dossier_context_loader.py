@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, Iterable
 
 from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
@@ -66,6 +67,7 @@ def test_loader_emits_warnings_for_missing_data() -> None:
     assert result.cases[0].warnings == tuple(result.warnings)
 
 
+@lru_cache(maxsize=None)
 def _plan(case_id: str = "case-123") -> DossierPlan:
     candidate = DossierCandidate(
         case_id=case_id,
@@ -91,8 +93,8 @@ class _StubStructuredStore:
     def __init__(self, records: Dict[str, ScamRecord]) -> None:
         self._records = records
 
-    def get_by_id(self, case_id: str) -> ScamRecord | None:  # noqa: D401 - stub helper
-        return self._records.get(case_id)
+    def get_by_ids(self, case_ids: Iterable[str]) -> Dict[str, ScamRecord]:  # noqa: D401 - stub helper
+        return {case_id: self._records[case_id] for case_id in case_ids if case_id in self._records}
 
 
 class _StubReviewStore:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -27,14 +29,14 @@ EXPECTED_HASHES = {
 }
 
 
-def test_dossier_golden_sample_regression(tmp_path) -> None:
+def test_dossier_golden_sample_regression(tmp_path, template_registry: TemplateRegistry) -> None:
     artifact_dir = tmp_path / "artifacts"
     generator = DossierGenerator(
         artifact_dir=artifact_dir,
         context_loader=_GoldenContextLoader(),
         visuals_builder=_GoldenVisualBuilder(artifact_dir),
         tool_suite=_GoldenToolSuite(),
-        template_registry=TemplateRegistry(),
+        template_registry=template_registry,
         now_provider=lambda: GOLDEN_TIMESTAMP,
     )
     plan = _golden_plan()
@@ -44,14 +46,13 @@ def test_dossier_golden_sample_regression(tmp_path) -> None:
     manifest_path = artifact_dir / f"{plan.plan_id}.json"
     markdown_path = artifact_dir / f"{plan.plan_id}.md"
     signature_path = artifact_dir / f"{plan.plan_id}.signatures.json"
-    actual_hashes = {
-        "manifest": _sha256(manifest_path),
-        "markdown": _sha256(markdown_path),
-        "signatures": _sha256(signature_path),
-    }
+    # file_digest hashes inside OpenSSL with the GIL released, so the artifacts hash concurrently.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        digests = pool.map(_sha256, (manifest_path, markdown_path, signature_path))
+        actual_hashes = dict(zip(("manifest", "markdown", "signatures"), digests))
     assert actual_hashes == EXPECTED_HASHES
 
-    payload = json.loads(manifest_path.read_text())
+    payload = json.loads(manifest_path.read_bytes())
     assert payload["plan_id"] == plan.plan_id
     assert payload["case_count"] == 2
     assert payload["template_render"]["rendered_parts"] == ["cover", "analysis", "timeline", "entities", "appendix"]
@@ -195,22 +196,22 @@ class _GoldenToolSuite:
 
 
 def _jurisdiction_counts(plan: DossierPlan) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    for candidate in plan.cases:
-        key = candidate.jurisdiction or "unknown"
-        counts[key] = counts.get(key, 0) + 1
-    return counts
+    return dict(Counter(candidate.jurisdiction or "unknown" for candidate in plan.cases))
 
 
 def _entity_map(plan: DossierPlan) -> Dict[str, Sequence[str]]:
-    adjacency: Dict[str, list[str]] = {}
+    adjacency: defaultdict[str, list[str]] = defaultdict(list)
     for candidate in plan.cases:
         for entity in candidate.primary_entities:
-            adjacency.setdefault(entity, []).append(candidate.case_id)
+            adjacency[entity].append(candidate.case_id)
     return {entity: tuple(case_ids) for entity, case_ids in adjacency.items()}
 
 
 def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return digest.hexdigest()
+    with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
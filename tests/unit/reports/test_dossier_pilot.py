@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Iterator, NamedTuple
+
+import pytest
 
 from i4g.reports.bundle_builder import BundleBuilder, BundleCriteria
 from i4g.reports.bundle_candidates import BundleCandidateProvider
@@ -13,6 +18,41 @@ from i4g.store.review_store import ReviewStore
 from i4g.store.structured import StructuredStore
 
 
+class _PilotStores(NamedTuple):
+    review: ReviewStore
+    structured: StructuredStore
+    queue: DossierQueueStore
+
+
+@pytest.fixture(scope="module")
+def _pilot_store_handles(tmp_path_factory) -> Iterator[_PilotStores]:
+    db_path = tmp_path_factory.mktemp("pilot") / "pilot.db"
+    stores = _PilotStores(
+        review=ReviewStore(str(db_path)),
+        structured=StructuredStore(db_path=db_path),
+        queue=DossierQueueStore(db_path=db_path),
+    )
+    yield stores
+    stores.structured.close()
+    stores.queue.close()
+
+
+@pytest.fixture
+def pilot_stores(_pilot_store_handles: _PilotStores) -> _PilotStores:
+    """Return the module's shared stores with every table emptied."""
+
+    conn = sqlite3.connect(str(_pilot_store_handles.review.db_path))
+    with conn:
+        tables = [
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+        ]
+        for table in tables:
+            conn.execute(f'DELETE FROM "{table}"')
+    conn.close()
+    return _pilot_store_handles
+
+
 def _pilot_payload(case_id: str = "case-pilot-test") -> dict:
     return {
         "case_id": case_id,
@@ -23,7 +63,8 @@ def _pilot_payload(case_id: str = "case-pilot-test") -> dict:
         "jurisdiction": "US-CA",
         "victim_country": "US",
         "offender_country": "NG",
-        "accepted_at": "2025-11-18T12:00:00Z",
+        # Relative to now so the case stays inside the criteria's recency window.
+        "accepted_at": (datetime.now(timezone.utc) - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "entities": {"emails": ["pilot@example.com"]},
     }
 
@@ -41,10 +82,8 @@ def test_load_pilot_case_specs(tmp_path) -> None:
     assert specs[1].case_id == "case-pilot-alt"
 
 
-def test_seed_pilot_cases_creates_structured_and_queue_entries(tmp_path) -> None:
-    db_path = tmp_path / "pilot.db"
-    review_store = ReviewStore(str(db_path))
-    structured_store = StructuredStore(db_path=db_path)
+def test_seed_pilot_cases_creates_structured_and_queue_entries(pilot_stores: _PilotStores) -> None:
+    review_store, structured_store, _ = pilot_stores
     spec = PilotCaseSpec.from_dict(_pilot_payload())
 
     summary = seed_pilot_cases([spec], review_store=review_store, structured_store=structured_store)
@@ -58,17 +97,13 @@ def test_seed_pilot_cases_creates_structured_and_queue_entries(tmp_path) -> None
     entry = queue_entries[spec.case_id]
     assert entry["status"] == "accepted"
     assert entry["priority"] == "pilot"
-    structured_store.close()
 
 
-def test_schedule_pilot_plans_enqueues_queue(tmp_path) -> None:
-    db_path = tmp_path / "pilot.db"
-    review_store = ReviewStore(str(db_path))
-    structured_store = StructuredStore(db_path=db_path)
+def test_schedule_pilot_plans_enqueues_queue(pilot_stores: _PilotStores) -> None:
+    review_store, structured_store, queue_store = pilot_stores
     spec = PilotCaseSpec.from_dict(_pilot_payload())
     seed_pilot_cases([spec], review_store=review_store, structured_store=structured_store)
 
-    queue_store = DossierQueueStore(db_path=db_path)
     builder = BundleBuilder(queue_store=queue_store)
     provider = BundleCandidateProvider(review_store=review_store, structured_store=structured_store)
     criteria = BundleCriteria(
@@ -88,6 +123,7 @@ def test_schedule_pilot_plans_enqueues_queue(tmp_path) -> None:
     )
     assert dry_summary.dry_run is True
     assert dry_summary.plan_ids
+    assert queue_store.list_pending() == []
 
     live_summary = schedule_pilot_plans(
         [spec],
@@ -100,4 +136,3 @@ def test_schedule_pilot_plans_enqueues_queue(tmp_path) -> None:
     plan_record = queue_store.get_plan(live_summary.plan_ids[0])
     assert plan_record is not None
     assert plan_record["plan_id"] == live_summary.plan_ids[0]
-    structured_store.close()
@@ -3,48 +3,38 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
-from decimal import Decimal
+import os
+from dataclasses import replace
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
+import pytest
+
+from i4g.reports.bundle_builder import DossierPlan
 from i4g.reports.dossier_context import CaseContext, DossierContextResult
 from i4g.reports.dossier_pipeline import DossierGenerator
 from i4g.reports.dossier_queue_processor import DossierQueueProcessor
 from i4g.store.dossier_queue_store import DossierQueueStore
 
 
-def _sample_plan(plan_id: str = "dossier-us-ca-20251203-01") -> DossierPlan:
-    candidate = DossierCandidate(
-        case_id="case-1",
-        loss_amount_usd=Decimal("100000"),
-        accepted_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
-        jurisdiction="US-CA",
-        cross_border=False,
-        primary_entities=("wallet:abc",),
-    )
-    return DossierPlan(
-        plan_id=plan_id,
-        jurisdiction_key="US-CA",
-        created_at=datetime(2025, 12, 3, tzinfo=timezone.utc),
-        total_loss_usd=Decimal("100000"),
-        cases=[candidate],
-        bundle_reason="test-plan",
-        cross_border=False,
-        shared_drive_parent_id=None,
-    )
+@pytest.fixture
+def queue_store() -> Iterator[DossierQueueStore]:
+    """Queue state only lives for one test, so keep it off disk."""
+
+    store = DossierQueueStore(db_path=":memory:")
+    yield store
+    store.close()
 
 
-def test_dossier_generator_writes_manifest(tmp_path) -> None:
+def test_dossier_generator_writes_manifest(tmp_path, sample_plan, static_context_loader) -> None:
     artifact_dir = tmp_path / "artifacts"
-    generator = DossierGenerator(artifact_dir=artifact_dir, context_loader=_StaticContextLoader())
-    plan = _sample_plan()
+    generator = DossierGenerator(artifact_dir=artifact_dir, context_loader=static_context_loader)
+    plan = sample_plan
 
     result = generator.generate_from_plan(plan)
 
     output = Path(result.artifacts[0])
-    assert output.exists()
-    payload = json.loads(output.read_text())
+    payload = json.loads(output.read_bytes())
     assert payload["plan_id"] == plan.plan_id
     assert payload["case_count"] == 1
     analysis = payload["analysis"]
@@ -57,21 +47,14 @@ def test_dossier_generator_writes_manifest(tmp_path) -> None:
     assert payload["context"]["cases"][0]["structured_record"]["case_id"] == "case-1"
     assert payload["context"]["warnings"] == ["case-warning"]
     assets = payload["assets"]
-    timeline_path = (artifact_dir / assets["timeline_chart"]).resolve()
-    assert timeline_path.exists()
-    geojson_path = (artifact_dir / assets["geojson"]).resolve()
-    assert geojson_path.exists()
-    geo_map_path = (artifact_dir / assets["geo_map_image"]).resolve()
-    assert geo_map_path.exists()
     template_render = payload["template_render"]
     assert template_render["path"].endswith(".md")
-    markdown_path = (artifact_dir / template_render["path"]).resolve()
-    assert markdown_path.exists()
     signature_info = payload["signature_manifest"]
     signature_path = (artifact_dir / signature_info["path"]).resolve()
     assert signature_info["algorithm"] == "sha256"
-    assert signature_path.exists()
-    signature_payload = json.loads(signature_path.read_text())
+    written = [assets["timeline_chart"], assets["geojson"], assets["geo_map_image"], template_render["path"]]
+    assert _missing_paths([artifact_dir / path for path in written] + [signature_path]) == []
+    signature_payload = json.loads(signature_path.read_bytes())
     assert signature_payload["algorithm"] == "sha256"
     assert signature_payload["artifacts"][0]["label"] == "manifest"
     assert signature_payload["artifacts"][0]["path"].endswith(f"{plan.plan_id}.json")
@@ -79,15 +62,14 @@ def test_dossier_generator_writes_manifest(tmp_path) -> None:
     assert result.warnings == ["case-warning"]
 
 
-def test_processor_completes_and_marks_queue(tmp_path) -> None:
-    queue_store = DossierQueueStore(db_path=tmp_path / "queue.db")
-    plan = _sample_plan()
-    queue_store.enqueue_plan(plan)
-
+def test_processor_completes_and_marks_queue(tmp_path, queue_store, sample_plan) -> None:
+    plan = sample_plan
     generator = DossierGenerator(artifact_dir=tmp_path / "artifacts", context_loader=_EmptyContextLoader())
     processor = DossierQueueProcessor(queue_store=queue_store, generator=generator)
 
-    summary = processor.process_batch(batch_size=2)
+    with queue_store.bulk_session():
+        queue_store.enqueue_plan(plan)
+        summary = processor.process_batch(batch_size=2)
 
     assert summary.completed == 1
     entry = queue_store.get_plan(plan.plan_id)
@@ -95,12 +77,11 @@ def test_processor_completes_and_marks_queue(tmp_path) -> None:
     assert entry["warnings"] == []
     artifact_paths = [Path(path) for path in summary.plans[0]["artifacts"]]
     assert len(artifact_paths) == 3
-    assert all(path.exists() for path in artifact_paths)
+    assert _missing_paths(artifact_paths) == []
 
 
-def test_processor_dry_run_restores_pending(tmp_path) -> None:
-    queue_store = DossierQueueStore(db_path=tmp_path / "queue.db")
-    plan = _sample_plan()
+def test_processor_dry_run_restores_pending(tmp_path, queue_store, sample_plan) -> None:
+    plan = sample_plan
     queue_store.enqueue_plan(plan)
 
     processor = DossierQueueProcessor(
@@ -116,9 +97,8 @@ def test_processor_dry_run_restores_pending(tmp_path) -> None:
     assert entry and entry["status"] == "pending"
 
 
-def test_processor_marks_failures(tmp_path) -> None:
-    queue_store = DossierQueueStore(db_path=tmp_path / "queue.db")
-    plan = _sample_plan()
+def test_processor_marks_failures(queue_store, sample_plan) -> None:
+    plan = sample_plan
     queue_store.enqueue_plan(plan)
 
     class _FailingGenerator:
@@ -135,33 +115,72 @@ def test_processor_marks_failures(tmp_path) -> None:
     assert entry["error"] == "generation failed"
 
 
-def test_processor_persists_warnings(tmp_path) -> None:
-    queue_store = DossierQueueStore(db_path=tmp_path / "queue.db")
-    plan = _sample_plan()
-    queue_store.enqueue_plan(plan)
+def test_processor_returns_unstarted_leases_when_batch_aborts(queue_store, sample_plan) -> None:
+    queue_store.enqueue_plans([replace(sample_plan, plan_id="plan-a"), replace(sample_plan, plan_id="plan-b")])
+
+    class _Abort(BaseException):
+        pass
+
+    class _AbortingGenerator:
+        def generate_from_plan(self, plan: DossierPlan):  # noqa: D401 - simple stub
+            raise _Abort()
+
+    processor = DossierQueueProcessor(queue_store=queue_store, generator=_AbortingGenerator())
+
+    with pytest.raises(_Abort):
+        processor.process_batch(batch_size=2)
+
+    assert queue_store.get_plan("plan-a")["status"] == "leased"
+    assert queue_store.get_plan("plan-b")["status"] == "pending"
+
+
+def test_processor_streams_plan_summaries_to_callback(tmp_path, queue_store, sample_plan) -> None:
+    processor = DossierQueueProcessor(
+        queue_store=queue_store,
+        generator=DossierGenerator(artifact_dir=tmp_path / "artifacts", context_loader=_EmptyContextLoader()),
+    )
+    seen: list[dict] = []
 
-    generator = DossierGenerator(artifact_dir=tmp_path / "artifacts", context_loader=_StaticContextLoader())
+    with queue_store.bulk_session():
+        queue_store.enqueue_plan(replace(sample_plan, plan_id="plan-a"))
+        queue_store.enqueue_plan(replace(sample_plan, plan_id="plan-b"))
+        summary = processor.process_batch(batch_size=2, on_plan=seen.append)
+
+    assert [(entry["plan_id"], entry["status"]) for entry in seen] == [("plan-a", "completed"), ("plan-b", "completed")]
+    assert summary.completed == 2
+    assert summary.plans == []
+
+
+def test_processor_persists_warnings(tmp_path, queue_store, sample_plan, static_context_loader) -> None:
+    plan = sample_plan
+    generator = DossierGenerator(artifact_dir=tmp_path / "artifacts", context_loader=static_context_loader)
     processor = DossierQueueProcessor(queue_store=queue_store, generator=generator)
 
-    summary = processor.process_batch(batch_size=1)
+    with queue_store.bulk_session():
+        queue_store.enqueue_plan(plan)
+        summary = processor.process_batch(batch_size=1)
 
     assert summary.completed == 1
     entry = queue_store.get_plan(plan.plan_id)
     assert entry and entry["warnings"] == ["case-warning"]
 
 
-class _StaticContextLoader:
-    def load(self, plan: DossierPlan) -> DossierContextResult:  # noqa: D401 - stub helper
-        contexts = [
-            CaseContext(
-                case_id=case.case_id,
-                structured_record={"case_id": case.case_id, "text": "context-text"},
-                review={"review_id": f"review-{case.case_id}"},
-                warnings=("case-warning",),
-            )
-            for case in plan.cases
-        ]
-        return DossierContextResult(cases=tuple(contexts), warnings=("case-warning",))
+def _missing_paths(paths: Iterable[Path]) -> list[Path]:
+    """Return the entries of ``paths`` that do not exist, listing each parent directory once."""
+
+    listings: dict[Path, set[str]] = {}
+    missing = []
+    for path in paths:
+        path = path.resolve()
+        if path.parent not in listings:
+            try:
+                with os.scandir(path.parent) as entries:
+                    listings[path.parent] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                listings[path.parent] = set()
+        if path.name not in listings[path.parent]:
+            missing.append(path)
+    return missing
 
 
 class _EmptyContextLoader:
@@ -5,24 +5,46 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
+import pytest
+
+from i4g.reports import dossier_signatures
 from i4g.reports.dossier_signatures import generate_signature_manifest, verify_manifest_payload
 
 
-def test_generate_signature_manifest_hashes_files(tmp_path) -> None:
+def _reference_digest(data: bytes, algorithm: str) -> str:
+    if algorithm == "blake3":
+        blake3 = pytest.importorskip("blake3")
+        return blake3.blake3(data).hexdigest()
+    return hashlib.new(algorithm, data).hexdigest()
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake3"])
+def test_generate_signature_manifest_hashes_files(tmp_path, algorithm: str) -> None:
     artifact = tmp_path / "sample.txt"
     artifact.write_text("dossier artifact")
+    expected_hash = _reference_digest(artifact.read_bytes(), algorithm)
 
-    manifest = generate_signature_manifest([("manifest", artifact)])
+    manifest = generate_signature_manifest([("manifest", artifact)], algorithm=algorithm)
 
-    assert manifest.algorithm == "sha256"
+    assert manifest.algorithm == algorithm
     assert len(manifest.artifacts) == 1
     entry = manifest.artifacts[0]
     assert entry.path == artifact
     assert entry.size_bytes == artifact.stat().st_size
-    expected_hash = hashlib.sha256(artifact.read_bytes()).hexdigest()
     assert entry.hash_value == expected_hash
 
 
+def test_generate_signature_manifest_hashes_large_files_via_mmap(tmp_path) -> None:
+    artifact = tmp_path / "large.bin"
+    payload = bytes(range(256)) * 1024
+    artifact.write_bytes(payload)
+
+    manifest = generate_signature_manifest([("large", artifact)], algorithm="sha512")
+
+    assert manifest.artifacts[0].size_bytes == len(payload)
+    assert manifest.artifacts[0].hash_value == hashlib.sha512(payload).hexdigest()
+
+
 def test_generate_signature_manifest_handles_missing_files(tmp_path) -> None:
     missing = Path(tmp_path / "missing.txt")
 
@@ -32,12 +54,13 @@ def test_generate_signature_manifest_handles_missing_files(tmp_path) -> None:
     assert manifest.warnings == (f"Artifact missing missing on disk at {missing}",)
 
 
-def test_verify_manifest_payload_matches_hash(tmp_path) -> None:
+@pytest.mark.parametrize("algorithm", ["sha256", "blake3"])
+def test_verify_manifest_payload_matches_hash(tmp_path, algorithm: str) -> None:
     artifact = tmp_path / "signed.json"
     artifact.write_text("payload")
-    expected_hash = hashlib.sha256(artifact.read_bytes()).hexdigest()
+    expected_hash = _reference_digest(artifact.read_bytes(), algorithm)
     manifest_payload = {
-        "algorithm": "sha256",
+        "algorithm": algorithm,
         "artifacts": [
             {
                 "label": "manifest",
@@ -99,6 +122,25 @@ def test_verify_manifest_payload_detects_mismatch(tmp_path) -> None:
     assert report.all_verified is False
 
 
+def test_verify_manifest_payload_skips_hash_when_size_differs(tmp_path, monkeypatch) -> None:
+    artifact = tmp_path / "signed.json"
+    artifact.write_text("payload")
+    manifest = generate_signature_manifest([("manifest", artifact)]).to_dict()
+    artifact.write_text("tampered payload")
+    monkeypatch.setattr(
+        dossier_signatures, "_hash_file", lambda *args, **kwargs: pytest.fail("size mismatch should skip hashing")
+    )
+
+    report = verify_manifest_payload(manifest)
+
+    artifact_report = report.artifacts[0]
+    assert artifact_report.exists is True
+    assert artifact_report.matches is False
+    assert artifact_report.actual_hash is None
+    assert artifact_report.error == f"Size mismatch: manifest records 7 bytes, found {artifact.stat().st_size}"
+    assert report.mismatch_count == 1
+
+
 def test_verify_manifest_payload_resolves_relative_paths(tmp_path) -> None:
     base_dir = tmp_path / "artifacts"
     base_dir.mkdir()
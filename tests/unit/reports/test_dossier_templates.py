@@ -2,39 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from decimal import Decimal
-
-from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
 from i4g.reports.dossier_analysis import analyze_plan
 from i4g.reports.dossier_templates import TemplatePart, TemplateRegistry
 
 
-def _plan() -> DossierPlan:
-    accepted_at = datetime(2025, 12, 3, tzinfo=timezone.utc)
-    candidate = DossierCandidate(
-        case_id="case-1",
-        loss_amount_usd=Decimal("150000"),
-        accepted_at=accepted_at,
-        jurisdiction="US-CA",
-        cross_border=False,
-        primary_entities=("wallet:xyz",),
-    )
-    return DossierPlan(
-        plan_id="dossier-us-ca",
-        jurisdiction_key="US-CA",
-        created_at=accepted_at,
-        total_loss_usd=candidate.loss_amount_usd,
-        cases=[candidate],
-        bundle_reason="unit test",
-        cross_border=False,
-        shared_drive_parent_id=None,
-    )
-
-
-def test_template_registry_renders_default_templates(tmp_path) -> None:
-    registry = TemplateRegistry()
-    plan = _plan()
+def test_template_registry_renders_default_templates(
+    tmp_path, template_registry: TemplateRegistry, sample_plan
+) -> None:
+    registry = template_registry
+    plan = sample_plan
     analysis = analyze_plan(plan)
 
     result = registry.render(
@@ -54,7 +30,7 @@ def test_template_registry_renders_default_templates(tmp_path) -> None:
     assert result.warnings == ()
 
 
-def test_template_registry_warns_when_required_template_missing(tmp_path) -> None:
+def test_template_registry_warns_when_required_template_missing(tmp_path, sample_plan) -> None:
     template_dir = tmp_path / "templates"
     template_dir.mkdir()
     (template_dir / "cover.md.j2").write_text("Cover {{ plan.plan_id }}")
@@ -65,7 +41,7 @@ def test_template_registry_warns_when_required_template_missing(tmp_path) -> Non
             TemplatePart(name="analysis", template_name="analysis.md.j2", required=True),
         ),
     )
-    plan = _plan()
+    plan = sample_plan
     analysis = analyze_plan(plan)
 
     result = registry.render(
@@ -80,3 +56,12 @@ def test_template_registry_warns_when_required_template_missing(tmp_path) -> Non
 
     assert result.warnings == (f"Template 'analysis.md.j2' was not found in {template_dir}",)
     assert result.rendered_parts == ("cover",)
+
+
+def test_registries_share_environment_per_template_dir(tmp_path) -> None:
+    first = TemplateRegistry(template_dir=tmp_path)
+    second = TemplateRegistry(template_dir=tmp_path)
+
+    assert first._environment is second._environment
+    assert first._environment.auto_reload is False
+    assert TemplateRegistry()._environment is not first._environment
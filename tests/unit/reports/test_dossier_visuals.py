@@ -4,31 +4,41 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 
+import pytest
+from PIL import Image
+
+from i4g.reports import dossier_visuals
 from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
 from i4g.reports.dossier_visuals import DossierVisualBuilder, GeoMapRenderer, LossTimelineRenderer
 
 
-def test_loss_timeline_renderer_outputs_chart(tmp_path) -> None:
+def test_loss_timeline_renderer_outputs_chart(tmp_path, png_sink) -> None:
     renderer = LossTimelineRenderer(output_dir=tmp_path)
     plan = _plan(jurisdictions=("US-CA", "US-NY"))
 
-    result = renderer.render(plan)
+    result = renderer.render(plan, sink=png_sink)
 
-    assert result.image_path is not None
-    assert result.image_path.exists()
+    assert result.image_path == tmp_path / "test-dossier_loss_timeline.png"
+    assert not result.image_path.exists()
+    assert png_sink.getbuffer().nbytes > 0
     assert result.warnings == ()
 
 
-def test_geo_renderer_generates_geojson_and_map(tmp_path) -> None:
+def test_geo_renderer_generates_geojson_and_map(tmp_path, png_sink) -> None:
     renderer = GeoMapRenderer(output_dir=tmp_path)
     plan = _plan(jurisdictions=("US-CA", "ZZ-UNKNOWN"))
 
-    result = renderer.render(plan)
+    result = renderer.render(plan, sink=png_sink)
 
     assert result.geojson_path is not None and result.geojson_path.exists()
-    assert result.image_path is not None and result.image_path.exists()
+    assert result.image_path is not None and result.image_path.suffix == ".png"
     assert result.warnings == ("No coordinates available for jurisdiction ZZ-UNKNOWN",)
+    png_sink.seek(0)
+    with Image.open(png_sink) as image:
+        assert image.getpixel((100, 100)) == (4, 28, 50)
+        assert image.getpixel((160, 100)) == (15, 45, 68)
 
 
 def test_visual_builder_combines_assets(tmp_path) -> None:
@@ -48,6 +58,7 @@ def test_visual_builder_combines_assets(tmp_path) -> None:
     assert relative_snapshot["geojson"].startswith("assets/")
 
 
+@lru_cache(maxsize=None)
 def _plan(jurisdictions: tuple[str, str]) -> DossierPlan:
     now = datetime(2025, 12, 3, tzinfo=timezone.utc)
     cases = []
@@ -72,3 +83,49 @@ def _plan(jurisdictions: tuple[str, str]) -> DossierPlan:
         cross_border=True,
         shared_drive_parent_id=None,
     )
+
+
+def test_geo_renderer_resolves_region_fallback(tmp_path) -> None:
+    renderer = GeoMapRenderer(output_dir=tmp_path)
+
+    assert renderer._resolve_coordinates("us-ca") == (36.77, -119.42)
+    assert renderer._resolve_coordinates("GB-LND") == (55.38, -3.44)
+    assert renderer._resolve_coordinates("ZZ-UNKNOWN") is None
+    assert renderer._resolve_coordinates(None) is None
+
+
+def test_renderers_support_webp_output(tmp_path) -> None:
+    plan = _plan(jurisdictions=("US-CA", "US-NY"))
+
+    chart = LossTimelineRenderer(output_dir=tmp_path, image_format="webp").render(plan)
+    geo = GeoMapRenderer(output_dir=tmp_path, image_format="webp").render(plan)
+
+    assert chart.image_path is not None and chart.image_path.suffix == ".webp"
+    assert geo.image_path is not None and geo.image_path.suffix == ".webp"
+    with Image.open(chart.image_path) as image:
+        assert image.format == "WEBP"
+
+
+def test_renderers_recycle_canvases_cleanly(tmp_path) -> None:
+    renderer = LossTimelineRenderer(output_dir=tmp_path)
+    renderer.render(_plan(jurisdictions=("US-CA", "US-NY")))
+
+    recycled = dossier_visuals._acquire_image(Image.new("RGB", (900, 420), (255, 255, 255)))
+
+    assert recycled.getextrema() == ((255, 255), (255, 255), (255, 255))
+    dossier_visuals._release_image(recycled)
+
+
+def test_renderers_release_canvas_when_drawing_fails(tmp_path, monkeypatch) -> None:
+    renderer = LossTimelineRenderer(output_dir=tmp_path)
+    renderer.render(_plan(jurisdictions=("US-CA", "US-NY")))
+    pooled = len(dossier_visuals._IMAGE_POOL[(900, 420)])
+
+    def _boom(_value: int) -> str:
+        raise RuntimeError("draw failed")
+
+    monkeypatch.setattr(dossier_visuals, "_format_usd", _boom)
+    with pytest.raises(RuntimeError):
+        renderer.render(_plan(jurisdictions=("US-CA", "US-NY")))
+
+    assert len(dossier_visuals._IMAGE_POOL[(900, 420)]) == pooled
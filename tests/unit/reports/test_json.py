@@ -0,0 +1,40 @@
+"""Tests for the shared JSON encoding helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from i4g.reports import _json
+
+_SIGNED_PAYLOAD = {"victim": "Zoë Ødegård", "score": 1e-05, "loss_usd": 150000.5, "tags": ["crypto", "ñ"]}
+_TEXT_PAYLOAD = {"victim": "Zoë Ødegård", "count": 2, "nested": {"tags": ["crypto", "ñ"], "flag": None}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with the stdlib fallback."""
+
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_stable_is_independent_of_orjson(encoder) -> None:
+    assert _json.dumps_stable(_SIGNED_PAYLOAD) == json.dumps(_SIGNED_PAYLOAD, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("indent", [False, True], ids=["compact", "indented"])
+def test_dumps_matches_across_encoders(encoder, indent: bool) -> None:
+    expected = json.dumps(
+        _TEXT_PAYLOAD,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    assert _json.dumps(_TEXT_PAYLOAD, indent=indent) == expected
+    assert _json.loads(expected) == _TEXT_PAYLOAD
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import json
+import os
+import stat
 from types import SimpleNamespace
 
+import pytest
+
 from i4g.scripts import saved_searches
 
 
@@ -43,3 +48,57 @@ def test_argument_parser_defaults_follow_settings(monkeypatch):
 
     assert args.tag == "taggy-v2"
     assert args.schema_version == "schema-v3"
+
+
+def test_annotate_file_writes_indented_json(tmp_path):
+    source = tmp_path / "saved.json"
+    source.write_text(json.dumps([{"name": "Test", "tags": ["legacy"]}]), encoding="utf-8")
+
+    destination, count = saved_searches.annotate_file(source, tag="hybrid-v1", schema_version="v2", dedupe=False)
+
+    assert destination == source and count == 1
+    content = source.read_text(encoding="utf-8")
+    assert content.endswith("\n")
+    assert content.startswith("[\n  {")
+    assert json.loads(content)[0]["tags"] == ["legacy", "hybrid-v1"]
+
+
+def test_annotate_file_preserves_permissions(tmp_path):
+    source = tmp_path / "saved.json"
+    source.write_text(json.dumps([{"name": "Test"}]), encoding="utf-8")
+    source.chmod(0o640)
+    new_output = tmp_path / "out" / "annotated.json"
+    umask = os.umask(0o022)
+    try:
+        saved_searches.annotate_file(source, tag="hybrid-v1", schema_version="v2", dedupe=False)
+        saved_searches.annotate_file(source, output_path=new_output, tag="hybrid-v1", schema_version="v2", dedupe=False)
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(source.stat().st_mode) == 0o640
+    assert stat.S_IMODE(new_output.stat().st_mode) == 0o644
+
+
+def test_iter_records_streams_arrays_and_accepts_single_object(tmp_path):
+    array_path = tmp_path / "array.json"
+    array_path.write_text(json.dumps([{"name": "a"}, "skip-me", {"name": "b", "score": 1.5}]), encoding="utf-8")
+    object_path = tmp_path / "object.json"
+    object_path.write_text(json.dumps({"name": "solo"}), encoding="utf-8")
+    scalar_path = tmp_path / "scalar.json"
+    scalar_path.write_text("42", encoding="utf-8")
+
+    assert list(saved_searches.iter_records(array_path)) == [{"name": "a"}, {"name": "b", "score": 1.5}]
+    assert saved_searches.load_records(object_path) == [{"name": "solo"}]
+    with pytest.raises(ValueError):
+        saved_searches.load_records(scalar_path)
+
+
+def test_annotate_records_dedupe_keeps_first_spelling():
+    annotated = saved_searches.annotate_records(
+        [{"tags": ["Hybrid-V1", "legacy", "LEGACY"]}],
+        tag="hybrid-v1",
+        schema_version="",
+        dedupe=True,
+    )
+
+    assert annotated[0]["tags"] == ["Hybrid-V1", "legacy"]
@@ -401,3 +401,33 @@ def test_observability_statsd_env_overrides(monkeypatch: object) -> None:
     assert overridden.observability.statsd_port == 18125
     assert overridden.observability.statsd_prefix == "proto"
     assert overridden.observability.service_name == "hybrid-search"
+
+
+def test_report_image_format_env_override(monkeypatch: object) -> None:
+    """Dossier image format defaults to PNG and accepts WebP via env vars."""
+
+    _clear_env(monkeypatch, "I4G_REPORT__IMAGE_FORMAT", "REPORT_IMAGE_FORMAT", "REPORT__IMAGE_FORMAT", "I4G_ENV")
+
+    assert reload_settings(env="dev").report.image_format == "png"
+
+    _set_env(monkeypatch, "I4G_REPORT__IMAGE_FORMAT", "webp")
+    assert reload_settings(env="dev").report.image_format == "webp"
+
+    _set_env(monkeypatch, "I4G_REPORT__IMAGE_FORMAT", "gif")
+    with pytest.raises(ValidationError):
+        reload_settings(env="dev")
+
+
+def test_api_rate_limit_env_override(monkeypatch: object) -> None:
+    """The review API rate limit defaults to 10 requests per minute and accepts env overrides."""
+
+    _clear_env(monkeypatch, "I4G_API__RATE_LIMIT_PER_MINUTE", "API_RATE_LIMIT_PER_MINUTE", "I4G_ENV")
+
+    assert reload_settings(env="dev").api.rate_limit_per_minute == 10
+
+    _set_env(monkeypatch, "I4G_API__RATE_LIMIT_PER_MINUTE", "0")
+    assert reload_settings(env="dev").api.rate_limit_per_minute == 0
+
+    _set_env(monkeypatch, "I4G_API__RATE_LIMIT_PER_MINUTE", "-1")
+    with pytest.raises(ValidationError):
+        reload_settings(env="dev")
@@ -0,0 +1,146 @@
+"""Unit tests for the SQLite-backed DossierQueueStore."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from i4g.reports.bundle_builder import DossierCandidate, DossierPlan
+from i4g.store.dossier_queue_store import DossierQueueStore
+
+_ACCEPTED_AT = datetime(2025, 12, 1, tzinfo=timezone.utc)
+_CREATED_AT = datetime(2025, 12, 3, tzinfo=timezone.utc)
+_LOSS_USD = Decimal("75000")
+
+
+def _plan(plan_id: str) -> DossierPlan:
+    candidate = DossierCandidate(
+        case_id=f"{plan_id}-case",
+        loss_amount_usd=_LOSS_USD,
+        accepted_at=_ACCEPTED_AT,
+        jurisdiction="US-CA",
+    )
+    return DossierPlan(
+        plan_id=plan_id,
+        jurisdiction_key="US-CA",
+        created_at=_CREATED_AT,
+        total_loss_usd=_LOSS_USD,
+        cases=[candidate],
+        bundle_reason="store-test",
+        cross_border=False,
+        shared_drive_parent_id=None,
+    )
+
+
+def test_store_enables_wal_journal(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+
+    with store._connect() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode.lower() == "wal"
+    store.close()
+
+
+def test_lease_next_returns_oldest_pending_once(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+    store.enqueue_plan(_plan("plan-a"))
+    store.enqueue_plan(_plan("plan-b"))
+
+    first = store.lease_next()
+    second = store.lease_next()
+
+    assert first and first["plan_id"] == "plan-a"
+    assert first["payload"]["plan_id"] == "plan-a"
+    assert second and second["plan_id"] == "plan-b"
+    assert store.lease_next() is None
+    entry = store.get_plan("plan-a")
+    assert entry and entry["status"] == "leased"
+
+
+def test_pending_scan_uses_status_queued_index(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+
+    with store._connect() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT plan_id FROM dossier_queue WHERE status='pending' ORDER BY queued_at LIMIT 1"
+        ).fetchall()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_dossier_queue_status_queued" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_enqueue_plans_inserts_batch_and_resets_existing(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+    store.enqueue_plan(_plan("plan-a"))
+    store.mark_failed("plan-a", error="boom")
+
+    plan_ids = store.enqueue_plans([_plan("plan-a"), _plan("plan-b"), _plan("plan-c")])
+
+    assert plan_ids == ["plan-a", "plan-b", "plan-c"]
+    pending = store.list_pending(limit=10)
+    assert sorted(entry["plan_id"] for entry in pending) == plan_ids
+    entry = store.get_plan("plan-a")
+    assert entry and entry["status"] == "pending" and entry["error"] is None
+    assert store.enqueue_plans([]) == []
+
+
+def test_listing_without_payload_skips_plan_json(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+    store.enqueue_plan(_plan("plan-a"))
+
+    plans = store.list_plans(include_payload=False)
+
+    assert plans[0]["status"] == "pending" and plans[0]["payload"] is None
+    assert store.list_plans()[0]["payload"]["plan_id"] == "plan-a"
+
+
+def test_memory_store_keeps_queue_on_shared_connection() -> None:
+    store = DossierQueueStore(db_path=":memory:")
+    store.enqueue_plan(_plan("plan-a"))
+
+    leased = store.lease_next()
+
+    assert store.db_path == ":memory:"
+    assert leased and leased["plan_id"] == "plan-a"
+    assert store.lease_next() is None
+    store.close()
+
+
+def test_bulk_session_commits_once_and_rolls_back_on_error(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+
+    with store.bulk_session():
+        store.enqueue_plan(_plan("plan-a"))
+        store.mark_failed("plan-a", error="boom")
+        with store.bulk_session():
+            store.enqueue_plans([_plan("plan-b")])
+    try:
+        with store.bulk_session():
+            store.enqueue_plan(_plan("plan-c"))
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    assert store.get_plan("plan-a")["status"] == "failed"
+    assert store.get_plan("plan-b")["status"] == "pending"
+    assert store.get_plan("plan-c") is None
+    store.close()
+
+
+def test_lease_batch_claims_oldest_pending_in_queue_order(tmp_path) -> None:
+    store = DossierQueueStore(db_path=tmp_path / "queue.db")
+    store.enqueue_plans([_plan("plan-a"), _plan("plan-b"), _plan("plan-c")])
+
+    leased = store.lease_batch(2)
+
+    assert [entry["plan_id"] for entry in leased] == ["plan-a", "plan-b"]
+    assert leased[0]["payload"]["plan_id"] == "plan-a"
+    assert store.get_plan("plan-b")["status"] == "leased"
+    assert [entry["plan_id"] for entry in store.lease_batch(5)] == ["plan-c"]
+    assert store.lease_batch(5) == []
+    assert store.lease_batch(0) == []
+    store.enqueue_plan(_plan("plan-d"))
+    assert set(leased[0]) == set(store.lease_next())
+    store.close()
@@ -1,113 +1,166 @@
 """Unit tests for the review API router.
 
-These tests use FastAPI's TestClient and a mocked ReviewStore to verify
-API behavior without touching the filesystem.
+These tests drive the app through an in-process httpx AsyncClient and a mocked
+ReviewStore to verify API behavior without touching the filesystem.
 """
 
+import copy
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from i4g.api.app import app
 from i4g.api.review import SETTINGS, get_hybrid_search_service, get_retriever, get_store
 from i4g.services.hybrid_search import HybridSearchService
+from i4g.store.entity_store import EntityStore
+from i4g.store.retriever import HybridRetriever
+from i4g.store.review_store import ReviewStore
 
-client = TestClient(app)
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
 
 
 @pytest.fixture(autouse=True)
-def clear_rate_limit():
-    from i4g.api import app as app_module
+def reset_dependency_overrides():
+    """Restore the app's dependency overrides even when a test fails midway."""
 
-    app_module.REQUEST_LOG.clear()
+    saved = dict(app.dependency_overrides)
     yield
-    app_module.REQUEST_LOG.clear()
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
 
 
-def make_mock_store():
-    ms = MagicMock()
-    ms.enqueue_case.return_value = "rev-1"
-    ms.get_queue.return_value = [{"review_id": "rev-1", "case_id": "CASE-A", "status": "queued"}]
-    ms.get_review.return_value = {
-        "review_id": "rev-1",
-        "case_id": "CASE-A",
-        "status": "queued",
-    }
-    ms.update_status.return_value = None
-    ms.log_action.return_value = "action-1"
-    ms.get_actions.return_value = [{"action_id": "action-1", "actor": "analyst"}]
-    ms.get_reviews_by_case.return_value = []
-    ms.get_recent_actions.return_value = [
-        {
-            "action_id": "search-1",
-            "review_id": "search",
-            "actor": "analyst_1",
-            "action": "search",
-            "payload": {
-                "search_id": "search:abc",
-                "text": "wallet",
-                "saved_search": {
-                    "id": "saved:wallets",
-                    "name": "Wallet Sweep",
-                    "owner": "analyst_1",
-                    "tags": ["wallets", "crypto"],
+def _async_const(value):
+    """Return an async dependency override; FastAPI runs sync overrides in its threadpool."""
+
+    async def _dependency():
+        return value
+
+    return _dependency
+
+
+_HEADERS = {"X-API-KEY": "dev-analyst-token"}
+_JSON_HEADERS = {**_HEADERS, "Content-Type": "application/json"}
+
+# Static request bodies are serialized once; tests post them with ``content=`` instead of ``json=``.
+_ENQUEUE_BODY = json.dumps({"case_id": "CASE-A", "priority": "high"}).encode()
+_DECISION_BODY = json.dumps({"decision": "accepted", "notes": "Looks valid"}).encode()
+_AUTO_REPORT_DECISION_BODY = json.dumps(
+    {"decision": "accepted", "notes": "Auto report", "auto_generate_report": True}
+).encode()
+_BULK_TAGS_BODY = json.dumps({"search_ids": ["saved:1", "saved:2"], "add": ["wallet"], "remove": ["old"]}).encode()
+_IMPORT_BODY = json.dumps({"name": "Wallet", "params": {"text": "wallet"}, "favorite": True}).encode()
+
+_DEPENDENCIES = {
+    "store": get_store,
+    "retriever": get_retriever,
+    "hybrid_search_service": get_hybrid_search_service,
+}
+
+
+def _override_deps(**values):
+    """Install async overrides for the named review dependencies in one update."""
+
+    app.dependency_overrides.update({_DEPENDENCIES[name]: _async_const(value) for name, value in values.items()})
+
+
+@pytest.fixture(scope="session")
+def _mock_store_config():
+    """Return the canned ReviewStore responses shared by every review API test."""
+
+    return {
+        "enqueue_case.return_value": "rev-1",
+        "get_queue.return_value": [{"review_id": "rev-1", "case_id": "CASE-A", "status": "queued"}],
+        "get_review.return_value": {
+            "review_id": "rev-1",
+            "case_id": "CASE-A",
+            "status": "queued",
+        },
+        "update_status.return_value": None,
+        "log_action.return_value": "action-1",
+        "get_actions.return_value": [{"action_id": "action-1", "actor": "analyst"}],
+        "get_reviews_by_case.return_value": [],
+        "get_recent_actions.return_value": [
+            {
+                "action_id": "search-1",
+                "review_id": "search",
+                "actor": "analyst_1",
+                "action": "search",
+                "payload": {
+                    "search_id": "search:abc",
+                    "text": "wallet",
+                    "saved_search": {
+                        "id": "saved:wallets",
+                        "name": "Wallet Sweep",
+                        "owner": "analyst_1",
+                        "tags": ["wallets", "crypto"],
+                    },
+                    "saved_search_id": "saved:wallets",
+                    "saved_search_name": "Wallet Sweep",
+                    "saved_search_owner": "analyst_1",
+                    "saved_search_tags": ["wallets", "crypto"],
                 },
-                "saved_search_id": "saved:wallets",
-                "saved_search_name": "Wallet Sweep",
-                "saved_search_owner": "analyst_1",
-                "saved_search_tags": ["wallets", "crypto"],
-            },
-            "created_at": "2024-01-01T00:00:00Z",
-        }
-    ]
-    ms.bulk_update_tags.return_value = 1
-    ms.clone_saved_search.return_value = "saved:shared"
-    return ms
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+        ],
+        "bulk_update_tags.return_value": 1,
+        "clone_saved_search.return_value": "saved:shared",
+    }
+
+
+@pytest.fixture
+def mock_store(_mock_store_config):
+    """Return a fresh store mock per test; responses are deep-copied so handlers cannot leak mutations."""
+
+    return MagicMock(spec=ReviewStore, **copy.deepcopy(_mock_store_config))
 
 
-def test_enqueue_and_list_queue():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
+@pytest.fixture
+def mock_retriever():
+    return MagicMock(spec=HybridRetriever)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    payload = {"case_id": "CASE-A", "priority": "high"}
-    r = client.post("/reviews/", json=payload, headers=headers)
+
+@pytest.fixture
+def hybrid_service(mock_retriever):
+    return HybridSearchService(retriever=mock_retriever, entity_store=MagicMock(spec=EntityStore))
+
+
+async def test_enqueue_and_list_queue(aclient, mock_store):
+    _override_deps(store=mock_store)
+
+    r = await aclient.post("/reviews/", content=_ENQUEUE_BODY, headers=_JSON_HEADERS)
     assert r.status_code == 200
     body = r.json()
     assert body["review_id"] == "rev-1"
 
-    r2 = client.get("/reviews/queue", headers=headers)
+    r2 = await aclient.get("/reviews/queue", headers=_HEADERS)
     assert r2.status_code == 200
     data = r2.json()
     assert data["count"] == 1
 
-    app.dependency_overrides = {}
 
+async def test_claim_and_decision_and_actions(aclient, mock_store):
+    _override_deps(store=mock_store)
 
-def test_claim_and_decision_and_actions():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.post("/reviews/rev-1/claim", headers=headers)
+    r = await aclient.post("/reviews/rev-1/claim", headers=_HEADERS)
     assert r.status_code == 200
     assert r.json()["status"] == "in_review"
 
-    dec = {"decision": "accepted", "notes": "Looks valid"}
-    r2 = client.post("/reviews/rev-1/decision", json=dec, headers=headers)
+    r2 = await aclient.post("/reviews/rev-1/decision", content=_DECISION_BODY, headers=_JSON_HEADERS)
     assert r2.status_code == 200
     assert r2.json()["status"] == "accepted"
 
-    r3 = client.get("/reviews/rev-1/actions", headers=headers)
+    r3 = await aclient.get("/reviews/rev-1/actions", headers=_HEADERS)
     assert r3.status_code == 200
     assert len(r3.json()["actions"]) == 1
 
-    app.dependency_overrides = {}
-
 
-def test_search_cases_returns_combined_results():
-    mock_retriever = MagicMock()
+async def test_search_cases_returns_combined_results(aclient, mock_store, mock_retriever, hybrid_service):
     mock_retriever.query.return_value = {
         "results": [
             {"case_id": "CASE-A", "score": 0.8, "sources": ["vector"]},
@@ -117,16 +170,9 @@ def test_search_cases_returns_combined_results():
         "vector_hits": 6,
         "structured_hits": 7,
     }
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_retriever] = lambda: mock_retriever
-    app.dependency_overrides[get_store] = lambda: mock_store
-    app.dependency_overrides[get_hybrid_search_service] = lambda: HybridSearchService(
-        retriever=mock_retriever,
-        entity_store=MagicMock(),
-    )
+    _override_deps(retriever=mock_retriever, store=mock_store, hybrid_search_service=hybrid_service)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.get(
+    r = await aclient.get(
         "/reviews/search",
         params={
             "text": "wallet",
@@ -137,7 +183,7 @@ def test_search_cases_returns_combined_results():
             "offset": 2,
             "page_size": 4,
         },
-        headers=headers,
+        headers=_HEADERS,
     )
     assert r.status_code == 200
     payload = r.json()
@@ -168,49 +214,37 @@ def test_search_cases_returns_combined_results():
     assert logged_payload["merged_results"] == counts.get("merged_results")
     assert logged_payload["source_breakdown"] == counts.get("source_breakdown")
 
-    app.dependency_overrides = {}
-
 
-def test_reviews_by_case_endpoint():
-    mock_store = make_mock_store()
+async def test_reviews_by_case_endpoint(aclient, mock_store):
     mock_store.get_reviews_by_case.return_value = [
         {"review_id": "rev-1", "case_id": "CASE-A", "status": "queued"},
         {"review_id": "rev-2", "case_id": "CASE-A", "status": "accepted"},
     ]
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.get("/reviews/case/CASE-A", params={"limit": 2}, headers=headers)
+    r = await aclient.get("/reviews/case/CASE-A", params={"limit": 2}, headers=_HEADERS)
     assert r.status_code == 200
     body = r.json()
     assert body["count"] == 2
     assert body["case_id"] == "CASE-A"
     mock_store.get_reviews_by_case.assert_called_once_with(case_id="CASE-A", limit=2)
 
-    app.dependency_overrides = {}
 
+async def test_search_history_returns_recent_events(aclient, mock_store):
+    _override_deps(store=mock_store)
 
-def test_search_history_returns_recent_events():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.get("/reviews/search/history", params={"limit": 5}, headers=headers)
+    r = await aclient.get("/reviews/search/history", params={"limit": 5}, headers=_HEADERS)
     assert r.status_code == 200
     body = r.json()
     assert body["count"] == 1
     assert body["events"][0]["payload"]["search_id"] == "search:abc"
     mock_store.get_recent_actions.assert_called_once_with(action="search", limit=5)
 
-    app.dependency_overrides = {}
-
 
-def test_search_history_includes_saved_search_descriptor():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
+async def test_search_history_includes_saved_search_descriptor(aclient, mock_store):
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    response = client.get("/reviews/search/history", params={"limit": 1}, headers=headers)
+    response = await aclient.get("/reviews/search/history", params={"limit": 1}, headers=_HEADERS)
     assert response.status_code == 200
     event = response.json()["events"][0]
     payload = event["payload"]
@@ -225,12 +259,9 @@ def test_search_history_includes_saved_search_descriptor():
     assert payload["saved_search_owner"] == "analyst_1"
     assert payload["saved_search_tags"] == ["wallets", "crypto"]
 
-    app.dependency_overrides = {}
 
-
-def test_search_query_logs_saved_search_descriptor():
-    mock_store = make_mock_store()
-    mock_service = MagicMock()
+async def test_search_query_logs_saved_search_descriptor(aclient, mock_store):
+    mock_service = MagicMock(spec=HybridSearchService)
     mock_service.search.return_value = {
         "results": [],
         "count": 0,
@@ -239,10 +270,8 @@ def test_search_query_logs_saved_search_descriptor():
         "structured_hits": 0,
         "diagnostics": {"counts": {}},
     }
-    app.dependency_overrides[get_store] = lambda: mock_store
-    app.dependency_overrides[get_hybrid_search_service] = lambda: mock_service
+    _override_deps(store=mock_store, hybrid_search_service=mock_service)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
     payload = {
         "text": "wallet",
         "saved_search_id": "saved:abc",
@@ -251,7 +280,7 @@ def test_search_query_logs_saved_search_descriptor():
         "saved_search_tags": ["wallets", "crypto "],
     }
 
-    response = client.post("/reviews/search/query", json=payload, headers=headers)
+    response = await aclient.post("/reviews/search/query", json=payload, headers=_HEADERS)
     assert response.status_code == 200
 
     assert mock_store.log_action.called
@@ -267,21 +296,17 @@ def test_search_query_logs_saved_search_descriptor():
     assert logged_payload["saved_search_name"] == "High-risk wallets"
     assert logged_payload["saved_search_owner"] == "analyst_1"
 
-    app.dependency_overrides = {}
-
 
-def test_saved_search_crud():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
+async def test_saved_search_crud(aclient, mock_store):
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
     payload = {
         "name": "Wallet scam",
         "params": {"text": "wallet", "classification": "crypto"},
         "tags": ["wallet", "urgent"],
     }
     mock_store.upsert_saved_search.return_value = "saved:123"
-    r = client.post("/reviews/search/saved", json=payload, headers=headers)
+    r = await aclient.post("/reviews/search/saved", json=payload, headers=_HEADERS)
     assert r.status_code == 200
     assert mock_store.upsert_saved_search.call_count == 1
     saved_params = mock_store.upsert_saved_search.call_args.args[1]
@@ -306,10 +331,10 @@ def test_saved_search_crud():
             "owner": "analyst_1",
         }
     ]
-    r2 = client.get(
+    r2 = await aclient.get(
         "/reviews/search/saved",
         params={"limit": 10, "owner_only": True},
-        headers=headers,
+        headers=_HEADERS,
     )
     assert r2.status_code == 200
     body = r2.json()
@@ -318,32 +343,28 @@ def test_saved_search_crud():
 
     mock_store.update_saved_search.return_value = True
     patch_payload = {"name": "Wallet scam v2", "favorite": True}
-    r_patch = client.patch("/reviews/search/saved/saved:123", json=patch_payload, headers=headers)
+    r_patch = await aclient.patch("/reviews/search/saved/saved:123", json=patch_payload, headers=_HEADERS)
     assert r_patch.status_code == 200
     mock_store.update_saved_search.assert_called_once_with(
         "saved:123", name="Wallet scam v2", params=None, favorite=True, tags=None
     )
 
     mock_store.delete_saved_search.return_value = True
-    r3 = client.delete("/reviews/search/saved/saved:123", headers=headers)
+    r3 = await aclient.delete("/reviews/search/saved/saved:123", headers=_HEADERS)
     assert r3.status_code == 200
     mock_store.delete_saved_search.assert_called_once_with("saved:123")
 
-    app.dependency_overrides = {}
 
+async def test_saved_search_patch_normalizes_params(aclient, mock_store):
+    _override_deps(store=mock_store)
 
-def test_saved_search_patch_normalizes_params():
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
     mock_store.update_saved_search.return_value = True
     patch_payload = {
         "params": {"text": "wallet", "datasets": ["retrieval_poc_dev"]},
         "favorite": True,
     }
 
-    r = client.patch("/reviews/search/saved/saved:999", json=patch_payload, headers=headers)
+    r = await aclient.patch("/reviews/search/saved/saved:999", json=patch_payload, headers=_HEADERS)
     assert r.status_code == 200
     mock_store.update_saved_search.assert_called_once()
     _, kwargs = mock_store.update_saved_search.call_args
@@ -356,25 +377,57 @@ def test_saved_search_patch_normalizes_params():
     assert normalized_params["page_size"] == normalized_params["limit"]
     assert normalized_params["vector_limit"] == normalized_params["limit"]
 
-    app.dependency_overrides = {}
-
-
-def test_saved_search_duplicate_handling_returns_409():
-    mock_store = make_mock_store()
-    mock_store.upsert_saved_search.side_effect = ValueError("duplicate_saved_search:analyst_1")
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    payload = {"name": "Wallet scam", "params": {}}
-    r = client.post("/reviews/search/saved", json=payload, headers=headers)
-    assert r.status_code == 409
-    assert r.json()["detail"] == "Saved search name already exists (owner=analyst_1)"
 
-    app.dependency_overrides = {}
-
-
-def test_list_saved_searches_normalizes_params():
-    mock_store = make_mock_store()
+@pytest.mark.parametrize(
+    ("store_method", "error", "path", "payload", "expected_status", "expected_detail"),
+    [
+        (
+            "upsert_saved_search",
+            "duplicate_saved_search:analyst_1",
+            "/reviews/search/saved",
+            {"name": "Wallet scam", "params": {}},
+            409,
+            "Saved search name already exists (owner=analyst_1)",
+        ),
+        (
+            "clone_saved_search",
+            "duplicate_saved_search:",
+            "/reviews/search/saved/saved:123/share",
+            None,
+            409,
+            "Shared search name already exists (owner=shared)",
+        ),
+        (
+            "clone_saved_search",
+            "saved_search_not_found",
+            "/reviews/search/saved/missing/share",
+            None,
+            404,
+            "Saved search not found",
+        ),
+        (
+            "import_saved_search",
+            "duplicate_saved_search:",
+            "/reviews/search/saved/import",
+            {"name": "Wallet", "params": {"text": "wallet"}},
+            409,
+            "Saved search name already exists (owner=shared)",
+        ),
+    ],
+    ids=["save-duplicate", "share-duplicate", "share-missing", "import-duplicate"],
+)
+async def test_saved_search_store_errors_map_to_http_status(
+    aclient, mock_store, store_method, error, path, payload, expected_status, expected_detail
+):
+    getattr(mock_store, store_method).side_effect = ValueError(error)
+    _override_deps(store=mock_store)
+
+    r = await aclient.post(path, json=payload, headers=_HEADERS)
+    assert r.status_code == expected_status
+    assert r.json()["detail"] == expected_detail
+
+
+async def test_list_saved_searches_normalizes_params(aclient, mock_store):
     legacy_params = {"classification": "romance", "page_size": 10}
     mock_store.list_saved_searches.return_value = [
         {
@@ -384,10 +437,9 @@ def test_list_saved_searches_normalizes_params():
             "owner": "analyst_1",
         }
     ]
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    response = client.get("/reviews/search/saved", headers=headers)
+    response = await aclient.get("/reviews/search/saved", headers=_HEADERS)
     assert response.status_code == 200
     payload = response.json()
     saved_params = payload["items"][0]["params"]
@@ -397,61 +449,27 @@ def test_list_saved_searches_normalizes_params():
     assert saved_params["page_size"] == 10
     assert saved_params["schema_version"] == "hybrid-v1"
 
-    app.dependency_overrides = {}
 
-
-def test_share_saved_search_endpoint():
-    mock_store = make_mock_store()
+async def test_share_saved_search_endpoint(aclient, mock_store):
     mock_store.clone_saved_search.return_value = "saved:shared"
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.post("/reviews/search/saved/saved:123/share", headers=headers)
+    r = await aclient.post("/reviews/search/saved/saved:123/share", headers=_HEADERS)
     assert r.status_code == 200
     assert r.json()["search_id"] == "saved:shared"
     mock_store.clone_saved_search.assert_called_once_with("saved:123", target_owner=None)
 
-    app.dependency_overrides = {}
-
-
-def test_share_saved_search_duplicate_returns_409():
-    mock_store = make_mock_store()
-    mock_store.clone_saved_search.side_effect = ValueError("duplicate_saved_search:")
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.post("/reviews/search/saved/saved:123/share", headers=headers)
-    assert r.status_code == 409
-    assert r.json()["detail"] == "Shared search name already exists (owner=shared)"
-
-    app.dependency_overrides = {}
-
 
-def test_share_saved_search_not_found_returns_404():
-    mock_store = make_mock_store()
-    mock_store.clone_saved_search.side_effect = ValueError("saved_search_not_found")
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.post("/reviews/search/saved/missing/share", headers=headers)
-    assert r.status_code == 404
-    assert r.json()["detail"] == "Saved search not found"
-
-    app.dependency_overrides = {}
-
-
-def test_tag_presets_endpoint():
-    mock_store = make_mock_store()
+async def test_tag_presets_endpoint(aclient, mock_store):
     mock_store.list_tag_presets.return_value = [
         {"search_id": "saved:123", "owner": "analyst_1", "tags": ["wallet", "urgent"]}
     ]
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.get(
+    r = await aclient.get(
         "/reviews/search/tag-presets",
         params={"limit": 10, "owner_only": True},
-        headers=headers,
+        headers=_HEADERS,
     )
     assert r.status_code == 200
     body = r.json()
@@ -459,30 +477,18 @@ def test_tag_presets_endpoint():
     assert body["presets"][0]["tags"] == ["wallet", "urgent"]
     mock_store.list_tag_presets.assert_called_once_with(owner="analyst_1", limit=10)
 
-    app.dependency_overrides = {}
 
-
-def test_bulk_update_tags_endpoint():
-    mock_store = make_mock_store()
+async def test_bulk_update_tags_endpoint(aclient, mock_store):
     mock_store.bulk_update_tags.return_value = 2
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    payload = {
-        "search_ids": ["saved:1", "saved:2"],
-        "add": ["wallet"],
-        "remove": ["old"],
-    }
-    r = client.post("/reviews/search/saved/bulk-tags", json=payload, headers=headers)
+    r = await aclient.post("/reviews/search/saved/bulk-tags", content=_BULK_TAGS_BODY, headers=_JSON_HEADERS)
     assert r.status_code == 200
     assert r.json()["updated"] == 2
     mock_store.bulk_update_tags.assert_called_once()
 
-    app.dependency_overrides = {}
-
 
-def test_export_saved_search_endpoint():
-    mock_store = make_mock_store()
+async def test_export_saved_search_endpoint(aclient, mock_store):
     mock_store.get_saved_search.return_value = {
         "search_id": "saved:123",
         "name": "Wallet",
@@ -490,66 +496,39 @@ def test_export_saved_search_endpoint():
         "favorite": True,
         "owner": "analyst_1",
     }
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    r = client.get("/reviews/search/saved/saved:123/export", headers=headers)
+    r = await aclient.get("/reviews/search/saved/saved:123/export", headers=_HEADERS)
     assert r.status_code == 200
     payload = r.json()
     assert payload["favorite"] is True
     mock_store.get_saved_search.assert_called_once_with("saved:123")
 
-    app.dependency_overrides = {}
 
-
-def test_import_saved_search_endpoint_handles_duplicates():
-    mock_store = make_mock_store()
-    mock_store.import_saved_search.side_effect = ValueError("duplicate_saved_search:")
-    app.dependency_overrides[get_store] = lambda: mock_store
-
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    payload = {"name": "Wallet", "params": {"text": "wallet"}}
-    r = client.post("/reviews/search/saved/import", json=payload, headers=headers)
-    assert r.status_code == 409
-    assert "Saved search name already exists" in r.json()["detail"]
-
-    app.dependency_overrides = {}
-
-
-def test_import_saved_search_injects_schema_version():
-    mock_store = make_mock_store()
+async def test_import_saved_search_injects_schema_version(aclient, mock_store):
     mock_store.import_saved_search.return_value = "saved:new"
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
-    payload = {"name": "Wallet", "params": {"text": "wallet"}, "favorite": True}
-    r = client.post("/reviews/search/saved/import", json=payload, headers=headers)
+    r = await aclient.post("/reviews/search/saved/import", content=_IMPORT_BODY, headers=_JSON_HEADERS)
     assert r.status_code == 200
     args, kwargs = mock_store.import_saved_search.call_args
     record = args[0]
     assert record["params"]["schema_version"] == "hybrid-v1"
     assert kwargs["owner"] == "analyst_1"
 
-    app.dependency_overrides = {}
-
 
 @patch("i4g.api.review.generate_report_for_case")
-def test_decision_triggers_background_report(mock_generate_report):
+async def test_decision_triggers_background_report(mock_generate_report, aclient, mock_store):
     """Ensure that when an analyst accepts a case with auto_generate_report=True,
     the API schedules the generate_report_for_case background task.
     """
-    mock_store = make_mock_store()
-    app.dependency_overrides[get_store] = lambda: mock_store
+    _override_deps(store=mock_store)
 
-    headers = {"X-API-KEY": "dev-analyst-token"}
     # include the auto_generate_report flag in the request
-    dec = {"decision": "accepted", "notes": "Auto report", "auto_generate_report": True}
-    r = client.post("/reviews/rev-1/decision", json=dec, headers=headers)
+    r = await aclient.post("/reviews/rev-1/decision", content=_AUTO_REPORT_DECISION_BODY, headers=_JSON_HEADERS)
     assert r.status_code == 200
     assert r.json()["status"] == "accepted"
 
-    # BackgroundTasks runs synchronously in TestClient, so the patched function should have been called
+    # The ASGI transport awaits the whole app call, background tasks included, so the patch has been called
     assert mock_generate_report.called
     mock_generate_report.assert_called_with("rev-1", mock_store)
-
-    app.dependency_overrides = {}
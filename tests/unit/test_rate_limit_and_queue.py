@@ -5,16 +5,14 @@ from unittest.mock import patch
 import pytest
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
-from fastapi.testclient import TestClient
 
-from i4g.api.app import REQUEST_LOG, app, rate_limit_middleware
-
-client = TestClient(app)
+from i4g.api.app import REQUEST_LOG, rate_limit_middleware
 
 
 @pytest.fixture(autouse=True)
-def clear_request_log():
-    """A fixture to automatically clear the request log before each test."""
+def clear_request_log(monkeypatch):
+    """Clear the request log and re-enable the limiter, which the shared API test app switches off."""
+    monkeypatch.setattr("i4g.api.app.MAX_REQUESTS_PER_MINUTE", 10)
     REQUEST_LOG.clear()
 
 
@@ -57,7 +55,7 @@ async def test_rate_limiting_direct_call():
         await rate_limit_middleware(request, mock_call_next)
 
 
-def test_report_generation_lock():
+def test_report_generation_lock(client):
     """Test the report generation lock behavior."""
     from i4g.api.app import report_lock
 
@@ -6,31 +6,33 @@ isolation and reproducibility. They verify queue management and
 action logging behaviors.
 """
 
-import sqlite3
 from datetime import datetime, timezone
 
+import pytest
+
 from i4g.store.review_store import ReviewStore
 from i4g.store.schema import ScamRecord
 from i4g.store.structured import StructuredStore
 
 
-def test_table_initialization(tmp_path):
+@pytest.fixture
+def store() -> ReviewStore:
+    """Return a private in-memory store; nothing touches disk."""
+
+    return ReviewStore(":memory:")
+
+
+def test_table_initialization(store):
     """Verify tables are created properly on initialization."""
-    db_path = tmp_path / "test_review_store.db"
-    store = ReviewStore(str(db_path))
 
-    with sqlite3.connect(db_path) as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {t[0] for t in cur.fetchall()}
+    cur = store._connect().execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = {t[0] for t in cur.fetchall()}
 
     assert {"review_queue", "review_actions"}.issubset(tables)
 
 
-def test_enqueue_and_retrieve_case(tmp_path):
+def test_enqueue_and_retrieve_case(store):
     """Test inserting a case and retrieving it from the queue."""
-    db_path = tmp_path / "review_test.db"
-    store = ReviewStore(str(db_path))
 
     review_id = store.enqueue_case("CASE123", priority="high")
     assert isinstance(review_id, str)
@@ -45,10 +47,8 @@ def test_enqueue_and_retrieve_case(tmp_path):
     assert retrieved["review_id"] == review_id
 
 
-def test_update_status_and_notes(tmp_path):
+def test_update_status_and_notes(store):
     """Test updating review status and notes."""
-    db_path = tmp_path / "update_test.db"
-    store = ReviewStore(str(db_path))
 
     review_id = store.enqueue_case("CASE999")
     store.update_status(review_id, status="in_review", notes="Initial check")
@@ -58,10 +58,8 @@ def test_update_status_and_notes(tmp_path):
     assert "Initial check" in updated["notes"]
 
 
-def test_action_logging_and_retrieval(tmp_path):
+def test_action_logging_and_retrieval(store):
     """Test logging actions and retrieving them."""
-    db_path = tmp_path / "actions_test.db"
-    store = ReviewStore(str(db_path))
 
     review_id = store.enqueue_case("CASE_ACTION")
     action_id = store.log_action(
@@ -79,10 +77,8 @@ def test_action_logging_and_retrieval(tmp_path):
     assert "Claimed for review" in actions[0]["payload"]
 
 
-def test_queue_and_actions_integration(tmp_path):
+def test_queue_and_actions_integration(store):
     """Ensure actions correspond to existing queue entries."""
-    db_path = tmp_path / "integration_test.db"
-    store = ReviewStore(str(db_path))
 
     review_id = store.enqueue_case("CASE_INTEGRATION")
     store.log_action(review_id, actor="analyst_2", action="accepted")
@@ -95,9 +91,7 @@ def test_queue_and_actions_integration(tmp_path):
     assert actions[0]["review_id"] == review_id
 
 
-def test_upsert_queue_entry_sets_custom_timestamps(tmp_path):
-    db_path = tmp_path / "pilot_queue.db"
-    store = ReviewStore(str(db_path))
+def test_upsert_queue_entry_sets_custom_timestamps(store):
     accepted_at = datetime(2025, 12, 1, 8, 30, tzinfo=timezone.utc)
 
     review_id = store.upsert_queue_entry(
@@ -132,10 +126,8 @@ def test_upsert_queue_entry_sets_custom_timestamps(tmp_path):
     assert refreshed["last_updated"].startswith("2025-12-01T10:45:00")
 
 
-def test_bulk_update_tags_add_remove(tmp_path):
+def test_bulk_update_tags_add_remove(store):
     """Bulk add/remove tags across multiple saved searches."""
-    db_path = tmp_path / "bulk_tags.db"
-    store = ReviewStore(str(db_path))
 
     sid_a = store.upsert_saved_search(
         name="Wallet urgent",
@@ -159,10 +151,8 @@ def test_bulk_update_tags_add_remove(tmp_path):
     assert record_b["tags"] == ["review"]
 
 
-def test_bulk_update_tags_replace(tmp_path):
+def test_bulk_update_tags_replace(store):
     """Replacing tags should ignore add/remove lists."""
-    db_path = tmp_path / "bulk_tags_replace.db"
-    store = ReviewStore(str(db_path))
 
     sid = store.upsert_saved_search(
         name="Mixed tags",
@@ -178,31 +168,51 @@ def test_bulk_update_tags_replace(tmp_path):
     assert record["tags"] == ["primary"]
 
 
-def test_list_dossier_candidates_returns_metrics(tmp_path):
+@pytest.fixture
+def dossier_stores(tmp_path):
+    """Return a ReviewStore and StructuredStore seeded with one accepted, cross-border case."""
+
+    # The metrics view joins StructuredStore's cases table, so both stores need the same database file.
     db_path = tmp_path / "dossier_metrics.db"
     store = ReviewStore(str(db_path))
     structured = StructuredStore(db_path=db_path)
-    record = ScamRecord(
-        case_id="case-view",
-        text="",
-        entities={},
-        classification="investment",
-        confidence=0.9,
-        metadata={
-            "loss_amount_usd": 150000,
-            "jurisdiction": "US-CA",
-            "victim_country": "US",
-            "scammer_country": "RU",
-        },
-        created_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+    structured.upsert_record(
+        ScamRecord(
+            case_id="case-view",
+            text="",
+            entities={},
+            classification="investment",
+            confidence=0.9,
+            metadata={
+                "loss_amount_usd": 150000,
+                "jurisdiction": "US-CA",
+                "victim_country": "US",
+                "scammer_country": "RU",
+            },
+            created_at=datetime(2025, 12, 1, tzinfo=timezone.utc),
+        )
     )
-    structured.upsert_record(record)
-
     review_id = store.enqueue_case("case-view")
     store.update_status(review_id, status="accepted")
+    yield store, structured
+    structured.close()
+
+
+def test_list_dossier_candidates_returns_metrics(dossier_stores):
+    store, _ = dossier_stores
 
     rows = store.list_dossier_candidates()
-    structured.close()
+    filtered_out = store.list_dossier_candidates(min_loss_usd=200000)
+    other_jurisdiction = store.list_dossier_candidates(jurisdiction="US-NY")
+    future = store.list_dossier_candidates(since=datetime(2999, 1, 1, tzinfo=timezone.utc))
+    matching = store.list_dossier_candidates(
+        min_loss_usd=100000,
+        since=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        jurisdiction="US-CA",
+    )
+
+    assert filtered_out == [] and other_jurisdiction == [] and future == []
+    assert [row["case_id"] for row in matching] == ["case-view"]
 
     assert len(rows) == 1
     entry = rows[0]
@@ -210,3 +220,15 @@ def test_list_dossier_candidates_returns_metrics(tmp_path):
     assert entry["loss_band"] == "100k-250k"
     assert entry["geo_bucket"] == "US"
     assert entry["cross_border"] == 1
+
+
+def test_get_cases_chunks_large_id_lists(store, monkeypatch):
+    monkeypatch.setattr("i4g.store.review_store._IN_CLAUSE_CHUNK", 2)
+    for case_id in ("case-a", "case-b", "case-c"):
+        store.enqueue_case(case_id)
+
+    cases = store.get_cases(["case-c", "case-a", "missing", "case-b", "case-a"])
+
+    assert sorted(cases) == ["case-a", "case-b", "case-c"]
+    indexes = {row[1] for row in store._connect().execute("PRAGMA index_list('review_queue')")}
+    assert "idx_review_queue_case_id" in indexes
@@ -138,3 +138,22 @@ def test_delete_by_id(temp_store, record_sample):
 def test_get_by_id_nonexistent(temp_store):
     """Fetching a missing record returns None."""
     assert temp_store.get_by_id("no-such-case") is None
+
+
+def test_get_by_ids_batches_lookups(temp_store, record_sample, monkeypatch):
+    """Batched lookups return existing records keyed by case_id across chunks."""
+    monkeypatch.setattr("i4g.store.structured._IN_CLAUSE_CHUNK", 1)
+    temp_store.upsert_record(record_sample)
+    temp_store.upsert_record(
+        ScamRecord(
+            case_id="case-002",
+            text="Dear John, send BTC to 1FzWL...",
+            entities={},
+            classification="romance_scam",
+            confidence=0.91,
+        )
+    )
+    results = temp_store.get_by_ids(["case-002", "no-such-case", "case-001", "case-002"])
+    assert sorted(results) == ["case-001", "case-002"]
+    assert results["case-002"].classification == "romance_scam"
+    assert temp_store.get_by_ids([]) == {}
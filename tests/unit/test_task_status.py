@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Dict, List, Tuple
 
 from i4g.task_status import TaskStatusReporter
@@ -33,3 +34,28 @@ def test_reporter_noops_without_task_id() -> None:
     reporter.update(status="in_progress", message="Processing")
 
     assert invoked == []
+
+
+def test_reporter_posts_in_background_via_shared_session(monkeypatch) -> None:
+    from i4g import task_status
+
+    calls: List[Tuple[str, Dict[str, object]]] = []
+
+    class _Response:
+        def raise_for_status(self) -> None:
+            return None
+
+    def _post(url: str, *, data: bytes, headers: Dict[str, str], timeout: int) -> _Response:
+        assert headers["Content-Type"] == "application/json"
+        calls.append((url, json.loads(data)))
+        return _Response()
+
+    monkeypatch.setattr(task_status._SESSION, "post", _post)
+    reporter = TaskStatusReporter(task_id="task-9", endpoint="http://status.local/tasks/")
+
+    reporter.update(status="done", message="Finished")
+    reporter.update(status="done", message="Again")
+    task_status.flush_updates()
+
+    assert [url for url, _ in calls] == ["http://status.local/tasks/task-9/update"] * 2
+    assert calls[0][1] == {"status": "done", "message": "Finished"}
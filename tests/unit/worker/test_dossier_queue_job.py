@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import pytest
 
 from i4g.reports.dossier_queue_processor import QueueProcessSummary
 from i4g.worker.jobs import dossier_queue
 
 
-@dataclass
 class _StubProcessor:
-    processed: int
-    completed: int
-    failed: int
+    __slots__ = ("processed", "completed", "failed")
 
-    def process_batch(self, *, batch_size: int, dry_run: bool):  # noqa: D401 - stub helper
+    def __init__(self, *, processed: int, completed: int, failed: int) -> None:
+        self.processed = processed
+        self.completed = completed
+        self.failed = failed
+
+    def process_batch(self, *, batch_size: int, dry_run: bool, reporter=None, on_plan=None):  # noqa: D401 - stub helper
         assert batch_size == self.processed
         summary = QueueProcessSummary(
             processed=self.processed,
@@ -35,30 +37,25 @@ def test_run_job_delegates_to_processor() -> None:
     assert summary.failed == 0
 
 
-def test_main_returns_error_code_when_failures(monkeypatch) -> None:
-    stub = _StubProcessor(processed=1, completed=0, failed=1)
+@pytest.mark.parametrize(
+    ("dry_run", "failed", "expected_exit"),
+    [("false", 1, 1), ("true", 0, 0)],
+    ids=["failures", "success"],
+)
+def test_main_exit_code(monkeypatch, dry_run: str, failed: int, expected_exit: int) -> None:
+    stub = _StubProcessor(processed=1, completed=1 - failed, failed=failed)
 
     monkeypatch.setenv("I4G_DOSSIER__BATCH_SIZE", "1")
-    monkeypatch.setenv("I4G_DOSSIER__DRY_RUN", "false")
+    monkeypatch.setenv("I4G_DOSSIER__DRY_RUN", dry_run)
     monkeypatch.setenv("I4G_RUNTIME__LOG_LEVEL", "CRITICAL")
     monkeypatch.setattr(
-        dossier_queue, "run_job", lambda batch_size, dry_run: stub.process_batch(batch_size=batch_size, dry_run=dry_run)
-    )
-
-    exit_code = dossier_queue.main()
-
-    assert exit_code == 1
-
-
-def test_main_success(monkeypatch) -> None:
-    stub = _StubProcessor(processed=1, completed=1, failed=0)
-
-    monkeypatch.setenv("I4G_DOSSIER__BATCH_SIZE", "1")
-    monkeypatch.setenv("I4G_DOSSIER__DRY_RUN", "true")
-    monkeypatch.setattr(
-        dossier_queue, "run_job", lambda batch_size, dry_run: stub.process_batch(batch_size=batch_size, dry_run=dry_run)
+        dossier_queue,
+        "run_job",
+        lambda batch_size, dry_run, reporter=None, on_plan=None: stub.process_batch(
+            batch_size=batch_size, dry_run=dry_run
+        ),
     )
 
     exit_code = dossier_queue.main()
 
-    assert exit_code == 0
+    assert exit_code == expected_exit